@@ -1,6 +1,12 @@
 import os
 import _io
+import json
 import xml.etree.ElementTree as ET
+from typing import Union
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def ensurePathIsExist(path: str):
@@ -51,4 +57,17 @@ def writeElementToFile(elem: ET.Element, path_dest: str = '', fp: _io.TextIOWrap
         else:
             _fp.write('/>\n')
     if level == 0:
-        _fp.close()
\ No newline at end of file
+        _fp.close()
+
+
+def decodeJson(content: Union[bytes, str]):
+    # orjson이 설치되어 있으면 사용 (표준 json 모듈보다 수 배 빠름)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def encodeJson(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
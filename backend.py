@@ -0,0 +1,92 @@
+# Author: Yogyui
+import pandas as pd
+from enum import Enum
+from typing import List, Union
+
+
+class ResultBackend(Enum):
+    Pandas = 'pandas'  # pandas DataFrame (기본값)
+    Arrow = 'pyarrow'  # pyarrow Table
+    Polars = 'polars'  # polars DataFrame
+
+
+def checkResultBackend(backend: ResultBackend):
+    try:
+        if backend == ResultBackend.Arrow:
+            import pyarrow  # noqa: F401
+        elif backend == ResultBackend.Polars:
+            import pyarrow  # noqa: F401
+            import polars  # noqa: F401
+    except ImportError as e:
+        raise ImportError(f"{e.name} is required for '{backend.value}' result backend (pip install {e.name})")
+
+
+def _toArrowArray(values: Union[list, pd.api.extensions.ExtensionArray]):
+    import pyarrow as pa
+    if isinstance(values, list) and all([x is None or isinstance(x, str) for x in values]):
+        return pa.array(values, type=pa.string())
+    return pa.array(values, from_pandas=True)
+
+
+def makeTableFromColumns(columns: dict, backend: ResultBackend):
+    """
+    열 이름 -> 값 배열(list 또는 pandas extension array) dict로부터 결과 객체 생성
+    (pyarrow/polars는 pandas DataFrame을 거치지 않는다)
+    """
+    if backend == ResultBackend.Pandas:
+        return pd.DataFrame(columns)
+    import pyarrow as pa
+    table = pa.table({str(k): _toArrowArray(v) for k, v in columns.items()})
+    if backend == ResultBackend.Polars:
+        import polars as pl
+        return pl.from_arrow(table)
+    return table
+
+
+def makeEmptyTable(column_names: List[str], backend: ResultBackend):
+    import pyarrow as pa
+    table = pa.table({str(x): pa.array([], type=pa.string()) for x in column_names})
+    if backend == ResultBackend.Polars:
+        import polars as pl
+        return pl.from_arrow(table)
+    return table
+
+
+def convertResult(result, backend: ResultBackend):
+    """
+    pandas DataFrame 결과(dict/tuple/list 안의 DataFrame 포함)를 지정한 backend 객체로 변환
+    (이미 변환된 객체는 그대로 반환, 이름이 있는 index는 열로 변환)
+    """
+    if backend == ResultBackend.Pandas:
+        return result
+    if isinstance(result, dict):
+        return {k: convertResult(v, backend) for k, v in result.items()}
+    if isinstance(result, tuple):
+        return tuple([convertResult(x, backend) for x in result])
+    if isinstance(result, list):
+        return [convertResult(x, backend) for x in result]
+    if not isinstance(result, pd.DataFrame):
+        return result
+    import pyarrow as pa
+    df = result
+    if any([x is not None for x in df.index.names]):
+        df = df.reset_index()
+    df = df.rename(columns=str)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if backend == ResultBackend.Polars:
+        import polars as pl
+        return pl.from_arrow(table)
+    return table
+
+
+def toPandas(obj) -> pd.DataFrame:
+    """
+    pyarrow Table, polars DataFrame을 pandas DataFrame으로 변환 (pandas DataFrame은 그대로 반환)
+    """
+    if obj is None or isinstance(obj, pd.DataFrame):
+        return obj
+    if hasattr(obj, 'to_arrow'):  # polars
+        obj = obj.to_arrow()
+    if hasattr(obj, 'to_pandas'):  # pyarrow
+        return obj.to_pandas()
+    raise TypeError(f"unsupported table type: {type(obj)}")
@@ -0,0 +1,371 @@
+# Author: Yogyui
+import os
+import time
+import zlib
+import atexit
+import pickle
+import shutil
+import sqlite3
+import threading
+import urllib.parse
+from enum import Enum
+from typing import List, Union
+from collections import OrderedDict
+from Util import decodeJson, encodeJson
+
+
+class CacheEntryType(Enum):
+    RawDocument = 'raw'
+    HtmlDocument = 'html'
+    FinancialStatements = 'xbrl'
+
+
+class EvictionPolicy(Enum):
+    LRU = 'lru'
+    LFU = 'lfu'
+
+
+class CacheEntry:
+    key: str
+    entryType: CacheEntryType
+    paths: List[str]
+    size: int
+    last_access: float
+    hits: int
+
+    def __init__(self, key: str, entryType: CacheEntryType, paths: List[str], size: int):
+        self.key = key
+        self.entryType = entryType
+        self.paths = paths
+        self.size = size
+        self.last_access = time.time()
+        self.hits = 1
+
+
+class DocumentCacheManager:
+    """
+    Data 디렉터리에 저장되는 공시서류 원본(xml), 렌더링된 html, XBRL 재무제표 디렉터리의 디스크 사용량 관리
+    디렉터리를 매번 탐색하지 않고 인덱스 파일(CacheIndex.pkl)에 접근 기록을 유지하며,
+    전체 용량이 max_bytes를 넘으면 LRU(최근 미사용) 또는 LFU(최소 사용) 순서로 항목을 삭제한다
+    (사용 중으로 표시(pin)된 항목은 삭제하지 않으며, 접근 기록은 save_interval 초마다 및 종료 시 저장한다)
+    """
+    save_interval = 60.
+    save_touch_count = 100
+
+    def __init__(self, path_data_dir: str, max_bytes: int, policy: Union[EvictionPolicy, str] = EvictionPolicy.LRU):
+        self._path_data_dir = path_data_dir
+        self._path_index_file = os.path.join(path_data_dir, 'CacheIndex.pkl')
+        self._max_bytes = max_bytes
+        self._policy = EvictionPolicy(policy)
+        self._entries: OrderedDict = OrderedDict()  # key: (entry type value, key), LRU 순서 유지
+        self._total_bytes: int = 0
+        self._dirty_count: int = 0
+        self._last_save: float = time.monotonic()
+        self._pinned = dict()  # key: (entry type value, key), value: 사용 중인 횟수
+        self._lock = threading.RLock()
+        if not self._loadIndex():
+            self._buildIndexFromDataPath()
+        atexit.register(self.close)
+
+    @property
+    def maxBytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def totalBytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def policy(self) -> EvictionPolicy:
+        return self._policy
+
+    def setMaxBytes(self, max_bytes: int) -> List[str]:
+        with self._lock:
+            self._max_bytes = max_bytes
+            return self.evict()
+
+    def setPolicy(self, policy: Union[EvictionPolicy, str]):
+        self._policy = EvictionPolicy(policy)
+
+    def _loadIndex(self) -> bool:
+        if not os.path.isfile(self._path_index_file):
+            return False
+        try:
+            with open(self._path_index_file, 'rb') as fp:
+                self._entries = pickle.load(fp)
+            self._total_bytes = sum([x.size for x in self._entries.values()])
+            return True
+        except Exception:
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+            return False
+
+    def saveIndex(self):
+        with self._lock:
+            with open(self._path_index_file, 'wb') as fp:
+                pickle.dump(self._entries, fp)
+            self._dirty_count = 0
+            self._last_save = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            if self._dirty_count > 0:
+                self.saveIndex()
+
+    def _buildIndexFromDataPath(self):
+        # 인덱스 파일이 없을 때(최초 실행) 한 번만 디렉터리를 탐색해 기존 파일들을 등록
+        for name in os.listdir(self._path_data_dir):
+            path = os.path.join(self._path_data_dir, name)
+            stem, ext = os.path.splitext(name)
+            if os.path.isfile(path) and ext == '.xml' and stem.isdigit():
+                self._addEntry(stem, CacheEntryType.RawDocument, [name])
+            elif os.path.isfile(path) and ext == '.html':
+                self._addEntry(stem, CacheEntryType.HtmlDocument, [name])
+            elif os.path.isdir(path) and name.startswith('fs_'):
+                self._addEntry(name, CacheEntryType.FinancialStatements, [name])
+        self.saveIndex()
+
+    def _measure(self, paths: List[str]) -> int:
+        size = 0
+        for name in paths:
+            path = os.path.join(self._path_data_dir, name)
+            if os.path.isfile(path):
+                size += os.path.getsize(path)
+            elif os.path.isdir(path):
+                for dirpath, _, filenames in os.walk(path):
+                    size += sum([os.path.getsize(os.path.join(dirpath, x)) for x in filenames])
+        return size
+
+    def _addEntry(self, key: str, entryType: CacheEntryType, paths: List[str]) -> CacheEntry:
+        entry_key = (entryType.value, key)
+        prev = self._entries.pop(entry_key, None)
+        if prev is not None:
+            self._total_bytes -= prev.size
+            paths = sorted(set(prev.paths + paths))
+        entry = CacheEntry(key, entryType, paths, self._measure(paths))
+        if prev is not None:
+            entry.hits = prev.hits + 1
+        self._entries[entry_key] = entry
+        self._total_bytes += entry.size
+        return entry
+
+    def register(self, key: str, entryType: CacheEntryType, paths: List[str] = None) -> List[str]:
+        """
+        새로 저장된 파일(디렉터리)을 인덱스에 등록하고 용량 초과분을 삭제한다
+
+        :param key: 접수번호 혹은 XBRL 디렉터리명
+        :param entryType: 항목 종류
+        :param paths: Data 디렉터리 기준 상대 경로 목록 (기본값 = key에 해당하는 기본 파일명)
+        :return: 삭제된 항목의 key 리스트
+        """
+        if paths is None:
+            paths = [self._defaultPath(key, entryType)]
+        with self._lock:
+            self._addEntry(key, entryType, paths)
+            evicted = self.evict(protect=(entryType.value, key))
+            self.saveIndex()
+        return evicted
+
+    def touch(self, key: str, entryType: CacheEntryType) -> bool:
+        """
+        인덱스에 접근 기록만 갱신 (파일시스템 접근 없음)
+
+        :return: 인덱스에 등록된 항목인지 여부
+        """
+        entry_key = (entryType.value, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return False
+            entry.last_access = time.time()
+            entry.hits += 1
+            self._entries.move_to_end(entry_key)
+            self._dirty_count += 1
+            if self._dirty_count >= self.save_touch_count or time.monotonic() - self._last_save >= self.save_interval:
+                self.saveIndex()
+        return True
+
+    def pin(self, key: str, entryType: CacheEntryType):
+        """
+        사용 중인 항목으로 표시 (unpin 전까지 용량 초과 시에도 삭제하지 않음, 아직 등록되지 않은 항목도 가능)
+        """
+        entry_key = (entryType.value, key)
+        with self._lock:
+            self._pinned[entry_key] = self._pinned.get(entry_key, 0) + 1
+
+    def unpin(self, key: str, entryType: CacheEntryType):
+        entry_key = (entryType.value, key)
+        with self._lock:
+            count = self._pinned.get(entry_key, 0) - 1
+            if count > 0:
+                self._pinned[entry_key] = count
+            else:
+                self._pinned.pop(entry_key, None)
+
+    def contains(self, key: str, entryType: CacheEntryType) -> bool:
+        return (entryType.value, key) in self._entries
+
+    def remove(self, key: str, entryType: CacheEntryType, deleteFiles: bool = True):
+        with self._lock:
+            entry = self._entries.pop((entryType.value, key), None)
+            if entry is None:
+                return
+            self._total_bytes -= entry.size
+            if deleteFiles:
+                self._deleteFiles(entry)
+            self.saveIndex()
+
+    def clear(self, entryTypes: List[CacheEntryType] = None) -> int:
+        """
+        인덱스에 등록된 항목 삭제
+
+        :param entryTypes: 삭제할 항목 종류 (기본값 = 전체)
+        :return: 삭제된 항목 수
+        """
+        with self._lock:
+            if entryTypes is None:
+                entryTypes = list(CacheEntryType)
+            targets = [k for k, v in self._entries.items() if v.entryType in entryTypes]
+            for entry_key in targets:
+                entry = self._entries.pop(entry_key)
+                self._total_bytes -= entry.size
+                self._deleteFiles(entry)
+            self.saveIndex()
+        return len(targets)
+
+    def evict(self, protect: tuple = None) -> List[str]:
+        evicted = []
+        with self._lock:
+            while self._total_bytes > self._max_bytes:
+                victim = self._selectVictim(protect)
+                if victim is None:
+                    break
+                entry = self._entries.pop(victim)
+                self._total_bytes -= entry.size
+                self._deleteFiles(entry)
+                evicted.append(entry.key)
+        return evicted
+
+    def _selectVictim(self, protect: tuple = None):
+        candidates = [x for x in self._entries.keys() if x != protect and x not in self._pinned]
+        if len(candidates) == 0:
+            return None
+        if self._policy == EvictionPolicy.LFU:
+            return min(candidates, key=lambda x: (self._entries[x].hits, self._entries[x].last_access))
+        return candidates[0]  # OrderedDict의 앞쪽이 가장 오래 전에 접근한 항목
+
+    def _deleteFiles(self, entry: CacheEntry):
+        for name in entry.paths:
+            path = os.path.join(self._path_data_dir, name)
+            if os.path.isfile(path):
+                os.remove(path)
+            elif os.path.isdir(path):
+                shutil.rmtree(path)
+
+    @staticmethod
+    def _defaultPath(key: str, entryType: CacheEntryType) -> str:
+        if entryType == CacheEntryType.RawDocument:
+            return f'{key}.xml'
+        elif entryType == CacheEntryType.HtmlDocument:
+            return f'{key}.html'
+        return key
+
+
+class ResponseCache:
+    """
+    API 응답(json) 캐시 (sqlite 파일, 항목별 만료 시각)
+    키는 API 경로와 요청 인자(인증키 제외)로 구성한다
+    """
+    def __init__(self, path_db: str):
+        self._path_db = path_db
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path_db, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                api TEXT NOT NULL,
+                corp_code TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL,
+                body BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_api ON responses (api);
+        """)
+        columns = [x[1] for x in self._conn.execute("PRAGMA table_info(responses)").fetchall()]
+        if 'corp_code' not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN corp_code TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_corp ON responses (corp_code)")
+        self._conn.commit()
+
+    @staticmethod
+    def makeKey(api: str, params: dict) -> str:
+        query = urllib.parse.urlencode(sorted([(k, v) for k, v in params.items() if k != 'crtfc_key']))
+        return f'{api}?{query}'
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Union[dict, None]:
+        with self._lock:
+            row = self._conn.execute("SELECT expires_at, body FROM responses WHERE key=?", (key,)).fetchone()
+        if row is None:
+            return None
+        expires_at, body = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return decodeJson(zlib.decompress(body))
+
+    def put(self, key: str, api: str, obj: dict, ttl: Union[float, None], corp_code: str = None):
+        """
+        :param ttl: 유효기간(초), None이면 만료되지 않음 (정정 공시로 무효화되기 전까지 유지)
+        :param corp_code: 요청 대상 회사 고유번호 (여러 회사면 쉼표로 구분), 정정 공시 무효화에 사용
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        body = zlib.compress(encodeJson(obj))
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, api, corp_code, stored_at, expires_at, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", (key, api, corp_code, now, expires_at, body))
+
+    def invalidateCorp(self, corp_code: str, before: float) -> int:
+        """
+        특정 회사의 응답 중 before(timestamp) 이전에 저장된 항목 삭제
+
+        :return: 삭제된 항목 수
+        """
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE stored_at < ? AND "
+                    "(corp_code = ? OR ',' || corp_code || ',' LIKE ?)", (before, corp_code, f'%,{corp_code},%'))
+        return cursor.rowcount
+
+    def remove(self, key: str):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key=?", (key,))
+
+    def clear(self, api: str = None) -> int:
+        with self._lock:
+            with self._conn:
+                if api is None:
+                    cursor = self._conn.execute("DELETE FROM responses")
+                else:
+                    cursor = self._conn.execute("DELETE FROM responses WHERE api=?", (api,))
+        return cursor.rowcount
+
+    def purgeExpired(self) -> int:
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        return cursor.rowcount
+
+    def getCount(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
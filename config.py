@@ -8,6 +8,14 @@ class OpenDartConfiguration:
     path_config: str
     path_local_file: str
     api_key: str
+    cache_max_bytes: int
+    cache_policy: str
+    max_requests_per_minute: int
+    max_workers: int
+    immutable_report_days: int
+    no_data_cache_ttl: int
+    result_backend: str
+    request_timeout: float
 
     def __init__(self):
         curpath = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +24,14 @@ class OpenDartConfiguration:
             os.mkdir(self.path_config)
         self.path_local_file = os.path.join(self.path_config, 'opendartconfig.xml')
         self.api_key = ''
+        self.cache_max_bytes = 2 * 1024 * 1024 * 1024
+        self.cache_policy = 'lru'
+        self.max_requests_per_minute = 600
+        self.max_workers = 8
+        self.immutable_report_days = 365
+        self.no_data_cache_ttl = 24 * 60 * 60
+        self.result_backend = 'pandas'
+        self.request_timeout = 30.
         self.doc_str_replace_list = [
             ('&cr;', '&#13;'),
             ('M&A', 'M&amp;A'),
@@ -43,6 +59,31 @@ class OpenDartConfiguration:
         if self.api_key is None:
             self.api_key = ''
 
+        node = self.findChildNode(root, 'cache_max_bytes')
+        if node is not None and node.text is not None:
+            self.cache_max_bytes = int(node.text)
+        node = self.findChildNode(root, 'cache_policy')
+        if node is not None and node.text is not None:
+            self.cache_policy = node.text
+        node = self.findChildNode(root, 'max_requests_per_minute')
+        if node is not None and node.text is not None:
+            self.max_requests_per_minute = int(node.text)
+        node = self.findChildNode(root, 'max_workers')
+        if node is not None and node.text is not None:
+            self.max_workers = int(node.text)
+        node = self.findChildNode(root, 'immutable_report_days')
+        if node is not None and node.text is not None:
+            self.immutable_report_days = int(node.text)
+        node = self.findChildNode(root, 'no_data_cache_ttl')
+        if node is not None and node.text is not None:
+            self.no_data_cache_ttl = int(node.text)
+        node = self.findChildNode(root, 'result_backend')
+        if node is not None and node.text is not None:
+            self.result_backend = node.text
+        node = self.findChildNode(root, 'request_timeout')
+        if node is not None and node.text is not None:
+            self.request_timeout = float(node.text)
+
     def saveToLocalFile(self):
         if os.path.isfile(self.path_local_file):
             tree = etree.parse(self.path_local_file)
@@ -52,5 +93,21 @@ class OpenDartConfiguration:
 
         node = self.findChildNode(root, 'api_key', True)
         node.text = self.api_key
+        node = self.findChildNode(root, 'cache_max_bytes', True)
+        node.text = str(self.cache_max_bytes)
+        node = self.findChildNode(root, 'cache_policy', True)
+        node.text = self.cache_policy
+        node = self.findChildNode(root, 'max_requests_per_minute', True)
+        node.text = str(self.max_requests_per_minute)
+        node = self.findChildNode(root, 'max_workers', True)
+        node.text = str(self.max_workers)
+        node = self.findChildNode(root, 'immutable_report_days', True)
+        node.text = str(self.immutable_report_days)
+        node = self.findChildNode(root, 'no_data_cache_ttl', True)
+        node.text = str(self.no_data_cache_ttl)
+        node = self.findChildNode(root, 'result_backend', True)
+        node.text = self.result_backend
+        node = self.findChildNode(root, 'request_timeout', True)
+        node.text = str(self.request_timeout)
 
         writeElementToFile(root, self.path_local_file)
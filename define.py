@@ -164,6 +164,49 @@ class ColumnNames:
         'bfefrmtrm_amount': '전전기금액',
         'ord': '계정과목정렬순서'
     }
+    fulltext_search = {
+        'rcept_no': '접수번호',
+        'source': '원본구분',
+        'score': '점수',
+        'snippet': '발췌'
+    }
+    local_filing = {
+        'rcept_no': '접수번호',
+        'corp_code': '고유번호',
+        'corp_name': '종목명(법인명)',
+        'stock_code': '종목코드',
+        'corp_cls': '법인구분',
+        'report_nm': '보고서명',
+        'flr_nm': '공시 제출인명',
+        'rcept_dt': '접수일자',
+        'rm': '비고',
+        'pblntf_ty': '공시유형',
+        'pblntf_detail_ty': '공시상세유형'
+    }
+    financial_all = {
+        'rcept_no': '접수번호',
+        'reprt_code': '보고서코드',
+        'bsns_year': '사업연도',
+        'corp_code': '고유번호',
+        'sj_div': '재무제표구분',
+        'sj_nm': '재무제표명',
+        'account_id': '계정ID',
+        'account_nm': '계정명',
+        'account_detail': '계정상세',
+        'thstrm_nm': '당기명',
+        'thstrm_amount': '당기금액',
+        'thstrm_add_amount': '당기누적금액',
+        'frmtrm_nm': '전기명',
+        'frmtrm_amount': '전기금액',
+        'frmtrm_q_nm': '전기명(분/반기)',
+        'frmtrm_q_amount': '전기금액(분/반기)',
+        'frmtrm_add_amount': '전기누적금액',
+        'bfefrmtrm_nm': '전전기명',
+        'bfefrmtrm_amount': '전전기금액',
+        'ord': '계정과목정렬순서',
+        'currency': '통화단위',
+        'fs_div': '개별/연결구분'
+    }
     company = {
         'corp_code': '고유번호',
         'corp_name': '정식명칭',
@@ -755,3 +798,44 @@ class ColumnNames:
         'fric_od_a_at_b': '무상증자(사외이사 참석여부(불참(명)))',
         'fric_adt_a_atn': '무상증자(감사(감사위원)참석 여부)'
     }
+
+    batch_request_key = {
+        'req_corp_code': '요청 고유번호',
+        'req_bsns_year': '요청 사업연도',
+        'req_reprt_code': '요청 보고서코드'
+    }
+
+
+class ColumnTypes:
+    """
+    typed DataFrame 변환 스키마 (API 응답의 원본 필드명 기준, OpenDart.setEnableTypedDataFrame 참고)
+    """
+    # 쉼표가 포함된 금액/수량 문자열 -> nullable int64 (소수점이 있으면 Float64)
+    amount = {
+        'thstrm_amount', 'thstrm_add_amount', 'frmtrm_amount', 'frmtrm_add_amount', 'frmtrm_q_amount',
+        'bfefrmtrm_amount', 'bfefrmtrm_add_amount',
+        'stkqy', 'stkqy_irds', 'ctr_stkqy', 'sp_stock_lmp_cnt', 'sp_stock_lmp_irds_cnt',
+        'istc_totqy', 'isu_stock_totqy', 'now_to_isu_stock_totqy', 'now_to_dcrs_stock_totqy',
+        'redc', 'profit_incnr', 'rdmstk_repy', 'tesstk_co', 'distb_stock_co',
+        'bsis_posesn_stock_co', 'trmend_posesn_stock_co', 'bsis_qy', 'trmend_qy',
+        'change_qy_acqs', 'change_qy_dsps', 'change_qy_incnr',
+        'mendng_totamt', 'jan_avrg_mendng_am', 'psn1_avrg_pymntamt', 'pymnt_totamt',
+        'fyer_salary_totamt', 'jan_salary_am', 'rgllbr_co', 'cnttk_co'
+    }
+    # 비율(%) 문자열 -> Float64
+    ratio = {
+        'stkrt', 'stkrt_irds', 'ctr_stkrt', 'sp_stock_lmp_rate', 'sp_stock_lmp_irds_rate',
+        'bsis_posesn_stock_qota_rt', 'trmend_posesn_stock_qota_rt', 'qota_rt', 'hold_stock_rate', 'shrholdr_rate'
+    }
+    integer = {
+        'ord'
+    }
+    # 필드명 -> 날짜 형식
+    date = {
+        'rcept_dt': '%Y%m%d',
+        'est_dt': '%Y%m%d',
+        'modify_date': '%Y%m%d'
+    }
+    category = {
+        'fs_div', 'fs_nm', 'sj_div', 'sj_nm', 'corp_cls', 'reprt_code', 'currency'
+    }
@@ -0,0 +1,371 @@
+# Author: Yogyui
+import io
+import os
+import re
+import codecs
+import pickle
+import numpy as np
+import pandas as pd
+from lxml import etree
+from typing import List, Iterator, Union
+
+
+regexSectionTag = re.compile(r"^SECTION-(\d+)$")
+regexWhitespace = re.compile(r"\s+")
+cell_tags = ('TD', 'TH', 'TE', 'TU')
+
+
+def _elementText(element: etree.Element) -> str:
+    return regexWhitespace.sub(' ', ''.join(element.itertext())).strip()
+
+
+class DocumentTable:
+    """
+    공시서류 원본의 <TABLE> 태그 1개
+    셀 정보(텍스트, COLSPAN, ROWSPAN, 헤더 여부)만 보관하고 DataFrame 변환은 처음 요청할 때 수행한다
+    """
+    section_index: int
+    rows: List[List[tuple]]
+
+    def __init__(self, section_index: int, rows: List[List[tuple]]):
+        self.section_index = section_index
+        self.rows = rows  # [[(text, colspan, rowspan, is_header), ...], ...]
+        self._df = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_df'] = None
+        return state
+
+    @property
+    def rowCount(self) -> int:
+        return len(self.rows)
+
+    def _makeGrid(self) -> tuple:
+        row_count = len(self.rows)
+        col_count = max([sum([x[1] for x in row]) for row in self.rows] + [0])
+        grid = np.full((row_count, col_count), None, dtype=object)
+        occupied = np.zeros(grid.shape, dtype=bool)
+        header_rows = np.zeros(row_count, dtype=bool)
+        for r, row in enumerate(self.rows):
+            c = 0
+            for text, colspan, rowspan, is_header in row:
+                free = np.flatnonzero(~occupied[r, c:])
+                c = c + free[0] if free.size > 0 else occupied.shape[1]
+                if c + colspan > grid.shape[1]:
+                    # 위쪽 행의 ROWSPAN에 밀려 열 수가 늘어나는 경우
+                    extra = c + colspan - grid.shape[1]
+                    grid = np.hstack([grid, np.full((row_count, extra), None, dtype=object)])
+                    occupied = np.hstack([occupied, np.zeros((row_count, extra), dtype=bool)])
+                rs = min(rowspan, row_count - r)
+                grid[r:r + rs, c:c + colspan] = text
+                occupied[r:r + rs, c:c + colspan] = True
+                c += colspan
+            header_rows[r] = len(row) > 0 and all([x[3] for x in row])
+        used_cols = np.flatnonzero(occupied.any(axis=0))
+        width = used_cols[-1] + 1 if used_cols.size > 0 else 0
+        return grid[:, :width], header_rows
+
+    def toDataFrame(self, useHeader: bool = True) -> pd.DataFrame:
+        """
+        병합 셀(COLSPAN, ROWSPAN)을 펼친 2차원 그리드를 만들어 DataFrame으로 변환
+
+        :param useHeader: 선두의 헤더 행(TH, THEAD)을 열 이름으로 사용할 지 여부
+        :return: pandas DataFrame
+        """
+        if self._df is not None and useHeader:
+            return self._df.copy()
+        grid, header_rows = self._makeGrid()
+        header_count = 0
+        if useHeader:
+            while header_count < len(header_rows) and header_rows[header_count]:
+                header_count += 1
+        if header_count > 0:
+            header = grid[:header_count]
+            columns = [' '.join(dict.fromkeys([x for x in header[:, i] if x])) for i in range(header.shape[1])]
+            df = pd.DataFrame(grid[header_count:], columns=columns)
+        else:
+            df = pd.DataFrame(grid)
+        if useHeader:
+            self._df = df
+            return df.copy()
+        return df
+
+
+class DocumentSection:
+    """
+    공시서류 원본의 <SECTION-n> 태그 1개 (level 0 = 문서 최상위)
+    하위 섹션과 표는 문서가 보관하는 평탄화된 리스트에서 필요할 때 찾아온다
+    """
+    index: int
+    level: int
+    title: str
+    parent_index: int
+    paragraphs: List[str]
+    table_indices: List[int]
+
+    def __init__(self, document, index: int, level: int, parent_index: int):
+        self._document = document
+        self.index = index
+        self.level = level
+        self.title = None
+        self.parent_index = parent_index
+        self.paragraphs = []
+        self.table_indices = []
+        self._children_indices = None
+
+    def __repr__(self):
+        return f"<DocumentSection level={self.level} title={self.title}>"
+
+    @property
+    def parent(self):
+        if self.parent_index < 0:
+            return None
+        return self._document.sections[self.parent_index]
+
+    @property
+    def children(self) -> List['DocumentSection']:
+        if self._children_indices is None:
+            self._children_indices = [x.index for x in self._document.sections if x.parent_index == self.index]
+        return [self._document.sections[x] for x in self._children_indices]
+
+    @property
+    def tables(self) -> List[DocumentTable]:
+        return [self._document.tables[x] for x in self.table_indices]
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.paragraphs)
+
+    def iterDescendants(self) -> Iterator['DocumentSection']:
+        for child in self.children:
+            yield child
+            yield from child.iterDescendants()
+
+
+class DartDocument:
+    """
+    공시서류 원본파일(xml)을 한 번 iterparse한 결과
+    lxml 객체를 보관하지 않으므로 pickle로 저장하거나 프로세스 간 전달할 수 있다
+    """
+    document_no: str
+    name: str
+    sections: List[DocumentSection]
+    tables: List[DocumentTable]
+
+    def __init__(self, document_no: str):
+        self.document_no = document_no
+        self.name = None
+        self.sections = []
+        self.tables = []
+
+    @property
+    def root(self) -> DocumentSection:
+        return self.sections[0]
+
+    @property
+    def text(self) -> str:
+        # 섹션 제목, 본문, 표 셀 텍스트를 문서 순서대로 연결
+        lines = []
+        for section in self.sections:
+            if section.title is not None:
+                lines.append(section.title)
+            lines.extend(section.paragraphs)
+            for table in section.tables:
+                lines.extend([' '.join([x[0] for x in row]) for row in table.rows])
+        return '\n'.join(lines)
+
+    def iterSections(self) -> Iterator[DocumentSection]:
+        yield from self.root.iterDescendants()
+
+    def findSections(self, title: str, match_exact: bool = False) -> List[DocumentSection]:
+        if match_exact:
+            return [x for x in self.iterSections() if x.title == title]
+        return [x for x in self.iterSections() if x.title is not None and title in x.title]
+
+    def getTableDataFrames(self, sectionTitle: str = None, useHeader: bool = True) -> List[pd.DataFrame]:
+        if sectionTitle is None:
+            return [x.toDataFrame(useHeader) for x in self.tables]
+        result = []
+        for section in self.findSections(sectionTitle):
+            result.extend([x.toDataFrame(useHeader) for x in section.tables])
+            for child in section.iterDescendants():
+                result.extend([x.toDataFrame(useHeader) for x in child.tables])
+        return result
+
+
+def isDocumentRawFileTranscoded(path_file: str, chunk_size: int = 65536) -> bool:
+    """
+    원본파일이 이미 utf-8로 변환되었는지 처음 나오는 비 ASCII 문자 부근(chunk_size 바이트)만 읽어 확인
+    (다운로드된 euc-kr 한글은 utf-8로 디코딩되지 않는다)
+    ASCII 문자만 있는 파일은 변환이 필요한 것으로 본다 (치환해도 내용이 같으면 파일을 다시 쓰지 않는다)
+    """
+    with open(path_file, 'rb') as fp:
+        while True:
+            data = fp.read(chunk_size)
+            if len(data) == 0:
+                return False
+            if data.isascii():
+                continue
+            data = data.lstrip(bytes(range(128)))
+            try:
+                # 마지막 글자가 잘렸을 수 있으므로 증분 디코더로 확인
+                codecs.getincrementaldecoder('utf-8')().decode(data, final=False)
+            except UnicodeDecodeError:
+                return False
+            return True
+
+
+def solveDocumentRawFileEncodingIssue(path_file: str, replace_list: List[tuple]):
+    """
+    다운로드한 공시서류 원본파일(euc-kr)을 xml 파서가 읽을 수 있도록 치환 후 utf-8로 다시 저장
+    이미 변환된 파일은 건너뛰므로 다운로드 후 변환 전에 중단된 파일도 다시 호출하면 된다
+    (프로세스 풀에서 실행될 수 있도록 모듈 함수로 정의)
+
+    :param path_file: xml 파일 경로
+    :param replace_list: (원본 문자열, 치환 문자열) 리스트
+    """
+    if os.path.isfile(path_file) and not isDocumentRawFileTranscoded(path_file):
+        regexAnnotation = re.compile(r"<주[^>]*>")
+
+        def replaceAnnotationBracket(source: str) -> str:
+            search = regexAnnotation.search(source)
+            result = source
+            if search is not None:
+                span = search.span()
+                result = source[:span[0]] + '&lt;' + source[span[0]+1:span[1]-1] + '&gt;' + source[span[1]:]
+            return result
+
+        with open(path_file, 'rb') as fp:
+            raw = fp.read()
+        doc_lines = io.StringIO(raw.decode('euc-kr'), newline=None).readlines()
+        for replace_set in replace_list:
+            src = replace_set[0]
+            dest = replace_set[1]
+            doc_lines = [x.replace(src, dest) for x in doc_lines]
+        doc_lines = [replaceAnnotationBracket(x) for x in doc_lines]
+        converted = ''.join(doc_lines).encode('utf-8')
+        if converted == raw:
+            return  # 내용이 같으면 다시 쓰지 않음 (수정 시각이 바뀌면 pkl 캐시가 무효화된다)
+
+        # 쓰는 도중 중단되어도 원본(euc-kr)이 남도록 임시 파일에 쓴 후 교체
+        with open(path_file + '.tmp', 'wb') as fp:
+            fp.write(converted)
+        os.replace(path_file + '.tmp', path_file)
+
+
+def parseDocumentRawFile(path_file: str, document_no: str = None) -> DartDocument:
+    """
+    공시서류 원본파일(utf-8로 변환된 xml)을 iterparse로 한 번 순회하며 섹션/표 구조를 추출
+
+    :param path_file: xml 파일 경로
+    :param document_no: 접수번호 (기본값 = 파일명)
+    :return: DartDocument
+    """
+    if document_no is None:
+        document_no = os.path.splitext(os.path.basename(path_file))[0]
+    document = DartDocument(document_no)
+    document.sections.append(DocumentSection(document, 0, 0, -1))
+    stack = [0]
+    table_depth = 0
+    context = etree.iterparse(path_file, events=('start', 'end'), recover=True, huge_tree=True)
+    for event, element in context:
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue
+        search = regexSectionTag.match(tag)
+        if event == 'start':
+            if search is not None:
+                index = len(document.sections)
+                section = DocumentSection(document, index, int(search.group(1)), stack[-1])
+                document.sections.append(section)
+                stack.append(index)
+            elif tag == 'TABLE':
+                table_depth += 1
+            continue
+
+        current = document.sections[stack[-1]]
+        if search is not None:
+            if len(stack) > 1:
+                stack.pop()
+            element.clear()
+        elif tag == 'DOCUMENT-NAME':
+            document.name = _elementText(element)
+            document.root.title = document.name
+        elif tag == 'TITLE' and table_depth == 0:
+            if current.title is None:
+                current.title = _elementText(element)
+            else:
+                current.paragraphs.append(_elementText(element))
+            element.clear()
+        elif tag == 'P' and table_depth == 0:
+            text = _elementText(element)
+            if len(text) > 0:
+                current.paragraphs.append(text)
+            element.clear()
+        elif tag == 'TABLE':
+            table_depth -= 1
+            if table_depth == 0:
+                rows = []
+                for tr in element.iter('TR'):
+                    in_thead = tr.getparent() is not None and tr.getparent().tag == 'THEAD'
+                    row = []
+                    for cell in tr:
+                        if cell.tag not in cell_tags:
+                            continue
+                        colspan = int(cell.get('COLSPAN', '1') or 1)
+                        rowspan = int(cell.get('ROWSPAN', '1') or 1)
+                        is_header = in_thead or cell.tag == 'TH'
+                        row.append((_elementText(cell), max(1, colspan), max(1, rowspan), is_header))
+                    rows.append(row)
+                current.table_indices.append(len(document.tables))
+                document.tables.append(DocumentTable(current.index, rows))
+                element.clear()
+    return document
+
+
+class DocumentParseCache:
+    """
+    파싱 결과 캐시 (메모리 + 원본 xml 옆의 {접수번호}.pkl 파일)
+    원본 xml이 다시 다운로드되어 pkl보다 최신이면 다시 파싱한다
+    """
+    def __init__(self, path_data_dir: str, capacity: int = 16):
+        self._path_data_dir = path_data_dir
+        self._capacity = capacity
+        self._documents = dict()
+
+    def getPicklePath(self, document_no: str) -> str:
+        return os.path.join(self._path_data_dir, f'{document_no}.pkl')
+
+    def load(self, document_no: str, path_xml: str) -> Union[DartDocument, None]:
+        document = self._documents.get(document_no)
+        if document is not None:
+            self._documents[document_no] = self._documents.pop(document_no)  # 최근 사용 순서 갱신
+            return document
+        path_pkl = self.getPicklePath(document_no)
+        if os.path.isfile(path_pkl) and os.path.getmtime(path_pkl) >= os.path.getmtime(path_xml):
+            try:
+                with open(path_pkl, 'rb') as fp:
+                    document = pickle.load(fp)
+                self.remember(document)
+                return document
+            except Exception:
+                pass
+        return None
+
+    def store(self, document: DartDocument):
+        with open(self.getPicklePath(document.document_no), 'wb') as fp:
+            pickle.dump(document, fp)
+        self.remember(document)
+
+    def discard(self, document_no: str):
+        self._documents.pop(document_no, None)
+        path_pkl = self.getPicklePath(document_no)
+        if os.path.isfile(path_pkl):
+            os.remove(path_pkl)
+
+    def remember(self, document: DartDocument):
+        self._documents.pop(document.document_no, None)
+        self._documents[document.document_no] = document
+        while len(self._documents) > self._capacity:
+            self._documents.pop(next(iter(self._documents)))
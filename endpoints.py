@@ -0,0 +1,632 @@
+# Author: Yogyui
+import textwrap
+from enum import Enum
+from typing import Dict, List, Tuple, Union
+from collections import OrderedDict
+from define import ColumnNames
+
+
+class ParamShape(Enum):
+    Corp = 'corp'  # corpCode
+    CorpYearReport = 'corp_year_report'  # corpCode, year, reportCode
+    CorpDateRange = 'corp_date_range'  # corpCode, dateBegin, dateEnd
+
+
+class ResponseShape(Enum):
+    List = 'list'  # {'list': [...]}
+    Group = 'group'  # {'group': [{'title': ..., 'list': [...]}, ...]}
+
+
+# 응답 캐시 유효기간 (초, OpenDart.setEnableResponseCache 참고)
+ttl_periodic_report = 24 * 60 * 60
+ttl_disclosure = 60 * 60
+
+param_docs = {
+    ParamShape.Corp: [
+        ':param corpCode: 공시대상회사의 고유번호(8자리)'
+    ],
+    ParamShape.CorpYearReport: [
+        ':param corpCode: 공시대상회사의 고유번호(8자리)',
+        ':param year: 사업연도, 2015년 이후 부터 정보제공',
+        ':param reportCode: 보고서 코드'
+    ],
+    ParamShape.CorpDateRange: [
+        ':param corpCode: 공시대상회사의 고유번호(8자리)',
+        ':param dateBegin: 시작일',
+        ':param dateEnd: 종료일'
+    ]
+}
+
+
+class EndpointSpec:
+    """
+    OpenDart API 1개의 선언적 정의
+    OpenDart 클래스의 공개 메서드(요청 인자 구성, 요청/캐시, 응답 파싱, 열 이름 변경, typed 변환)가 이 정의로부터 생성된다
+
+    :param name: 생성할 메서드 이름
+    :param path: API 경로 (예: 'alotMatter.json')
+    :param params: 요청 인자 형태
+    :param response: 응답 형태
+    :param columns: 열 이름 (ResponseShape.List = dict, ResponseShape.Group = (group title, dict) 리스트)
+    :param log: 명령 로그 메시지
+    :param cache_ttl: 응답 캐시 유효기간(초), None이면 캐시하지 않음
+    :param dtypes: 원본 필드명 -> 'amount', 'ratio', 'integer', 'date', 'category' (define.ColumnTypes보다 우선)
+    :param report_name: 공시검색 결과의 보고서명에서 이 API의 공시를 식별하는 이름 (예: '유상증자결정', scanMajorEvents 참고)
+    :param doc: 메서드 설명 (인자/반환값 설명은 params/response로부터 자동 생성)
+    """
+    def __init__(
+            self, name: str, path: str, params: ParamShape, response: ResponseShape,
+            columns: Union[dict, List[Tuple[str, dict]]], log: str, cache_ttl: float = None,
+            dtypes: Dict[str, str] = None, report_name: str = None, doc: str = ''
+    ):
+        self.name = name
+        self.path = path
+        self.params = params
+        self.response = response
+        self.columns = columns
+        self.log = log
+        self.cache_ttl = cache_ttl
+        self.dtypes = dtypes
+        self.report_name = report_name
+        self.doc = doc
+
+    @property
+    def api(self) -> str:
+        return self.path.replace('.json', '')
+
+    @property
+    def groupTitles(self) -> List[str]:
+        if self.response != ResponseShape.Group:
+            return []
+        return [x[0] for x in self.columns]
+
+    @property
+    def reportNameToken(self) -> Union[str, None]:
+        # 공백을 제거한 보고서명(예: '[기재정정]주요사항보고서(유상증자결정)')에서 찾을 문자열
+        # 괄호까지 포함해 '유상증자결정'과 '유무상증자결정'을 구분한다
+        if self.report_name is None:
+            return None
+        return f'({self.report_name})'
+
+    def makeDocString(self) -> str:
+        lines = textwrap.dedent(self.doc).strip().split('\n')
+        lines.append('')
+        lines.extend(param_docs[self.params])
+        if self.response == ResponseShape.Group:
+            lines.append(f":return: tuple of pandas DataFrames ({', '.join(self.groupTitles)})")
+        else:
+            lines.append(':return: pandas DataFrame')
+        return '\n' + '\n'.join(['        ' + x if x else '' for x in lines]) + '\n        '
+
+
+endpoint_registry: Dict[str, EndpointSpec] = OrderedDict()
+
+
+def registerEndpoint(spec: EndpointSpec):
+    if spec.name in endpoint_registry:
+        raise ValueError(f"endpoint already registered: {spec.name}")
+    endpoint_registry[spec.name] = spec
+
+
+def findEndpointByApi(api: str) -> Union[EndpointSpec, None]:
+    api = api.replace('.json', '')
+    for spec in endpoint_registry.values():
+        if spec.api == api:
+            return spec
+    return None
+
+
+# 사업보고서 주요정보 API
+
+registerEndpoint(EndpointSpec(
+    'getContingentConvertibleBondOutstandingBalanceInfo', 'cndlCaplScritsNrdmpBlce.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outstanding_balance,
+    log='get contingent convertible bond outstanding balance info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020008
+    [사업보고서 주요정보::1.조건부 자본증권 미상환 잔액]
+    정기보고서(사업, 분기, 반기보고서) 내에 조건부 자본증권 미상환 잔액을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getUnregisteredOfficerRemunerationInfo', 'unrstExctvMendngSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.remuneration,
+    log='get unregistered officer remuneration info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020013
+    [사업보고서 주요정보::2.미등기임원 보수현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 미등기임원 보수현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDebentureOutstandingBalanceInfo', 'cprndNrdmpBlce.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outstanding_balance,
+    log='get debenture outstanding balance info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020006
+    [사업보고서 주요정보::3.회사채 미상환 잔액]
+    정기보고서(사업, 분기, 반기보고서) 내에 회사채 미상환 잔액을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getShortTermBondOutstandingBalanceInfo', 'srtpdPsndbtNrdmpBlce.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outstanding_balance,
+    log='get short-term bond outstanding balance info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020005
+    [사업보고서 주요정보::4.단기사채 미상환 잔액]
+    정기보고서(사업, 분기, 반기보고서) 내에 단기사채 미상환 잔액을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getPaperSecuritiesOutstandingBalanceInfo', 'entrprsBilScritsNrdmpBlce.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outstanding_balance,
+    log='get paper securities outstanding balance info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020004
+    [사업보고서 주요정보::5.기업어음증권 미상환 잔액]
+    정기보고서(사업, 분기, 반기보고서) 내에 기업어음증권 미상환 잔액을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDebtSecuritiesPublishInfo', 'detScritsIsuAcmslt.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.debt_securities,
+    log='get debt securities publish info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020003
+    [사업보고서 주요정보::6.채무증권 발행실적]
+    정기보고서(사업, 분기, 반기보고서) 내에 채무증권 발행실적을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getPrivateCapitalUsageDetailInfo', 'prvsrpCptalUseDtls.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.equity_usage_detail,
+    log='get private capital usage detail info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020017
+    [사업보고서 주요정보::7.사모자금의 사용내역]
+    정기보고서(사업, 분기, 반기보고서) 내에 사모자금의 사용내역을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getPublicCapitalUsageDetailInfo', 'pssrpCptalUseDtls.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.equity_usage_detail,
+    log='get public equity usage detail info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020016
+    [사업보고서 주요정보::8.공모자금의 사용내역]
+    정기보고서(사업, 분기, 반기보고서) 내에 공모자금의 사용내역을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getEntireOfficerRemunerationByApprovalInfo', 'drctrAdtAllMendngSttusGmtsckConfmAmount.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.remuneration,
+    log='get entire officer remuneration by approval info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020014
+    [사업보고서 주요정보::9.이사·감사 전체의 보수현황(주주총회 승인금액)]
+    정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황(주주총회 승인금액)을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getEntireOfficerRemunerationByPaymentsInfo', 'drctrAdtAllMendngSttusMendngPymntamtTyCl.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.remuneration,
+    log='get entire officer remuneration by payments info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020015
+    [사업보고서 주요정보::10.이사·감사 전체의 보수현황(보수지급금액 - 유형별)]
+    정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황(보수지급금액 - 유형별)을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getStockTotalQuantityInfo', 'stockTotqySttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.stock_quantity,
+    log='get stock total quantity info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020002
+    [사업보고서 주요정보::11.주식의 총수 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 주식의총수현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getAccountingAuditorAndOpinionInfo', 'accnutAdtorNmNdAdtOpinion.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.audit_opinion,
+    log='get accounting auditor and opinion info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020009
+    [사업보고서 주요정보::12.회계감사인의 명칭 및 감사의견]
+    정기보고서(사업, 분기, 반기보고서) 내에 회계감사인의 명칭 및 감사의견을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getAuditServiceContractStatusInfo', 'adtServcCnclsSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.audit_service_contract,
+    log='get audit service contract status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020010
+    [사업보고서 주요정보::13.감사용역체결현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 감사용역체결현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getNonAuditServiceContractStatusInfo', 'accnutAdtorNonAdtServcCnclsSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.non_audit_service_contract,
+    log='get non-audit service contract status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020011
+    [사업보고서 주요정보::14.회계감사인과의 비감사용역 계약체결 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 회계감사인과의 비감사용역 계약체결 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getOutsideDirectorAndChangeStatusInfo', 'outcmpnyDrctrNdChangeSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outside_director,
+    log='get outside director and change status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020012
+    [사업보고서 주요정보::15.사외이사 및 그 변동현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 사외이사 및 그 변동현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getHybridSecuritiesOutstandingBalanceInfo', 'newCaplScritsNrdmpBlce.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.outstanding_balance,
+    log='get hybrid securities outstanding balance info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020007
+    [사업보고서 주요정보::16.신종자본증권 미상환 잔액]
+    정기보고서(사업, 분기, 반기보고서) 내에 신종자본증권 미상환 잔액을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getCapitalIncreaseDecreaseStatusInfo', 'irdsSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.capital_inc_dec,
+    log='get capital increase(decrease) status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019004
+    [사업보고서 주요정보::17.증자(감자) 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 증자(감자) 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDividendDetailInfo', 'alotMatter.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.dividend_detail,
+    log='get dividend detail info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019005
+    [사업보고서 주요정보::18.배당에 관한 사항]
+    정기보고서(사업, 분기, 반기보고서) 내에 배당에 관한 사항을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getTreasuryStockAcquisitionDisposalInfo', 'tesstkAcqsDspsSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.treasury_stock,
+    log='get treasury stock acquisition(disposal) info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019006
+    [사업보고서 주요정보::19.자기주식 취득 및 처분 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 자기주식 취득 및 처분 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getMajorityShareholderStatusInfo', 'hyslrSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.majority_shareholder,
+    log='get majority shareholder status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019007
+    [사업보고서 주요정보::20.최대주주 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 최대주주 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getMajorityShareholderChangeStatusInfo', 'hyslrChgSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.majority_shareholder_change,
+    log='get majority shareholder change status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019008
+    [사업보고서 주요정보::21.최대주주 변동현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 최대주주 변동현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getMinorityShareholderStatusInfo', 'mrhlSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.minority_shareholder,
+    log='get minority shareholder status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019009
+    [사업보고서 주요정보::22.소액주주 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 소액주주 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getExecutivesStatusInfo', 'exctvSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.executives_status,
+    log='get executives status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019010
+    [사업보고서 주요정보::23.임원 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 임원 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getEmployeeStatusInfo', 'empSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.employee_status,
+    log='get employee status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019011
+    [사업보고서 주요정보::24.직원 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 직원 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getIndivisualOfficerRemunerationStatusInfo', 'hmvAuditIndvdlBySttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.indivisual_officer_remuneration,
+    log='get indivisual officer remuneration status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019012
+    [사업보고서 주요정보::25.이사·감사의 개인별 보수 현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 이사·감사의 개인별 보수 현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getEntireOfficerRemunerationStatusInfo', 'hmvAuditAllSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.entire_officer_remuneration,
+    log='get entire officer remuneration status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019013
+    [사업보고서 주요정보::26.이사·감사 전체의 보수현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getHighestIndivisualRemunerationInfo', 'indvdlByPay.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.indivisual_officer_remuneration,
+    log='get highest indivisual remuneration info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019014
+    [사업보고서 주요정보::27.개인별 보수지급 금액(5억이상 상위5인)]
+    정기보고서(사업, 분기, 반기보고서) 내에 개인별 보수지급 금액(5억이상 상위5인)을 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getOtherCorporationInvestmentStatusInfo', 'otrCprInvstmntSttus.json',
+    ParamShape.CorpYearReport, ResponseShape.List, ColumnNames.other_corp_investment,
+    log='get other corporation investment status info', cache_ttl=ttl_periodic_report,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019015
+    [사업보고서 주요정보::28.타법인 출자현황]
+    정기보고서(사업, 분기, 반기보고서) 내에 타법인 출자현황을 제공합니다.
+    """
+))
+
+
+# 지분공시 종합정보 API
+
+registerEndpoint(EndpointSpec(
+    'getMajorStockInformation', 'majorstock.json',
+    ParamShape.Corp, ResponseShape.List, ColumnNames.major_stock,
+    log='get major stock information', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS004&apiId=2019021
+    [지분공시 종합정보::1.대량보유 상황보고]
+    주식등의 대량보유상황보고서 내에 대량보유 상황보고 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getExecutiveStockInformation', 'elestock.json',
+    ParamShape.Corp, ResponseShape.List, ColumnNames.executive_stock,
+    log='get executive stock information', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/main.do?apiGrpCd=DS004
+    [지분공시 종합정보::2.임원ㆍ주요주주 소유보고]
+    임원ㆍ주요주주특정증권등 소유상황보고서 내에 임원ㆍ주요주주 소유보고 정보를 제공합니다.
+    """
+))
+
+
+# 주요사항보고서 주요정보 API
+
+registerEndpoint(EndpointSpec(
+    'getBankruptcyOccurrenceInfo', 'dfOcr.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.bankruptcy,
+    log='get bankruptcy occurrence info', cache_ttl=ttl_disclosure, report_name='부도발생',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020019
+    [주요사항보고서 주요정보::1.부도발생]
+    주요사항보고서(부도발생) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getBusinessSuspensionInfo', 'bsnSp.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.suspension,
+    log='get business suspension info', cache_ttl=ttl_disclosure, report_name='영업정지',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020020
+    [주요사항보고서 주요정보::2.영업정지]
+    주요사항보고서(영업정지) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getRehabilitationProcedureInitiateInfo', 'ctrcvsBgrq.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.rehabilitation,
+    log='get rehabilitation procedure initiate info', cache_ttl=ttl_disclosure, report_name='회생절차개시신청',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020021
+    [주요사항보고서 주요정보::3.회생절차 개시신청]
+    주요사항보고서(회생절차 개시신청) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDissolutionReasonOccurrenceInfo', 'dsRsOcr.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.dissolution,
+    log='get dissolution reason occurrence info', cache_ttl=ttl_disclosure, report_name='해산사유발생',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020022
+    [주요사항보고서 주요정보::4.해산사유 발생]
+    주요사항보고서(해산사유 발생) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getRightsIssueDecisionInfo', 'piicDecsn.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.rights_issue_decision,
+    log='get rights issue decision info', cache_ttl=ttl_disclosure, report_name='유상증자결정',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020023
+    [주요사항보고서 주요정보::5.유상증자 결정]
+    주요사항보고서(유상증자 결정) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getBonusIssueDecisionInfo', 'fricDecsn.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.bonus_issue_decision,
+    log='get bonus issue decision info', cache_ttl=ttl_disclosure, report_name='무상증자결정',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020024
+    [주요사항보고서 주요정보::6.무상증자 결정]
+    주요사항보고서(무상증자 결정) 내에 주요 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getRightsBonusIssueDecisionInfo', 'pifricDecsn.json',
+    ParamShape.CorpDateRange, ResponseShape.List, ColumnNames.rights_bonus_issue_decision,
+    log='get rights/bonus issue decision info', cache_ttl=ttl_disclosure, report_name='유무상증자결정',
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020025
+    [주요사항보고서 주요정보::7.유무상증자 결정]
+    주요사항보고서(유무상증자 결정) 내에 주요 정보를 제공합니다.
+    """
+))
+
+# TODO: 감자 결정 ~
+
+# 증권신고서 주요정보 API
+
+registerEndpoint(EndpointSpec(
+    'getStockExchangeInfo', 'extrRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('발행증권', ColumnNames.declaration_stock),
+        ('당사회사에관한사항', ColumnNames.declaration_detail)
+    ],
+    log='get declaration info - stock exchange', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020058
+    [증권신고서 주요정보::1.주식의포괄적교환·이전]
+    증권신고서(주식의포괄적교환·이전) 내에 요약 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getMergeInfo', 'mgRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('발행증권', ColumnNames.declaration_stock),
+        ('당사회사에관한사항', ColumnNames.declaration_detail)
+    ],
+    log='get declaration info - merge', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020057
+    [증권신고서 주요정보::2.합병]
+    증권신고서(합병) 내에 요약 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDepositaryReceiptInfo', 'stkdpRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('증권의종류', ColumnNames.declaration_type),
+        ('인수인정보', ColumnNames.declaration_takeover),
+        ('자금의사용목적', ColumnNames.declaration_purpose),
+        ('매출인에관한사항', ColumnNames.declaration_seller)
+    ],
+    log='get declaration info - depositary receipt', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020056
+    [증권신고서 주요정보::3.증권예탁증권]
+    증권신고서(증권예탁증권) 내에 요약 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDebtSecuritiesInfo', 'bdRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('인수인정보', ColumnNames.declaration_takeover),
+        ('자금의사용목적', ColumnNames.declaration_purpose),
+        ('매출인에관한사항', ColumnNames.declaration_seller)
+    ],
+    log='get declaration info - dept securites', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020055
+    [증권신고서 주요정보::4.채무증권]
+    증권신고서(채무증권) 내에 요약 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getEquitySecuritiesInfo', 'estkRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('증권의종류', ColumnNames.declaration_type),
+        ('인수인정보', ColumnNames.declaration_takeover),
+        ('자금의사용목적', ColumnNames.declaration_purpose),
+        ('매출인에관한사항', ColumnNames.declaration_seller),
+        ('일반청약자환매청구권', ColumnNames.declaration_putback)
+    ],
+    log='get declaration info - equity securites', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020054
+    [증권신고서 주요정보::5.지분증권]
+    증권신고서(지분증권) 내에 요약 정보를 제공합니다.
+    """
+))
+
+registerEndpoint(EndpointSpec(
+    'getDivisionInfo', 'dvRs.json',
+    ParamShape.CorpDateRange, ResponseShape.Group, [
+        ('일반사항', ColumnNames.declaration_normal),
+        ('발행증권', ColumnNames.declaration_stock),
+        ('당사회사에관한사항', ColumnNames.declaration_detail)
+    ],
+    log='get declaration info - division', cache_ttl=ttl_disclosure,
+    doc="""
+    https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020059
+    [증권신고서 주요정보::6.분할]
+    증권신고서(분할) 내에 요약 정보를 제공합니다.
+    """
+))
@@ -0,0 +1,172 @@
+# Author: Yogyui
+import time
+import threading
+from typing import Callable, List, Iterable, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RateLimiter:
+    """
+    분당 요청 수 제한 (요청 사이의 최소 간격을 보장하는 방식, 여러 스레드에서 공유)
+    """
+    def __init__(self, maxRequestsPerMinute: int):
+        self._lock = threading.Lock()
+        self._interval = 0.
+        self._next_time = 0.
+        self.setMaxRequestsPerMinute(maxRequestsPerMinute)
+
+    def setMaxRequestsPerMinute(self, maxRequestsPerMinute: int):
+        with self._lock:
+            self._interval = 60. / maxRequestsPerMinute if maxRequestsPerMinute > 0 else 0.
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    동시 요청 수(in-flight) 상한을 AIMD 방식으로 자동 조정 (여러 스레드에서 공유)
+    응답 지연이 기준값(최근 지연의 지수이동평균)의 latencyTolerance배 이내이면 상한을 조금씩 늘리고(additive increase),
+    시간 초과, 5xx 응답, 요청 제한 초과(020) 등 혼잡 신호가 오면 상한을 decreaseFactor배로 줄인다(multiplicative decrease)
+    (한 번 줄인 이후 그 이전에 시작된 요청의 혼잡 신호로는 다시 줄이지 않는다)
+    """
+    decrease_factor = 0.5
+    latency_tolerance = 2.
+    latency_alpha = 0.1
+
+    def __init__(self, maxLimit: int = 8, minLimit: int = 1, initialLimit: int = None):
+        self._cond = threading.Condition()
+        self._min_limit = max(1, minLimit)
+        self._max_limit = max(self._min_limit, maxLimit)
+        self._limit = float(min(self._max_limit, initialLimit or max(self._min_limit, self._max_limit // 2)))
+        self._in_flight = 0
+        self._latency_baseline = None
+        self._last_decrease = 0.
+        self._request_count = 0
+        self._congestion_count = 0
+        self._decrease_count = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def inFlight(self) -> int:
+        return self._in_flight
+
+    def setMaxLimit(self, maxLimit: int):
+        with self._cond:
+            self._max_limit = max(self._min_limit, maxLimit)
+            self._limit = min(self._limit, float(self._max_limit))
+            self._cond.notify_all()
+
+    def acquire(self) -> float:
+        """
+        요청 슬롯 획득 (상한에 도달하면 대기)
+
+        :return: 요청 시작 시각 (release에 전달)
+        """
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+            return time.monotonic()
+
+    def release(self, started: float, congested: bool = False):
+        """
+        요청 슬롯 반환 및 상한 조정
+
+        :param started: acquire가 반환한 요청 시작 시각
+        :param congested: 혼잡 신호 여부 (시간 초과, 5xx, 요청 제한 초과 등)
+        """
+        now = time.monotonic()
+        latency = now - started
+        with self._cond:
+            self._in_flight -= 1
+            self._request_count += 1
+            if congested:
+                self._congestion_count += 1
+                if started >= self._last_decrease:
+                    self._limit = max(float(self._min_limit), self._limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self._decrease_count += 1
+            else:
+                if self._latency_baseline is None:
+                    self._latency_baseline = latency
+                if latency <= self._latency_baseline * self.latency_tolerance:
+                    self._limit = min(float(self._max_limit), self._limit + 1. / max(1., self._limit))
+                self._latency_baseline += self.latency_alpha * (latency - self._latency_baseline)
+            self._cond.notify_all()
+
+    def getMetrics(self) -> dict:
+        with self._cond:
+            return {
+                'limit': int(self._limit),
+                'max_limit': self._max_limit,
+                'in_flight': self._in_flight,
+                'latency_baseline': self._latency_baseline,
+                'requests': self._request_count,
+                'congestions': self._congestion_count,
+                'decreases': self._decrease_count
+            }
+
+
+class BatchResult:
+    """
+    일괄 실행 결과 1건 (성공 시 result, 실패 시 exception)
+    """
+    key: Any
+    result: Any
+    exception: Exception
+
+    def __init__(self, key, result=None, exception: Exception = None):
+        self.key = key
+        self.result = result
+        self.exception = exception
+
+    @property
+    def success(self) -> bool:
+        return self.exception is None
+
+
+class RequestExecutor:
+    """
+    API 요청 함수를 스레드 풀에서 동시에 실행 (결과는 입력 순서 유지)
+    """
+    def __init__(self, maxWorkers: int = 8):
+        self._max_workers = max(1, maxWorkers)
+
+    @property
+    def maxWorkers(self) -> int:
+        return self._max_workers
+
+    def setMaxWorkers(self, maxWorkers: int):
+        self._max_workers = max(1, maxWorkers)
+
+    def run(self, func: Callable, keys: Iterable[Tuple], maxWorkers: int = None) -> List[BatchResult]:
+        """
+        :param func: 실행할 함수
+        :param keys: 함수 인자 튜플 목록
+        :param maxWorkers: 동시 실행 수 (기본값 = 생성 시 설정값)
+        :return: BatchResult 리스트 (keys 순서)
+        """
+        keys = list(keys)
+        workers = max(1, min(maxWorkers or self._max_workers, len(keys)))
+
+        def call(key: Tuple) -> BatchResult:
+            try:
+                return BatchResult(key, func(*key))
+            except Exception as e:
+                return BatchResult(key, exception=e)
+
+        if len(keys) == 0:
+            return []
+        if workers == 1:
+            return [call(x) for x in keys]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(call, keys))
@@ -0,0 +1,195 @@
+# Author: Yogyui
+import re
+import time
+import zlib
+import sqlite3
+import threading
+from typing import List, Dict
+from collections import Counter
+
+
+regexTokenRun = re.compile(r"[0-9a-z]+|[\u1100-\u11ff\u3130-\u318f\uac00-\ud7a3\u4e00-\u9fff]+")
+regexWhitespace = re.compile(r"\s+")
+
+
+def normalizeText(text: str) -> str:
+    return regexWhitespace.sub(' ', text).strip().lower()
+
+
+def tokenizeText(text: str) -> List[str]:
+    """
+    색인/검색용 토큰 분리
+    영문/숫자는 단어 단위, 한글(한자)은 형태소 분석 없이 글자 2-gram으로 분리한다
+    (예: '삼성전자' -> '삼성', '성전', '전자')
+    """
+    tokens = []
+    for run in regexTokenRun.findall(text.lower()):
+        if run[0].isascii():
+            tokens.append(run)
+        elif len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend([run[i:i + 2] for i in range(len(run) - 1)])
+    return tokens
+
+
+def tokenizeTextForIndex(text: str) -> List[str]:
+    """
+    색인용 토큰 분리 (tokenizeText + 2글자 이상인 한글(한자) 묶음의 마지막 글자)
+    묶음의 마지막 글자로 시작하는 2-gram은 없으므로, 한 글자 검색이 가능하도록 마지막 글자를 따로 색인한다
+    (예: '삼성전자' -> '삼성', '성전', '전자', '자')
+    """
+    tokens = tokenizeText(text)
+    tokens.extend([x[-1] for x in regexTokenRun.findall(text.lower()) if not x[0].isascii() and len(x) > 1])
+    return tokens
+
+
+class FullTextIndex:
+    """
+    로컬에 저장된 공시서류의 전문(full-text) 역색인 (sqlite 파일에 posting 저장)
+    문서가 다운로드될 때마다 증분 색인되며, 질의는 토큰별 posting 교집합으로 처리한다
+    (한 글자 질의는 그 글자로 시작하는 2-gram과 묶음 끝 글자 토큰을 함께 조회한다)
+    store_body가 True이면 정규화된 본문을 zlib으로 압축해 함께 저장하며(원본 파일과 별도로 디스크 사용),
+    결과 발췌(snippet)와 여러 토큰으로 나뉘는 검색어의 본문 확인에 사용한다
+    """
+    def __init__(self, path_db: str, store_body: bool = True):
+        self._path_db = path_db
+        self._store_body = store_body
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path_db, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_id INTEGER PRIMARY KEY,
+                rcept_no TEXT NOT NULL,
+                source TEXT NOT NULL,
+                indexed_at REAL,
+                body BLOB,
+                UNIQUE (rcept_no, source)
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                token TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                freq INTEGER NOT NULL,
+                PRIMARY KEY (token, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_doc ON postings (doc_id);
+        """)
+        self._conn.commit()
+        self._migrate()
+
+    def _migrate(self):
+        # version 1: 한글 묶음의 마지막 글자 토큰 추가 (본문이 저장된 기존 문서는 본문으로 보충)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+        with self._conn:
+            for doc_id, blob in self._conn.execute("SELECT doc_id, body FROM documents WHERE body IS NOT NULL"):
+                body = zlib.decompress(blob).decode('utf-8')
+                counts = Counter([x[-1] for x in regexTokenRun.findall(body) if not x[0].isascii() and len(x) > 1])
+                self._conn.executemany(
+                    "INSERT INTO postings (token, doc_id, freq) VALUES (?, ?, ?) "
+                    "ON CONFLICT(token, doc_id) DO UPDATE SET freq = freq + excluded.freq",
+                    [(token, doc_id, freq) for token, freq in counts.items()])
+            self._conn.execute("PRAGMA user_version = 1")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def isIndexed(self, rcept_no: str, source: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM documents WHERE rcept_no=? AND source=?", (rcept_no, source)).fetchone()
+        return row is not None
+
+    def addDocument(self, rcept_no: str, text: str, source: str = 'xml'):
+        """
+        문서 색인 (같은 접수번호/원본구분의 기존 색인은 교체)
+
+        :param rcept_no: 접수번호
+        :param text: 문서 본문
+        :param source: 원본구분 ('xml' = 공시서류 원본파일, 'html' = 렌더링된 html)
+        """
+        body = normalizeText(text)
+        counts = Counter(tokenizeTextForIndex(body))
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute(
+                    "SELECT doc_id FROM documents WHERE rcept_no=? AND source=?", (rcept_no, source)).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM postings WHERE doc_id=?", (row[0],))
+                    self._conn.execute("DELETE FROM documents WHERE doc_id=?", (row[0],))
+                cursor = self._conn.execute(
+                    "INSERT INTO documents (rcept_no, source, indexed_at, body) VALUES (?, ?, ?, ?)",
+                    (rcept_no, source, time.time(), zlib.compress(body.encode('utf-8')) if self._store_body else None))
+                doc_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO postings (token, doc_id, freq) VALUES (?, ?, ?)",
+                    [(token, doc_id, freq) for token, freq in counts.items()])
+
+    def removeDocument(self, rcept_no: str, source: str = None):
+        with self._lock:
+            with self._conn:
+                if source is None:
+                    rows = self._conn.execute("SELECT doc_id FROM documents WHERE rcept_no=?", (rcept_no,)).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        "SELECT doc_id FROM documents WHERE rcept_no=? AND source=?", (rcept_no, source)).fetchall()
+                for row in rows:
+                    self._conn.execute("DELETE FROM postings WHERE doc_id=?", (row[0],))
+                    self._conn.execute("DELETE FROM documents WHERE doc_id=?", (row[0],))
+
+    def _postings(self, token: str) -> Dict[int, int]:
+        if len(token) == 1 and not token.isascii():
+            # 한 글자 질의는 해당 글자로 시작하는 2-gram과 묶음 끝 글자 토큰(해당 글자 자체)을 범위 탐색
+            rows = self._conn.execute(
+                "SELECT doc_id, SUM(freq) FROM postings WHERE token >= ? AND token < ? GROUP BY doc_id",
+                (token, token + '\uffff')).fetchall()
+        else:
+            rows = self._conn.execute("SELECT doc_id, freq FROM postings WHERE token=?", (token,)).fetchall()
+        return dict(rows)
+
+    def search(self, query: str, limit: int = 100, snippetLength: int = 40, verify: bool = True) -> List[dict]:
+        """
+        :param query: 검색어 (공백으로 구분된 여러 단어는 AND 조건)
+        :param limit: 최대 결과 수
+        :param snippetLength: 검색어 앞뒤로 발췌할 글자 수
+        :param verify: 2-gram 교집합 후 본문에 검색어가 실제로 존재하는지 확인할 지 여부
+                       (여러 토큰으로 나뉘는 검색어가 있을 때만 확인, 본문을 저장하지 않은 문서는 확인 불가)
+        :return: list of dict (rcept_no, source, score, snippet)
+        """
+        terms = [x for x in normalizeText(query).split(' ') if len(x) > 0]
+        tokens = list(dict.fromkeys(tokenizeText(' '.join(terms))))
+        if len(tokens) == 0:
+            return []
+        # 토큰 하나로 분리되는 검색어(영문/숫자 단어, 한글 1~2글자)는 posting만으로 일치가 확정되므로 본문을 읽지 않는다
+        # (한 글자는 그 글자로 시작하는 2-gram 또는 묶음 끝 글자 토큰이 있으면 본문에 존재)
+        verify = verify and any([len(tokenizeText(x)) > 1 for x in terms])
+        with self._lock:
+            postings = sorted([self._postings(x) for x in tokens], key=len)
+            scores = postings[0]
+            for other in postings[1:]:
+                scores = {k: v + other[k] for k, v in scores.items() if k in other}
+                if len(scores) == 0:
+                    return []
+            ranked = sorted(scores.items(), key=lambda x: -x[1])
+            results = []
+            for doc_id, score in ranked:
+                rcept_no, source, blob = self._conn.execute(
+                    "SELECT rcept_no, source, body FROM documents WHERE doc_id=?", (doc_id,)).fetchone()
+                body = zlib.decompress(blob).decode('utf-8') if blob is not None else ''
+                positions = [body.find(x) for x in terms]
+                if verify and blob is not None and min(positions) < 0:
+                    continue
+                pos = max(0, positions[0])
+                begin = max(0, pos - snippetLength)
+                end = min(len(body), pos + len(terms[0]) + snippetLength)
+                results.append({'rcept_no': rcept_no, 'source': source, 'score': score, 'snippet': body[begin:end]})
+                if len(results) >= limit:
+                    break
+        return results
+
+    def getDocumentCount(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
@@ -0,0 +1,231 @@
+# Author: Yogyui
+import numpy as np
+import pandas as pd
+
+
+# 보고서 코드 -> 분기 (1분기, 반기, 3분기, 사업보고서)
+quarter_of_report = {'11013': 1, '11012': 2, '11014': 3, '11011': 4}
+report_of_quarter = {v: k for k, v in quarter_of_report.items()}
+
+# 표준 항목 -> 종류 (flow = 손익/현금흐름 누적 항목, stock = 재무상태표 시점 항목)
+canonical_items = {
+    'revenue': 'flow',
+    'gross_profit': 'flow',
+    'operating_income': 'flow',
+    'pretax_income': 'flow',
+    'net_income': 'flow',
+    'net_income_owners': 'flow',
+    'operating_cash_flow': 'flow',
+    'total_assets': 'stock',
+    'current_assets': 'stock',
+    'non_current_assets': 'stock',
+    'total_liabilities': 'stock',
+    'current_liabilities': 'stock',
+    'non_current_liabilities': 'stock',
+    'total_equity': 'stock',
+    'equity_owners': 'stock',
+    'capital_stock': 'stock',
+    'retained_earnings': 'stock'
+}
+
+# XBRL 계정ID (전체 재무제표) -> 표준 항목
+account_id_map = {
+    'ifrs-full_Revenue': 'revenue',
+    'ifrs_Revenue': 'revenue',
+    'ifrs-full_GrossProfit': 'gross_profit',
+    'ifrs_GrossProfit': 'gross_profit',
+    'dart_OperatingIncomeLoss': 'operating_income',
+    'ifrs-full_ProfitLossBeforeTax': 'pretax_income',
+    'ifrs_ProfitLossBeforeTax': 'pretax_income',
+    'ifrs-full_ProfitLoss': 'net_income',
+    'ifrs_ProfitLoss': 'net_income',
+    'ifrs-full_ProfitLossAttributableToOwnersOfParent': 'net_income_owners',
+    'ifrs_ProfitLossAttributableToOwnersOfParent': 'net_income_owners',
+    'ifrs-full_CashFlowsFromUsedInOperatingActivities': 'operating_cash_flow',
+    'ifrs_CashFlowsFromUsedInOperatingActivities': 'operating_cash_flow',
+    'ifrs-full_Assets': 'total_assets',
+    'ifrs_Assets': 'total_assets',
+    'ifrs-full_CurrentAssets': 'current_assets',
+    'ifrs_CurrentAssets': 'current_assets',
+    'ifrs-full_NoncurrentAssets': 'non_current_assets',
+    'ifrs_NoncurrentAssets': 'non_current_assets',
+    'ifrs-full_Liabilities': 'total_liabilities',
+    'ifrs_Liabilities': 'total_liabilities',
+    'ifrs-full_CurrentLiabilities': 'current_liabilities',
+    'ifrs_CurrentLiabilities': 'current_liabilities',
+    'ifrs-full_NoncurrentLiabilities': 'non_current_liabilities',
+    'ifrs_NoncurrentLiabilities': 'non_current_liabilities',
+    'ifrs-full_Equity': 'total_equity',
+    'ifrs_Equity': 'total_equity',
+    'ifrs-full_EquityAttributableToOwnersOfParent': 'equity_owners',
+    'ifrs_EquityAttributableToOwnersOfParent': 'equity_owners',
+    'ifrs-full_IssuedCapital': 'capital_stock',
+    'ifrs_IssuedCapital': 'capital_stock',
+    'ifrs-full_RetainedEarnings': 'retained_earnings',
+    'ifrs_RetainedEarnings': 'retained_earnings'
+}
+
+# 계정명(공백 제거) -> 표준 항목 (주요계정 API는 계정ID가 없으므로 계정명으로 매핑)
+account_name_map = {
+    '매출액': 'revenue',
+    '수익(매출액)': 'revenue',
+    '영업수익': 'revenue',
+    '매출총이익': 'gross_profit',
+    '영업이익': 'operating_income',
+    '영업이익(손실)': 'operating_income',
+    '법인세차감전순이익': 'pretax_income',
+    '법인세비용차감전순이익': 'pretax_income',
+    '법인세비용차감전순이익(손실)': 'pretax_income',
+    '당기순이익': 'net_income',
+    '당기순이익(손실)': 'net_income',
+    '지배기업의소유주에게귀속되는당기순이익': 'net_income_owners',
+    '지배기업소유주지분순이익': 'net_income_owners',
+    '영업활동현금흐름': 'operating_cash_flow',
+    '영업활동으로인한현금흐름': 'operating_cash_flow',
+    '자산총계': 'total_assets',
+    '유동자산': 'current_assets',
+    '비유동자산': 'non_current_assets',
+    '부채총계': 'total_liabilities',
+    '유동부채': 'current_liabilities',
+    '비유동부채': 'non_current_liabilities',
+    '자본총계': 'total_equity',
+    '지배기업의소유주에게귀속되는자본': 'equity_owners',
+    '자본금': 'capital_stock',
+    '이익잉여금': 'retained_earnings',
+    '이익잉여금(결손금)': 'retained_earnings'
+}
+
+# 비율명 -> (분자, 분모), 분자/분모가 flow 항목이면 TTM 값을 사용
+ratio_definitions = {
+    'gross_margin': ('gross_profit', 'revenue'),
+    'operating_margin': ('operating_income', 'revenue'),
+    'net_margin': ('net_income', 'revenue'),
+    'roe': ('net_income', 'total_equity'),
+    'roa': ('net_income', 'total_assets'),
+    'debt_ratio': ('total_liabilities', 'total_equity'),
+    'current_ratio': ('current_assets', 'current_liabilities'),
+    'equity_ratio': ('total_equity', 'total_assets'),
+    'ocf_to_net_income': ('operating_cash_flow', 'net_income')
+}
+
+growth_items = ['revenue', 'operating_income', 'net_income']
+
+
+def _toFloat(series: pd.Series) -> np.ndarray:
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        series = series.astype('string').str.strip()
+        series = series.str.replace(',', '', regex=False).str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+        series = series.mask(series.isin(['-', '']))
+    return pd.to_numeric(series, errors='coerce').astype('Float64').to_numpy(dtype='float64', na_value=np.nan)
+
+
+def mapCanonicalItems(df: pd.DataFrame) -> pd.Series:
+    """
+    계정ID(있으면 우선) 또는 계정명을 표준 항목명으로 매핑 (매핑되지 않으면 NaN)
+    """
+    names = df['account_nm'].astype('string').str.replace(' ', '', regex=False)
+    item = names.map(account_name_map).astype(object)
+    if 'account_id' in df.columns:
+        by_id = df['account_id'].astype(object).map(account_id_map)
+        item = by_id.where(by_id.notna(), item)
+    return item
+
+
+def computeFinancialMetrics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    정기보고서 재무정보(원본 필드명, long-format)로부터 분기 단독 값, TTM, 재무비율, 전년동기 대비 성장률 계산
+    모든 회사를 (회사/개별연결구분) x (연도 x 분기) 2차원 배열로 펼쳐 한 번에 계산한다
+
+    손익/현금흐름 항목은 보고서별 누적값(1분기 3개월, 반기 6개월, 3분기 9개월, 사업보고서 12개월)을
+    차분해 분기 단독 값으로 변환하고 최근 4개 분기를 합산해 TTM을 구한다
+
+    :param df: corp_code, bsns_year, reprt_code, account_nm, thstrm_amount (+ account_id, fs_div, thstrm_add_amount)
+    :return: pandas DataFrame, index = (corp_code, fs_div, bsns_year, quarter)
+    """
+    df = df[df['reprt_code'].astype(str).isin(quarter_of_report.keys())]
+    item = mapCanonicalItems(df)
+    mask = item.notna().to_numpy()
+    df = df[mask]
+    item = item[mask].to_numpy()
+    if len(df) == 0:
+        return pd.DataFrame()
+
+    fs_div = df['fs_div'].astype(object).to_numpy() if 'fs_div' in df.columns else np.full(len(df), 'CFS', dtype=object)
+    entity_keys = pd.MultiIndex.from_arrays([df['corp_code'].astype(object).to_numpy(), fs_div])
+    entity_codes, entities = pd.factorize(entity_keys)
+    years = pd.to_numeric(df['bsns_year'], errors='coerce').astype(int).to_numpy()
+    quarters = df['reprt_code'].astype(str).map(quarter_of_report).to_numpy().astype(int)
+    year_min = years.min()
+    year_count = years.max() - year_min + 1
+    t_index = (years - year_min) * 4 + quarters - 1
+    amount = _toFloat(df['thstrm_amount'])
+    if 'thstrm_add_amount' in df.columns:
+        cum_amount = _toFloat(df['thstrm_add_amount'])
+    else:
+        cum_amount = np.full(len(df), np.nan)
+    shape = (len(entities), year_count * 4)
+    quarter_of_t = np.tile(np.arange(1, 5), year_count)
+
+    values = dict()
+    for name, kind in canonical_items.items():
+        sel = item == name
+        if not sel.any():
+            continue
+        e_idx, t_idx = entity_codes[sel], t_index[sel]
+        point = np.full(shape, np.nan)
+        point[e_idx[::-1], t_idx[::-1]] = amount[sel][::-1]  # 중복 시 먼저 나온 행 사용
+        if kind == 'stock':
+            values[name] = point
+            continue
+        cum = np.full(shape, np.nan)
+        cum[e_idx[::-1], t_idx[::-1]] = cum_amount[sel][::-1]
+        # 사업보고서의 당기금액은 12개월 누적, 1분기는 누적 = 3개월
+        cum[:, quarter_of_t == 4] = point[:, quarter_of_t == 4]
+        q1 = quarter_of_t == 1
+        cum[:, q1] = np.where(np.isnan(cum[:, q1]), point[:, q1], cum[:, q1])
+        # 누적금액이 없는 반기/3분기는 직전 누적값 + 당기금액(3개월)으로 보완
+        for quarter in (2, 3):
+            cur, prev = quarter_of_t == quarter, quarter_of_t == quarter - 1
+            cum[:, cur] = np.where(np.isnan(cum[:, cur]), cum[:, prev] + point[:, cur], cum[:, cur])
+        prev_cum = np.concatenate([np.full((shape[0], 1), np.nan), cum[:, :-1]], axis=1)
+        standalone = np.where(q1, cum, cum - prev_cum)
+        standalone = np.where(np.isnan(standalone) & (quarter_of_t < 4), point, standalone)
+        ttm = np.full(shape, np.nan)
+        if shape[1] >= 4:
+            ttm[:, 3:] = np.lib.stride_tricks.sliding_window_view(standalone, 4, axis=1).sum(axis=2)
+        # 분기 데이터 없이 사업보고서만 있는 경우 연간 값이 곧 TTM
+        ttm = np.where(np.isnan(ttm) & (quarter_of_t == 4), cum, ttm)
+        values[name] = standalone
+        values[name + '_ttm'] = ttm
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for ratio, (numerator, denominator) in ratio_definitions.items():
+            num = values.get(numerator + '_ttm', values.get(numerator))
+            den = values.get(denominator + '_ttm', values.get(denominator))
+            if num is None or den is None:
+                continue
+            values[ratio] = np.where(den != 0, num / den, np.nan)
+        for name in growth_items:
+            ttm = values.get(name + '_ttm')
+            if ttm is None:
+                continue
+            growth = np.full(shape, np.nan)
+            base = ttm[:, :-4]
+            growth[:, 4:] = np.where(base != 0, ttm[:, 4:] / np.abs(base) - np.sign(base), np.nan)
+            values[name + '_yoy'] = growth
+
+    corp_codes = entities.get_level_values(0).to_numpy()
+    fs_divs = entities.get_level_values(1).to_numpy()
+    index = pd.MultiIndex.from_arrays([
+        np.repeat(corp_codes, shape[1]),
+        np.repeat(fs_divs, shape[1]),
+        np.tile(np.repeat(np.arange(year_min, year_min + year_count), 4), shape[0]),
+        np.tile(quarter_of_t, shape[0])
+    ], names=['corp_code', 'fs_div', 'bsns_year', 'quarter'])
+    df_result = pd.DataFrame({k: v.ravel() for k, v in values.items()}, index=index)
+    # 어떤 보고서도 존재하지 않는 기간은 제외
+    observed = np.zeros(shape, dtype=bool)
+    observed[entity_codes, t_index] = True
+    df_result = df_result[observed.ravel()]
+    df_result.insert(0, 'reprt_code', df_result.index.get_level_values('quarter').map(report_of_quarter))
+    return df_result
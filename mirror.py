@@ -0,0 +1,307 @@
+# Author: Yogyui
+import re
+import time
+import sqlite3
+import datetime
+import threading
+import pandas as pd
+from typing import List, Iterable, Tuple
+
+
+search_fields = ['corp_code', 'corp_name', 'stock_code', 'corp_cls', 'report_nm', 'rcept_no', 'flr_nm', 'rcept_dt', 'rm']
+filing_fields = ['rcept_no', 'corp_code', 'corp_name', 'stock_code', 'corp_cls', 'report_nm', 'flr_nm', 'rcept_dt', 'rm']
+corporation_fields = ['corp_code', 'corp_name', 'stock_code', 'modify_date']
+last_report_filter = 'last_reprt_at=Y'  # 최종보고서만 검색한 조건 (filter key에 포함되는 요청 인자)
+regexReportTags = re.compile(r"^(\[[^\]]*\]\s*)+")  # 보고서명 앞의 [기재정정], [첨부정정] 등
+company_fields = [
+    'corp_code', 'corp_name', 'corp_name_eng', 'stock_name', 'stock_code', 'ceo_nm', 'corp_cls', 'jurir_no', 'bizr_no',
+    'adres', 'hm_url', 'ir_url', 'phn_no', 'fax_no', 'induty_code', 'est_dt', 'acc_mt'
+]
+
+
+class MetadataMirror:
+    """
+    공시검색 결과(filings), 고유번호 목록(corporations), 기업개황(companies)의 로컬 sqlite 사본
+    API 응답이 들어올 때마다 증분 갱신되며, 자주 쓰는 조회 조건(고유번호, 접수일자, 공시상세유형, 업종코드)에 인덱스를 둔다
+    (list.json 응답에는 공시유형이 없으므로 공시유형을 지정해 검색한 경우에만 해당 값을 기록한다)
+
+    공시검색 조건(filter key)별로 조회를 완료한 접수일자 구간(coverage)과 각 조건에 해당하는 접수번호를 함께 기록해
+    같은 조건의 검색은 아직 조회하지 않은 구간만 API로 요청할 수 있다
+    최종보고서만 검색한 조건은 나중에 정정 공시가 접수되면 결과가 바뀌므로, 정정 공시가 기록될 때 원본으로 보이는
+    공시(같은 회사, 같은 보고서명, 이전 접수번호 중 가장 최근)의 접수일을 조회 완료 구간에서 제외해 다시 조회하도록 한다
+    """
+    def __init__(self, path_db: str):
+        self._path_db = path_db
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path_db, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS filings (
+                {', '.join([x + ' TEXT' + (' PRIMARY KEY' if x == 'rcept_no' else '') for x in filing_fields])},
+                pblntf_ty TEXT,
+                pblntf_detail_ty TEXT,
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_filings_corp ON filings (corp_code, rcept_dt);
+            CREATE INDEX IF NOT EXISTS idx_filings_date ON filings (rcept_dt);
+            CREATE INDEX IF NOT EXISTS idx_filings_detail ON filings (pblntf_detail_ty, rcept_dt);
+            CREATE TABLE IF NOT EXISTS corporations (
+                {', '.join([x + ' TEXT' + (' PRIMARY KEY' if x == 'corp_code' else '') for x in corporation_fields])},
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_corporations_stock ON corporations (stock_code);
+            CREATE TABLE IF NOT EXISTS companies (
+                {', '.join([x + ' TEXT' + (' PRIMARY KEY' if x == 'corp_code' else '') for x in company_fields])},
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_companies_induty ON companies (induty_code);
+            CREATE INDEX IF NOT EXISTS idx_companies_cls ON companies (corp_cls);
+            CREATE TABLE IF NOT EXISTS coverage (
+                filter_key TEXT NOT NULL,
+                date_begin TEXT NOT NULL,
+                date_end TEXT NOT NULL,
+                PRIMARY KEY (filter_key, date_begin)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS filing_filters (
+                filter_key TEXT NOT NULL,
+                rcept_no TEXT NOT NULL,
+                PRIMARY KEY (filter_key, rcept_no)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _upsert(self, table: str, fields: List[str], records: Iterable[dict], extra: dict = None, where: str = ''):
+        extra = extra or dict()
+        columns = fields + list(extra.keys()) + ['updated_at']
+        updates = [f"{x}=excluded.{x}" for x in fields[1:]]
+        # 공시유형 등 추가 필드는 값이 있을 때만 갱신
+        updates += [f"{x}=COALESCE(excluded.{x}, {table}.{x})" for x in extra.keys()]
+        updates += ["updated_at=excluded.updated_at"]
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))}) " \
+              f"ON CONFLICT({fields[0]}) DO UPDATE SET {', '.join(updates)} {where}"
+        now = time.time()
+        rows = [tuple([x.get(k) for k in fields] + list(extra.values()) + [now]) for x in records]
+        if len(rows) == 0:
+            return 0
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(sql, rows)
+        return len(rows)
+
+    def upsertFilings(
+            self, records: List[dict], pblntf_ty: str = None, pblntf_detail_ty: str = None, filter_key: str = None
+    ) -> int:
+        """
+        :param records: list.json 응답의 list 레코드
+        :param pblntf_ty: 검색 시 지정한 공시유형
+        :param pblntf_detail_ty: 검색 시 지정한 공시상세유형
+        :param filter_key: 검색 조건 (지정 시 해당 조건의 검색 결과로 기록)
+        """
+        extra = {'pblntf_ty': pblntf_ty, 'pblntf_detail_ty': pblntf_detail_ty}
+        count = self._upsert('filings', filing_fields, records, extra)
+        if filter_key is not None and count > 0:
+            with self._lock:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO filing_filters (filter_key, rcept_no) VALUES (?, ?)",
+                        [(filter_key, x.get('rcept_no')) for x in records])
+        corrections = [x for x in records if '정정' in self._getReportTags(x.get('report_nm'))]
+        if len(corrections) > 0:
+            self._reopenSupersededCoverage(corrections)
+        return count
+
+    @staticmethod
+    def _getReportTags(report_nm: str) -> str:
+        match = regexReportTags.match(report_nm or '')
+        return match.group(0) if match is not None else ''
+
+    @staticmethod
+    def _stripReportTags(report_nm: str) -> str:
+        return regexReportTags.sub('', report_nm or '').strip()
+
+    def _reopenSupersededCoverage(self, corrections: List[dict]):
+        # 정정 공시의 원본 후보 접수일을 최종보고서 검색 조건들의 조회 완료 구간에서 제외
+        # (보고서명만으로는 원본을 확정할 수 없으므로 기록을 지우지 않고 해당 일자를 다시 조회하게 한다)
+        # 같은 이름으로 반복되는 공시(주요사항보고서, 소유상황보고서 등)가 많으므로 가장 최근의 같은 이름 공시만 대상으로 한다
+        with self._lock:
+            dates = set()
+            for record in corrections:
+                name = self._stripReportTags(record.get('report_nm'))
+                cursor = self._conn.execute(
+                    "SELECT rcept_dt, report_nm FROM filings WHERE corp_code=? AND rcept_no < ? "
+                    "ORDER BY rcept_dt DESC, rcept_no DESC", (record.get('corp_code'), record.get('rcept_no')))
+                for rcept_dt, report_nm in cursor:
+                    if rcept_dt and self._stripReportTags(report_nm) == name:
+                        dates.add(rcept_dt)
+                        break
+            if len(dates) == 0:
+                return
+            with self._conn:
+                for date in sorted(dates):
+                    rows = self._conn.execute(
+                        "SELECT filter_key, date_begin, date_end FROM coverage "
+                        "WHERE filter_key LIKE ? AND date_begin <= ? AND date_end >= ?",
+                        (f'%{last_report_filter}%', date, date)).fetchall()
+                    day = self._parseDate(date)
+                    before = (day - datetime.timedelta(days=1)).strftime('%Y%m%d')
+                    after = (day + datetime.timedelta(days=1)).strftime('%Y%m%d')
+                    for filter_key, date_begin, date_end in rows:
+                        self._conn.execute(
+                            "DELETE FROM coverage WHERE filter_key=? AND date_begin=?", (filter_key, date_begin))
+                        if date_begin <= before:
+                            self._conn.execute(
+                                "INSERT INTO coverage (filter_key, date_begin, date_end) VALUES (?, ?, ?)",
+                                (filter_key, date_begin, before))
+                        if after <= date_end:
+                            self._conn.execute(
+                                "INSERT INTO coverage (filter_key, date_begin, date_end) VALUES (?, ?, ?)",
+                                (filter_key, after, date_end))
+
+    def clearFilterRange(self, filter_key: str, date_begin: str, date_end: str):
+        """
+        해당 검색 조건으로 기록된 접수일자 구간의 공시 기록 삭제 (구간 전체를 다시 조회해 교체하기 전에 호출)
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM filing_filters WHERE filter_key=? AND rcept_no IN "
+                    "(SELECT rcept_no FROM filings WHERE rcept_dt >= ? AND rcept_dt <= ?)",
+                    (filter_key, date_begin, date_end))
+
+    def upsertCorporations(self, records: Iterable[dict]) -> int:
+        # 최종변경일자가 바뀐 회사만 갱신
+        where = "WHERE excluded.modify_date IS NOT corporations.modify_date"
+        return self._upsert('corporations', corporation_fields, records, where=where)
+
+    def upsertCompanies(self, records: Iterable[dict]) -> int:
+        return self._upsert('companies', company_fields, records)
+
+    def getCount(self, table: str) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def getCompanyUpdateTimes(self) -> dict:
+        with self._lock:
+            return dict(self._conn.execute("SELECT corp_code, updated_at FROM companies").fetchall())
+
+    def getListedCorpCodes(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT corp_code FROM corporations WHERE stock_code IS NOT NULL AND TRIM(stock_code) != ''").fetchall()
+        return [x[0] for x in rows]
+
+    def _query(self, sql: str, params: list) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self._conn, params=params)
+
+    def queryFilings(
+            self, corp_code: str = None, date_begin: str = None, date_end: str = None, pblntf_ty: str = None,
+            pblntf_detail_ty: str = None, corp_cls: str = None, limit: int = None
+    ) -> pd.DataFrame:
+        """
+        :param date_begin: 접수일자 시작 (YYYYMMDD)
+        :param date_end: 접수일자 종료 (YYYYMMDD)
+        :return: 원본 필드명의 DataFrame (접수일자, 접수번호 내림차순)
+        """
+        conditions, params = [], []
+        for column, op, value in [('corp_code', '=', corp_code), ('rcept_dt', '>=', date_begin),
+                                  ('rcept_dt', '<=', date_end), ('pblntf_ty', '=', pblntf_ty),
+                                  ('pblntf_detail_ty', '=', pblntf_detail_ty), ('corp_cls', '=', corp_cls)]:
+            if value is not None:
+                conditions.append(f"{column} {op} ?")
+                params.append(value)
+        sql = f"SELECT {', '.join(filing_fields)}, pblntf_ty, pblntf_detail_ty FROM filings"
+        if len(conditions) > 0:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY rcept_dt DESC, rcept_no DESC"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self._query(sql, params)
+
+    def queryCompanies(self, induty_code: str = None, corp_cls: str = None, name: str = None) -> pd.DataFrame:
+        """
+        :param induty_code: 업종코드 (앞자리 일치, 예: '264' -> '2642', '26429' 포함)
+        :param corp_cls: 법인구분 (Y, K, N, E)
+        :param name: 회사명(정식명칭/종목명)에 포함된 문자열
+        :return: 원본 필드명의 DataFrame
+        """
+        conditions, params = [], []
+        if induty_code is not None:
+            conditions.append("induty_code >= ? AND induty_code < ?")
+            params.extend([induty_code, induty_code + '\uffff'])
+        if corp_cls is not None:
+            conditions.append("corp_cls = ?")
+            params.append(corp_cls)
+        if name is not None:
+            conditions.append("(INSTR(corp_name, ?) > 0 OR INSTR(stock_name, ?) > 0)")
+            params.extend([name, name])
+        sql = f"SELECT {', '.join(company_fields)} FROM companies"
+        if len(conditions) > 0:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY corp_code"
+        return self._query(sql, params)
+
+    @staticmethod
+    def _parseDate(value: str) -> datetime.date:
+        return datetime.datetime.strptime(value, '%Y%m%d').date()
+
+    def getUncoveredRanges(self, filter_key: str, date_begin: str, date_end: str) -> List[Tuple[str, str]]:
+        """
+        [date_begin, date_end] 구간 중 해당 검색 조건으로 아직 조회하지 않은 구간 리스트 (YYYYMMDD)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date_begin, date_end FROM coverage WHERE filter_key=? AND date_end >= ? AND date_begin <= ? "
+                "ORDER BY date_begin", (filter_key, date_begin, date_end)).fetchall()
+        result = []
+        cursor = self._parseDate(date_begin)
+        end = self._parseDate(date_end)
+        for begin_covered, end_covered in rows:
+            begin_covered, end_covered = self._parseDate(begin_covered), self._parseDate(end_covered)
+            if begin_covered > cursor:
+                result.append((cursor, min(end, begin_covered - datetime.timedelta(days=1))))
+            cursor = max(cursor, end_covered + datetime.timedelta(days=1))
+            if cursor > end:
+                break
+        if cursor <= end:
+            result.append((cursor, end))
+        return [(x.strftime('%Y%m%d'), y.strftime('%Y%m%d')) for x, y in result]
+
+    def addCoverage(self, filter_key: str, date_begin: str, date_end: str):
+        """
+        조회를 완료한 구간 추가 (겹치거나 인접한 구간은 하나로 병합)
+        """
+        begin, end = self._parseDate(date_begin), self._parseDate(date_end)
+        lower = (begin - datetime.timedelta(days=1)).strftime('%Y%m%d')
+        upper = (end + datetime.timedelta(days=1)).strftime('%Y%m%d')
+        with self._lock:
+            with self._conn:
+                rows = self._conn.execute(
+                    "SELECT date_begin, date_end FROM coverage WHERE filter_key=? AND date_end >= ? AND date_begin <= ?",
+                    (filter_key, lower, upper)).fetchall()
+                for begin_covered, end_covered in rows:
+                    date_begin = min(date_begin, begin_covered)
+                    date_end = max(date_end, end_covered)
+                self._conn.execute(
+                    "DELETE FROM coverage WHERE filter_key=? AND date_end >= ? AND date_begin <= ?",
+                    (filter_key, lower, upper))
+                self._conn.execute(
+                    "INSERT INTO coverage (filter_key, date_begin, date_end) VALUES (?, ?, ?)",
+                    (filter_key, date_begin, date_end))
+
+    def queryCoveredFilings(self, filter_key: str, date_begin: str, date_end: str) -> List[dict]:
+        """
+        해당 검색 조건으로 기록된 공시 레코드 (list.json 응답과 같은 필드 순서, 접수일자/접수번호 내림차순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(['f.' + x for x in search_fields])} FROM filing_filters AS m "
+                f"JOIN filings AS f ON f.rcept_no = m.rcept_no "
+                f"WHERE m.filter_key=? AND f.rcept_dt >= ? AND f.rcept_dt <= ? "
+                f"ORDER BY f.rcept_dt DESC, f.rcept_no DESC", (filter_key, date_begin, date_end)).fetchall()
+        return [dict(zip(search_fields, x)) for x in rows]
@@ -5,6 +5,8 @@ import re
 import time
 import shutil
 import pickle
+import functools
+import threading
 import zipfile
 import datetime
 import requests
@@ -13,14 +15,33 @@ import urllib.parse
 import pandas as pd
 import logging.handlers
 from enum import Enum, auto
+from collections import OrderedDict
 from lxml import etree, html
-from typing import List, Union, Tuple
+from typing import List, Union, Tuple, Iterator, Dict
 from requests_html import HTMLSession
 from config import OpenDartConfiguration
+from Util import decodeJson
+from cache import DocumentCacheManager, CacheEntryType, EvictionPolicy, ResponseCache
+from document import DartDocument, DocumentParseCache, parseDocumentRawFile, solveDocumentRawFileEncodingIssue
+from pipeline import DocumentPipeline, DocumentProcessResult
+from watcher import FilingWatcher
+from fulltext import FullTextIndex
+from mirror import MetadataMirror
+from xbrl import loadXbrlPackageFacts
+from executor import RequestExecutor, RateLimiter, BatchResult, AdaptiveConcurrencyLimiter
+from sink import ParquetDatasetSink
+from panel import FinancialCube, pivotFinancialPanel, screenFinancialPanel
+from metrics import computeFinancialMetrics
+from backend import ResultBackend, checkResultBackend, makeTableFromColumns, makeEmptyTable, convertResult, toPandas
+from endpoints import EndpointSpec, ParamShape, ResponseShape, endpoint_registry, ttl_periodic_report
 from define import *
 
 
 url_opendart = 'https://opendart.fss.or.kr/api/{}'
+max_multi_corp_count = 100  # 다중회사 주요계정 API 1회 호출 당 최대 회사 수
+corp_cls_codes = ['Y', 'K', 'N', 'E']  # 법인구분 (유가, 코스닥, 코넥스, 기타)
+_throttled_pattern = re.compile(rb'"status"\s*:\s*"020"|<status>020</status>')  # 요청 제한 초과 응답 (json, xml)
+report_period_end = {'11013': (3, 31), '11012': (6, 30), '11014': (9, 30), '11011': (12, 31)}  # 보고서 기준일
 
 
 def convertTagToDict(tag: etree.Element) -> dict:
@@ -30,6 +51,37 @@ def convertTagToDict(tag: etree.Element) -> dict:
     return conv
 
 
+_result_context = threading.local()  # 스레드 별 (공개 메서드 호출 깊이, 결과 backend)
+
+
+def returnsResult(func):
+    """
+    DataFrame을 반환하는 공개 메서드에 결과 backend 인자(backend=None, 기본값 = setResultBackend 설정값) 추가
+    가장 바깥쪽 호출에서만 결과를 변환하고, 내부에서 호출되는 다른 공개 메서드는 pandas DataFrame을 그대로 주고받는다
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, backend: Union[ResultBackend, str] = None, **kwargs):
+        depth = getattr(_result_context, 'depth', 0)
+        if depth > 0:
+            _result_context.depth = depth + 1
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _result_context.depth = depth
+        backend = ResultBackend(backend or self.getResultBackend())
+        if backend != ResultBackend.Pandas:
+            checkResultBackend(backend)
+        _result_context.depth = 1
+        _result_context.backend = backend
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            _result_context.depth = 0
+            _result_context.backend = None
+        return convertResult(result, backend)
+    return wrapper
+
+
 class ResponseException(Exception):
     def __init__(self, status_code: int, message: str):
         self.status_code = status_code
@@ -50,11 +102,22 @@ class ReportCode(Enum):
     ThirdQueater = '11014'
 
 
+class FinancialStatementDivision(Enum):
+    Consolidated = 'CFS'  # 연결재무제표
+    Separate = 'OFS'  # 재무제표
+
+
 class OpenDart:
     _df_corplist: pd.DataFrame = None
     _logger_console: logging.Logger
     _write_log_console_to_file: bool = False
     _rename_dataframe_column_names: bool = True
+    _typed_dataframe: bool = False
+    _fulltext_index: FullTextIndex = None
+    _financial_cube: FinancialCube = None
+    _response_cache: ResponseCache = None
+    _metadata_mirror: MetadataMirror = None
+    _search_coverage: bool = False
 
     def __init__(self, api_key: str = None):
         curpath = os.path.dirname(os.path.abspath(__file__))
@@ -70,10 +133,16 @@ class OpenDart:
         self._initLoggerConsole()
 
         self._config = OpenDartConfiguration()
+        self._cache = DocumentCacheManager(
+            self._path_data_dir, self._config.cache_max_bytes, self._config.cache_policy)
+        self._document_parse_cache = DocumentParseCache(self._path_data_dir)
+        self._rate_limiter = RateLimiter(self._config.max_requests_per_minute)
+        self._executor = RequestExecutor(self._config.max_workers)
+        self._concurrency_limiter = AdaptiveConcurrencyLimiter(self._config.max_workers)
 
         if api_key is not None:
             self.setApiKey(api_key)
-        self.loadCorporationDataFrame()
+        self.loadCorporationDataFrame(backend=ResultBackend.Pandas)
 
     def _initLoggerConsole(self):
         self._logger_console = logging.getLogger('opendart_console')
@@ -117,11 +186,176 @@ class OpenDart:
     def setEnableRenameDataframeColumnNames(self, enable: bool):
         self._rename_dataframe_column_names = enable
 
+    def isEnableTypedDataFrame(self) -> bool:
+        return self._typed_dataframe
+
+    def setEnableTypedDataFrame(self, enable: bool):
+        """
+        True = 금액/수량 열은 Int64, 비율 열은 Float64, 날짜 열은 datetime64, 코드 열은 category로 변환 (define.ColumnTypes)
+        False = 모든 열을 API 응답 그대로 문자열로 반환 (기본값)
+        """
+        self._typed_dataframe = enable
+
+    def isEnableFullTextIndex(self) -> bool:
+        return self._fulltext_index is not None
+
+    def setEnableFullTextIndex(self, enable: bool, storeBody: bool = True):
+        """
+        :param enable: 전문 색인 사용 여부
+        :param storeBody: 압축한 본문을 색인 파일에 함께 저장할 지 여부
+                          (False = 디스크 사용량이 줄지만 검색 결과 발췌가 비고 여러 토큰 검색어의 본문 확인을 생략)
+        """
+        if enable and self._fulltext_index is None:
+            self._fulltext_index = FullTextIndex(os.path.join(self._path_data_dir, 'FullTextIndex.db'), storeBody)
+        elif not enable and self._fulltext_index is not None:
+            self._fulltext_index.close()
+            self._fulltext_index = None
+
+    def isEnableResponseCache(self) -> bool:
+        return self._response_cache is not None
+
+    def setEnableResponseCache(self, enable: bool):
+        """
+        True = endpoints.py에 정의된 API와 재무정보 API의 응답을 유효기간 동안 로컬 sqlite 파일에 저장하고 재사용
+        """
+        if enable and self._response_cache is None:
+            self._response_cache = ResponseCache(os.path.join(self._path_data_dir, 'ResponseCache.db'))
+        elif not enable and self._response_cache is not None:
+            self._response_cache.close()
+            self._response_cache = None
+
+    def isEnableMetadataMirror(self) -> bool:
+        return self._metadata_mirror is not None
+
+    def setEnableMetadataMirror(self, enable: bool):
+        """
+        True = 공시검색 결과, 고유번호 목록, 기업개황 응답을 로컬 sqlite 파일(Data/MetadataMirror.db)에 누적
+        (queryLocalFilings, queryLocalCompanies로 API 요청 없이 조회)
+        """
+        if enable and self._metadata_mirror is None:
+            self._metadata_mirror = MetadataMirror(os.path.join(self._path_data_dir, 'MetadataMirror.db'))
+            if self._df_corplist is not None and self._metadata_mirror.getCount('corporations') == 0:
+                df = self._df_corplist.rename(columns={v: k for k, v in ColumnNames.corp_code.items()})
+                df['modify_date'] = pd.to_datetime(df['modify_date']).dt.strftime('%Y%m%d')
+                self._metadata_mirror.upsertCorporations(df.to_dict('records'))
+        elif not enable and self._metadata_mirror is not None:
+            self._metadata_mirror.close()
+            self._metadata_mirror = None
+
+    def isEnableSearchCoverage(self) -> bool:
+        return self._search_coverage and self._metadata_mirror is not None
+
+    def setEnableSearchCoverage(self, enable: bool):
+        """
+        True = 공시검색 조건 별로 조회를 완료한 접수일자 구간을 로컬 사본에 기록하고,
+        같은 조건의 검색은 조회하지 않은 구간만 API로 요청한 뒤 전체 결과를 로컬 사본에서 반환 (로컬 사본이 함께 활성화됨)
+        (당일은 이후 공시가 추가될 수 있으므로 조회 완료 구간으로 기록하지 않는다)
+        """
+        self._search_coverage = enable
+        if enable:
+            self.setEnableMetadataMirror(True)
+
+    def getImmutableReportCutoffDays(self) -> int:
+        return self._config.immutable_report_days
+
+    def setImmutableReportCutoffDays(self, days: int):
+        """
+        보고서 기준일(사업연도/보고서 코드 또는 검색종료일)로부터 days일이 지난 요청의 응답은 만료 없이 캐시
+        (searchDocument 결과에서 해당 회사의 [기재정정] 공시가 확인되면 그 이전에 저장된 응답은 삭제)
+        """
+        self._config.immutable_report_days = days
+        self._config.saveToLocalFile()
+
+    def getNoDataCacheTtl(self) -> int:
+        return self._config.no_data_cache_ttl
+
+    def setNoDataCacheTtl(self, seconds: int):
+        """
+        '조회된 데이타가 없습니다'(status 013) 응답을 캐시할 유효기간(초), 0이면 캐시하지 않음
+        (요청 제한 초과(020), 일시 사용 중지(800) 등의 오류 응답은 캐시하지 않는다)
+        """
+        self._config.no_data_cache_ttl = seconds
+        self._config.saveToLocalFile()
+
+    def getResultBackend(self) -> ResultBackend:
+        return ResultBackend(self._config.result_backend)
+
+    def setResultBackend(self, backend: Union[ResultBackend, str]):
+        """
+        공개 메서드의 결과 형식 (pandas DataFrame, pyarrow Table, polars DataFrame)
+        메서드 호출 시 backend 인자로 해당 호출만 다른 형식을 지정할 수 있다
+        """
+        backend = ResultBackend(backend)
+        checkResultBackend(backend)
+        self._config.result_backend = backend.value
+        self._config.saveToLocalFile()
+
+    @staticmethod
+    def _getCallBackend() -> ResultBackend:
+        # 가장 바깥쪽 공개 메서드 본문에서만 지정된 backend를 사용 (내부 호출, 작업 스레드는 pandas)
+        if getattr(_result_context, 'depth', 0) == 1:
+            return _result_context.backend
+        return ResultBackend.Pandas
+
+    def clearResponseCache(self, api: str = None):
+        if self._response_cache is None:
+            return
+        count = self._response_cache.clear(api.replace('.json', '') if api is not None else None)
+        self._log(f"removed {count} cached response(s)", LogType.Info)
+
+    def setMaxRequestsPerMinute(self, count: int):
+        self._config.max_requests_per_minute = count
+        self._config.saveToLocalFile()
+        self._rate_limiter.setMaxRequestsPerMinute(count)
+
+    def setMaxConcurrentRequests(self, count: int):
+        self._config.max_workers = count
+        self._config.saveToLocalFile()
+        self._executor.setMaxWorkers(count)
+        self._concurrency_limiter.setMaxLimit(count)
+
+    def getConcurrencyLimit(self) -> int:
+        """
+        현재 동시 요청 상한 (응답 지연 및 혼잡 신호에 따라 1 ~ max_workers 사이에서 자동 조정)
+        """
+        return self._concurrency_limiter.limit
+
+    def getConcurrencyMetrics(self) -> dict:
+        """
+        동시 요청 제어 지표 (limit, max_limit, in_flight, latency_baseline, requests, congestions, decreases)
+        """
+        return self._concurrency_limiter.getMetrics()
+
+    def setRequestTimeout(self, seconds: float):
+        self._config.request_timeout = seconds
+        self._config.saveToLocalFile()
+
+    def getCacheCapacity(self) -> int:
+        return self._cache.maxBytes
+
+    def setCacheCapacity(self, maxBytes: int):
+        self._config.cache_max_bytes = maxBytes
+        self._config.saveToLocalFile()
+        evicted = self._cache.setMaxBytes(maxBytes)
+        self._log(f"set cache capacity: {maxBytes} bytes (evicted {len(evicted)} item(s))", LogType.Command)
+
+    def getCacheEvictionPolicy(self) -> EvictionPolicy:
+        return self._cache.policy
+
+    def setCacheEvictionPolicy(self, policy: Union[EvictionPolicy, str]):
+        policy = EvictionPolicy(policy)
+        self._config.cache_policy = policy.value
+        self._config.saveToLocalFile()
+        self._cache.setPolicy(policy)
+
+    def getCacheUsage(self) -> int:
+        return self._cache.totalBytes
+
     def setApiKey(self, key: str):
         self._config.api_key = key
         self._log(f"set api key: {self._config.api_key}", LogType.Command)
         self._config.saveToLocalFile()
-        self.loadCorporationDataFrame()
+        self.loadCorporationDataFrame(backend=ResultBackend.Pandas)
 
     def _makeRequestParameter(self, **kwargs) -> dict:
         params: dict = {'crtfc_key': self._config.api_key}
@@ -155,6 +389,7 @@ class OpenDart:
             raise ResponseException(status_code, message)
 
     def clearDocumentFilesFromDataPath(self):
+        self._cache.clear([CacheEntryType.RawDocument, CacheEntryType.HtmlDocument])
         doc_extensions = ['.xml', '.html']
         files_in_datapath = os.listdir(self._path_data_dir)
         targets = list(filter(lambda x: os.path.splitext(x)[-1] in doc_extensions, files_in_datapath))
@@ -164,8 +399,26 @@ class OpenDart:
                 os.remove(filepath)
             self._log(f"removed {len(target_paths)} document files", LogType.Info)
 
+    def clearCachedFilesFromDataPath(self):
+        count = self._cache.clear()
+        self._log(f"removed {count} cached item(s) (documents, html, xbrl)", LogType.Info)
+
     def _requestWithParameters(self, url: str, params: dict) -> requests.Response:
-        response = requests.get(url, params=params)
+        self._rate_limiter.acquire()
+        started = self._concurrency_limiter.acquire()
+        congested = False
+        try:
+            response = requests.get(url, params=params, timeout=self._config.request_timeout)
+            # 5xx 응답 또는 요청 제한 초과(020) 응답은 혼잡 신호로 보고 동시 요청 상한을 줄인다
+            congested = response.status_code >= 500 or _throttled_pattern.search(response.content[:256]) is not None
+        except (requests.Timeout, requests.ConnectionError):
+            congested = True
+            raise
+        finally:
+            limit = self._concurrency_limiter.limit
+            self._concurrency_limiter.release(started, congested)
+            if self._concurrency_limiter.limit < limit:
+                self._log(f"concurrency limit decreased: {limit} -> {self._concurrency_limiter.limit}", LogType.Info)
         message = f"<status:{response.status_code}> "
         message += f"<elapsed:{response.elapsed.microseconds/1000}ms> "
         message += f"<url:{response.request.url}> "
@@ -180,7 +433,7 @@ class OpenDart:
     def _requestAndGetJson(self, url: str, **kwargs) -> dict:
         params = self._makeRequestParameter(**kwargs)
         resp = self._requestWithParameters(url, params)
-        return resp.json()
+        return decodeJson(resp.content)
 
     @staticmethod
     def _checkResponseStatus(json_obj: dict):
@@ -189,11 +442,169 @@ class OpenDart:
         if status != '000':
             raise ResponseException(int(status), message)
 
+    def _isImmutableReportPeriod(self, params: dict) -> bool:
+        if 'bsns_year' in params and params.get('reprt_code') in report_period_end:
+            month, day = report_period_end[params['reprt_code']]
+            period_end = datetime.date(int(params['bsns_year']), month, day)
+        elif 'end_de' in params:
+            period_end = datetime.datetime.strptime(params['end_de'], '%Y%m%d').date()
+        else:
+            return False
+        cutoff = datetime.date.today() - datetime.timedelta(days=self._config.immutable_report_days)
+        return period_end < cutoff
+
+    def _requestCachedJson(self, path: str, params: dict, ttl: float = None) -> dict:
+        """
+        응답 캐시를 거쳐 요청 (캐시 비활성화 시 그대로 요청)
+        기준일이 오래된(immutable) 보고서 기간의 응답은 ttl과 무관하게 만료 없이 저장하고,
+        데이터 없음(013) 응답은 no_data_cache_ttl 동안만 저장한다
+        """
+        if self._response_cache is None:
+            return self._requestAndGetJson(url_opendart.format(path), **params)
+        immutable = self._isImmutableReportPeriod(params)
+        if ttl is None and not immutable:
+            return self._requestAndGetJson(url_opendart.format(path), **params)
+        api = path.replace('.json', '')
+        key = ResponseCache.makeKey(api, params)
+        json = self._response_cache.get(key)
+        if json is not None:
+            self._log(f"response cache hit: {key} (status: {json.get('status')})", LogType.Info)
+            return json
+        json = self._requestAndGetJson(url_opendart.format(path), **params)
+        status = json.get('status')
+        if status == '000':
+            self._response_cache.put(key, api, json, None if immutable else ttl, params.get('corp_code'))
+        elif status == '013' and self._config.no_data_cache_ttl > 0:
+            # 데이터 없음 응답은 기준일과 무관하게 별도 유효기간으로만 저장 (이후 공시될 수 있음)
+            self._response_cache.put(key, api, json, self._config.no_data_cache_ttl, params.get('corp_code'))
+        return json
+
+    def _invalidateCorrectedReports(self, records: List[dict]):
+        # 정정 공시([기재정정])가 접수된 회사는 접수일 이전에 저장된 응답 캐시(immutable 포함)를 삭제
+        if self._response_cache is None:
+            return
+        corrected = {(x.get('corp_code'), x.get('rcept_dt')) for x in records if '[기재정정]' in (x.get('report_nm') or '')}
+        for corp_code, rcept_dt in sorted(corrected):
+            before = datetime.datetime.strptime(str(rcept_dt), '%Y%m%d') + datetime.timedelta(days=1)
+            count = self._response_cache.invalidateCorp(corp_code, before.timestamp())
+            if count > 0:
+                self._log(f"invalidated {count} cached response(s) of {corp_code} (correction {rcept_dt})",
+                          LogType.Info)
+
+    def _runBatch(self, func, keys: List[tuple], maxWorkers: int = None) -> List[BatchResult]:
+        def call(*args):
+            # 작업 스레드에서 호출한 공개 메서드도 pandas DataFrame 반환
+            # (작업자가 1개이면 호출한 스레드에서 바로 실행되므로 바깥쪽 호출의 깊이를 복원한다)
+            depth = getattr(_result_context, 'depth', 0)
+            _result_context.depth = depth + 1 if depth > 0 else 2
+            try:
+                return func(*args)
+            finally:
+                _result_context.depth = depth
+
+        results = self._executor.run(call, keys, maxWorkers)
+        failures = [x for x in results if not x.success]
+        for failure in failures:
+            self._log(f"batch request failed {failure.key} - {failure.exception}", LogType.Error)
+        return results
+
+    def _concatDataFrames(self, frames: List[pd.DataFrame], col_names: dict) -> pd.DataFrame:
+        frames = [x for x in frames if x is not None and len(x) > 0]
+        if len(frames) == 0:
+            df_result = self._createEmptyDataFrame(col_names)
+            if not self._rename_dataframe_column_names:
+                df_result.columns = list(col_names.keys())
+            return df_result
+        return pd.concat(frames, ignore_index=True)
+
+    def _convertColumnTypes(self, df: pd.DataFrame, col_names: dict, dtypes: dict = None) -> pd.DataFrame:
+        if not self._typed_dataframe or len(df) == 0:
+            return df
+        # 이름이 변경된 열은 원본 필드명으로 스키마를 찾는다
+        raw_names = {v: k for k, v in col_names.items()} if self._rename_dataframe_column_names else dict()
+        return self._applyColumnTypes(df, raw_names, dtypes)
+
+    @staticmethod
+    def _getColumnKind(key: str, dtypes: dict = None) -> Union[str, None]:
+        if dtypes is not None and key in dtypes:
+            return dtypes[key]
+        if key in ColumnTypes.amount:
+            return 'amount'
+        elif key in ColumnTypes.ratio:
+            return 'ratio'
+        elif key in ColumnTypes.integer:
+            return 'integer'
+        elif key in ColumnTypes.date:
+            return 'date'
+        elif key in ColumnTypes.category:
+            return 'category'
+        return None
+
+    @staticmethod
+    def _convertColumnValues(values: Union[pd.Series, list], kind: str, key: str) -> pd.Series:
+        if kind in ['amount', 'ratio', 'integer']:
+            values = pd.Series(values, dtype='string').str.strip()
+            values = values.str.replace(',', '', regex=False).str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+            numbers = pd.to_numeric(values.mask(values.isin(['-', ''])), errors='coerce')
+            if kind != 'ratio' and bool((numbers.dropna() % 1 == 0).all()):
+                return numbers.astype('Int64')
+            return numbers.astype('Float64')
+        elif kind == 'date':
+            return pd.to_datetime(pd.Series(values), format=ColumnTypes.date.get(key, '%Y%m%d'), errors='coerce')
+        elif kind == 'category':
+            return pd.Series(values).astype('category')
+        return pd.Series(values)
+
+    @staticmethod
+    def _applyColumnTypes(df: pd.DataFrame, raw_names: dict = None, dtypes: dict = None) -> pd.DataFrame:
+        raw_names = raw_names or dict()
+        for col in df.columns:
+            key = raw_names.get(col, col)
+            kind = OpenDart._getColumnKind(key, dtypes)
+            if kind is not None:
+                df[col] = OpenDart._convertColumnValues(df[col], kind, key).to_numpy() \
+                    if kind != 'category' else df[col].astype('category')
+        return df
+
+    def _makeDataFrameFromRecords(
+            self, records: List[dict], col_names: dict, dtypes: dict = None, backend: ResultBackend = None
+    ) -> pd.DataFrame:
+        """
+        레코드(dict) 리스트를 열 단위 배열로 모아 최종 열 이름(이름 변경, typed 변환 적용)으로 DataFrame을 바로 생성
+        (DataFrame(list of dict) -> rename -> 형 변환 과정의 중간 객체와 복사를 생략)
+        backend가 pyarrow/polars면 pandas DataFrame을 거치지 않고 열 배열로부터 바로 해당 객체를 생성
+        """
+        backend = backend or ResultBackend.Pandas
+        if not records:
+            return makeTableFromColumns(dict(), backend)
+        first = records[0].keys()
+        keys = list(first)
+        if any([x.keys() != first for x in records]):  # 필드 구성이 다른 레코드가 섞여 있으면 합집합 사용
+            keys = list(dict.fromkeys([k for x in records for k in x.keys()]))
+        columns = dict()
+        for key in keys:
+            values = [x.get(key) for x in records]
+            name = col_names.get(key, key) if self._rename_dataframe_column_names else key
+            kind = self._getColumnKind(key, dtypes) if self._typed_dataframe else None
+            columns[name] = self._convertColumnValues(values, kind, key).array if kind is not None else values
+        return makeTableFromColumns(columns, backend)
+
+    def _normalizeDataFrameForStore(self, df: pd.DataFrame, col_names: dict) -> pd.DataFrame:
+        # 로컬 저장소에는 설정과 무관하게 원본 필드명 + typed 열로 저장
+        df = df.copy()
+        if self._rename_dataframe_column_names:
+            df.rename(columns={v: k for k, v in col_names.items()}, inplace=True)
+        if not self._typed_dataframe:
+            df = self._applyColumnTypes(df)
+        return df
+
     @staticmethod
-    def _createEmptyDataFrame(column_names: Union[List[str], dict]) -> pd.DataFrame:
+    def _createEmptyDataFrame(column_names: Union[List[str], dict], backend: ResultBackend = None) -> pd.DataFrame:
         df_result = pd.DataFrame()
         if isinstance(column_names, dict):
             column_names = list(column_names.values())
+        if backend is not None and backend != ResultBackend.Pandas:
+            return makeEmptyTable(column_names, backend)
         for name in column_names:
             df_result[name] = None
         return df_result
@@ -228,6 +639,8 @@ class OpenDart:
             root = tree.getroot()
             tags_list = root.findall('list')  # convert all <list> tag child to dict object
             tags_list_dict = [convertTagToDict(x) for x in tags_list]
+            if self._metadata_mirror is not None:
+                self._metadata_mirror.upsertCorporations(tags_list_dict)
             self._df_corplist = pd.DataFrame(tags_list_dict)
             if removeFile:
                 os.remove(path_file)
@@ -246,10 +659,12 @@ class OpenDart:
 
     """ 공시정보 API """
 
+    @returnsResult
     def searchDocument(
             self, corpCode: str = None, dateEnd: Union[str, datetime.date] = datetime.datetime.now().date(),
             dateBegin: Union[str, datetime.date] = None, onlyLastReport: bool = True, pageNumber: int = 1,
-            pageCount: int = 100, pbType: str = None, pbTypeDetail: str = None, recursive: bool = False
+            pageCount: int = 100, pbType: str = None, pbTypeDetail: str = None,
+            corpCls: Union[str, List[str]] = None, recursive: bool = False
     ) -> pd.DataFrame:
         """
         https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS001&apiId=2019001
@@ -264,11 +679,61 @@ class OpenDart:
         :param pageCount: 페이지당 건수, 기본값 = 100 (범위 = 1 ~ 100)
         :param pbType: 공시유형 (define -> dict_pblntf_ty 참고)
         :param pbTypeDetail: 공시유형 (define -> dict_pblntf_detail_ty 참고)
+        :param corpCls: 법인구분 (define -> dict_corp_cls 참고, Y = 유가, K = 코스닥, N = 코넥스, E = 기타)
+                        리스트로 지정하면 법인구분 별로 나누어 동시에 요청한 뒤 접수일자/접수번호 내림차순으로 병합
         :param recursive: 메서드 내부에서의 재귀적 호출인지 여부 (여러 페이지의 레코드를 모두 병합)
         :return: pandas DataFrame
         """
         self._log("search document", LogType.Command)
+        classes = [corpCls] if isinstance(corpCls, str) else list(dict.fromkeys(corpCls or []))
+        unknown = [x for x in classes if x not in corp_cls_codes]
+        if len(unknown) > 0:
+            raise ValueError(f"unknown corp class: {unknown}")
+        params = self._makeSearchDocumentParameters(
+            corpCode, dateEnd, dateBegin, onlyLastReport, pageNumber, pageCount, pbType, pbTypeDetail,
+            classes[0] if len(classes) == 1 else None)
+        if len(classes) > 1:
+            keys = [(dict(params, corp_cls=x), pbType, pbTypeDetail, recursive) for x in classes]
+            results = [x.result for x in self._runBatch(self._collectSearchDocumentRecords, keys) if x.success]
+            results = [x for x in results if x is not None]
+            records = None
+            if len(results) > 0:
+                records = [x for result in results for x in result]
+                records.sort(key=lambda x: (x.get('rcept_dt') or '', x.get('rcept_no') or ''), reverse=True)
+        else:
+            records = self._collectSearchDocumentRecords(params, pbType, pbTypeDetail, recursive)
+        if not records:  # 오류 혹은 조회 완료 구간에 공시가 없는 경우 모두 열 구성이 같은 빈 DataFrame
+            return self._createEmptyDataFrame(ColumnNames.search_document, self._getCallBackend())
+        return self._makeDataFrameFromRecords(records, ColumnNames.search_document, backend=self._getCallBackend())
+
+    def _collectSearchDocumentRecords(
+            self, params: dict, pbType: str = None, pbTypeDetail: str = None, recursive: bool = False
+    ) -> Union[List[dict], None]:
+        # 여러 페이지의 레코드를 모아 반환 (마지막에 한 번만 DataFrame 생성), 첫 페이지부터 오류이면 None
+        if self.isEnableSearchCoverage() and not recursive and params['page_no'] == 1:
+            return self._searchDocumentWithCoverage(params, pbType, pbTypeDetail)
+        records = []
+        try:
+            for page_records in self._iterSearchDocumentPages(params, allPages=not recursive):
+                records.extend(page_records)
+        except ResponseException as e:
+            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            if len(records) == 0:
+                return None
+        self._invalidateCorrectedReports(records)
+        if self._metadata_mirror is not None:
+            self._metadata_mirror.upsertFilings(records, pbType, pbTypeDetail)
+        return records
+
+    @staticmethod
+    def _makeSearchDocumentParameters(
+            corpCode: str = None, dateEnd: Union[str, datetime.date] = None, dateBegin: Union[str, datetime.date] = None,
+            onlyLastReport: bool = True, pageNumber: int = 1, pageCount: int = 100, pbType: str = None,
+            pbTypeDetail: str = None, corpCls: str = None
+    ) -> dict:
         params = dict()
+        if dateEnd is None:
+            dateEnd = datetime.datetime.now().date()
         if isinstance(dateEnd, datetime.date):
             params['end_de'] = dateEnd.strftime('%Y%m%d')
         else:
@@ -294,29 +759,97 @@ class OpenDart:
             params['pblntf_ty'] = pbType
         if pbTypeDetail is not None:
             params['pblntf_detail_ty'] = pbTypeDetail
-        # params['corp_cls']  # TODO:
+        if corpCls is not None:
+            params['corp_cls'] = corpCls
+        return params
 
+    def _searchDocumentWithCoverage(self, params: dict, pbType: str = None, pbTypeDetail: str = None) -> List[dict]:
+        filter_key = urllib.parse.urlencode(
+            sorted([(k, v) for k, v in params.items() if k not in ['bgn_de', 'end_de', 'page_no', 'page_count']]))
+        yesterday = (datetime.date.today() - datetime.timedelta(days=1)).strftime('%Y%m%d')
+        ranges = self._metadata_mirror.getUncoveredRanges(filter_key, params['bgn_de'], params['end_de'])
+        fetched = 0
+        for _ in range(2):
+            complete_all = True
+            for date_begin, date_end in ranges:
+                records = []
+                complete = True
+                try:
+                    for page_records in self._iterSearchDocumentPages(dict(params, bgn_de=date_begin, end_de=date_end)):
+                        records.extend(page_records)
+                except ResponseException as e:
+                    if e.status_code != 13:  # 013 = 조회된 데이타가 없음 (해당 구간은 조회 완료로 기록)
+                        self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+                        complete = False
+                self._invalidateCorrectedReports(records)
+                if complete:  # 구간 전체를 받았으면 기존 기록(정정으로 대체된 원본 등)을 교체
+                    self._metadata_mirror.clearFilterRange(filter_key, date_begin, date_end)
+                self._metadata_mirror.upsertFilings(records, pbType, pbTypeDetail, filter_key)
+                if complete and min(date_end, yesterday) >= date_begin:
+                    self._metadata_mirror.addCoverage(filter_key, date_begin, min(date_end, yesterday))
+                complete_all = complete_all and complete
+            fetched += len(ranges)
+            if not complete_all:
+                break
+            # 이번에 받은 정정 공시로 다시 조회 대상이 된 구간(원본 접수일)만 한 번 더 조회 (당일은 제외)
+            ranges = self._metadata_mirror.getUncoveredRanges(filter_key, params['bgn_de'], params['end_de'])
+            ranges = [(x, min(y, yesterday)) for x, y in ranges if min(y, yesterday) >= x]
+            if len(ranges) == 0:
+                break
+        self._log(f"fetched {fetched} uncovered range(s) of {params['bgn_de']} ~ {params['end_de']}", LogType.Info)
+        return self._metadata_mirror.queryCoveredFilings(filter_key, params['bgn_de'], params['end_de'])
+
+    def _iterSearchDocumentPages(self, params: dict, allPages: bool = True) -> Iterator[List[dict]]:
+        """
+        공시검색(list.json) 결과를 페이지 단위 레코드 리스트로 반환 (응답 오류 시 ResponseException 발생)
+        """
+        params = dict(params)
         json = self._requestAndGetJson(url_opendart.format("list.json"), **params)
-        try:
+        self._checkResponseStatus(json)
+        yield list(json.get('list') or [])
+        if not allPages:
+            return
+        for page in range(json.get('page_no') + 1, json.get('total_page') + 1):
+            params['page_no'] = page
+            json = self._requestAndGetJson(url_opendart.format("list.json"), **params)
             self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.search_document)
-
-        page_no = json.get('page_no')
-        total_page = json.get('total_page')
-        data_list = json.get('list')
-        df_result = pd.DataFrame(data_list)
-        if not recursive:  # loop query more than 1 page - recursive call
-            for page in range(page_no + 1, total_page + 1):
-                df_new = self.searchDocument(corpCode, dateEnd, dateBegin, onlyLastReport,
-                                             page, pageCount, pbType, pbTypeDetail, recursive=True)
-                df_result = df_result.append(df_new)
-
-        if self._rename_dataframe_column_names:
-            df_result.rename(columns=ColumnNames.search_document, inplace=True)
-        return df_result
-
+            yield list(json.get('list') or [])
+
+    def createFilingWatcher(
+            self, corpCodes: List[str] = None, pbTypes: List[str] = None, pbTypeDetails: List[str] = None,
+            corpClasses: List[str] = None, emitExisting: bool = False, queueSize: int = 0
+    ) -> FilingWatcher:
+        """
+        새로 접수되는 공시를 감시하는 FilingWatcher 생성 (start()로 감시 시작, stop()으로 중지)
+        예: watcher = dart.createFilingWatcher(corpClasses=['Y'], pbTypes=['B'])
+            watcher.sig_filing.connect(lambda filing: print(filing))
+            watcher.start()
+
+        :param corpCodes: 공시대상회사의 고유번호 리스트 (None이면 전체)
+        :param pbTypes: 공시유형 리스트 (define -> dict_pblntf_ty 참고)
+        :param pbTypeDetails: 공시상세유형 리스트 (define -> dict_pblntf_detail_ty 참고)
+        :param corpClasses: 법인구분 리스트 (Y = 유가, K = 코스닥, N = 코넥스, E = 기타)
+        :param emitExisting: 시작 시점에 이미 접수되어 있던 당일 공시도 알림할 지 여부
+        :param queueSize: 알림 큐 최대 크기 (0 = 제한 없음)
+        :return: FilingWatcher
+        """
+        self._log("create filing watcher", LogType.Command)
+        return FilingWatcher(self, corpCodes, pbTypes, pbTypeDetails, corpClasses, emitExisting, queueSize)
+
+    def _requestWatcherPage(self, params: dict) -> dict:
+        return self._requestAndGetJson(url_opendart.format("list.json"), **params)
+
+    def _onWatcherRecords(self, records: List[dict], query: dict):
+        if len(records) == 0:
+            return
+        self._invalidateCorrectedReports(records)
+        if self._metadata_mirror is not None:
+            self._metadata_mirror.upsertFilings(records, query.get('pblntf_ty'), query.get('pblntf_detail_ty'))
+
+    def _onWatcherError(self, message: str):
+        self._log(f"filing watcher poll failed - {message}", LogType.Error)
+
+    @returnsResult
     def getCompanyInformation(
             self, corpCode: str
     ) -> pd.DataFrame:
@@ -335,15 +868,12 @@ class OpenDart:
             self._checkResponseStatus(json)
         except ResponseException as e:
             self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.company)
+            return self._createEmptyDataFrame(ColumnNames.company, self._getCallBackend())
 
-        df_result = pd.DataFrame([json])
-        df_result.pop("status")
-        df_result.pop("message")
-
-        if self._rename_dataframe_column_names:
-            df_result.rename(columns=ColumnNames.company, inplace=True)
-        return df_result
+        record = {k: v for k, v in json.items() if k not in ['status', 'message']}
+        if self._metadata_mirror is not None:
+            self._metadata_mirror.upsertCompanies([record])
+        return self._makeDataFrameFromRecords([record], ColumnNames.company, backend=self._getCallBackend())
 
     def downloadDocumentRawFile(
             self, document_no: str, reload: bool = False
@@ -356,17 +886,29 @@ class OpenDart:
         :param document_no: 접수번호
         :param reload: 파일이 존재할 경우 삭제하고 다시 다운로드받을 지 여부
         """
-        params = {'rcept_no': document_no}
         if reload:
             self._removeDocumentRawFileInLocal(document_no)
         if not self._isDocumentRawFileExistInLocal(document_no):
-            self._log(f"download document raw file (doc no: {document_no})", LogType.Command)
-            try:
-                self._requestAndExtractZipFile(url_opendart.format("document.xml"), **params)
-            except ResponseException as e:
-                self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            filenames = self._downloadDocumentRawZipFile(document_no)
             self._solveDocumentRawFileEncodingIssue(document_no)
+            if filenames:
+                self._cache.register(document_no, CacheEntryType.RawDocument, filenames)
+                if self._fulltext_index is not None:
+                    self._addDocumentToFullTextIndex(document_no, 'xml')
+        else:
+            self._cache.touch(document_no, CacheEntryType.RawDocument)
+
+    def _downloadDocumentRawZipFile(self, document_no: str) -> Union[List[str], None]:
+        self._log(f"download document raw file (doc no: {document_no})", LogType.Command)
+        params = {'rcept_no': document_no}
+        filenames = None
+        try:
+            filenames = self._requestAndExtractZipFile(url_opendart.format("document.xml"), **params)
+        except ResponseException as e:
+            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+        return filenames
 
+    @returnsResult
     def loadCorporationDataFrame(
             self, reload: bool = False
     ) -> pd.DataFrame:
@@ -392,6 +934,7 @@ class OpenDart:
                 self._serializeCorporationDataFrame()
         return self._df_corplist
 
+    @returnsResult
     def searchCorporationCodeWithName(
             self, name: str, match_exact: bool = False
     ) -> pd.DataFrame:
@@ -402,7 +945,7 @@ class OpenDart:
         :param match_exact: True = 기업명 정확히 일치, False = 검색할 기업명이 포함되는 모든 레코드 반환
         :return: pandas DataFrame
         """
-        self.loadCorporationDataFrame()
+        self.loadCorporationDataFrame(backend=ResultBackend.Pandas)
         if match_exact:
             df_filtered = self._df_corplist[self._df_corplist['정식명칭'] == name]
         else:
@@ -416,10 +959,163 @@ class OpenDart:
         path_file = os.path.join(self._path_data_dir, f'{document_no}.xml')
         raw_string = ''
         if os.path.isfile(path_file):
+            self._solveDocumentRawFileEncodingIssue(document_no)  # 이전 실행에서 변환 전에 중단된 파일
             with open(path_file, 'r', encoding='utf-8') as fp:
                 raw_string = fp.read()
         return raw_string
 
+    def loadDocumentRawFileAsStructure(
+            self, document_no: str, reload: bool = False
+    ) -> Union[DartDocument, None]:
+        """
+        공시서류 원본파일(xml)의 섹션(SECTION-n, TITLE, P) 및 표(TABLE) 구조를 파싱
+        파싱 결과는 메모리와 원본 파일 옆의 pkl 파일에 캐시되어 재파싱 비용 없이 재사용된다
+
+        :param document_no: 접수번호
+        :param reload: 파일이 존재할 경우 삭제하고 다시 다운로드받을 지 여부
+        :return: DartDocument (원본파일이 없으면 None)
+        """
+        self.downloadDocumentRawFile(document_no, reload)
+        if not self._isDocumentRawFileExistInLocal(document_no):
+            return None
+        return self._loadDocumentStructureFromLocal(document_no)
+
+    def _loadDocumentStructureFromLocal(self, document_no: str) -> DartDocument:
+        path_file = os.path.join(self._path_data_dir, f'{document_no}.xml')
+        # 이전 실행에서 변환 전에 중단된 파일은 먼저 변환 (변환되면 수정 시각이 바뀌어 기존 pkl 캐시도 무효화된다)
+        self._solveDocumentRawFileEncodingIssue(document_no)
+        document = self._document_parse_cache.load(document_no, path_file)
+        if document is None:
+            tm_start = time.perf_counter()
+            document = parseDocumentRawFile(path_file, document_no)
+            elapsed = time.perf_counter() - tm_start
+            self._log(f"parsed document structure (doc no: {document_no}, sections: {len(document.sections)}, "
+                      f"tables: {len(document.tables)}, elapsed: {elapsed} sec)", LogType.Info)
+            self._document_parse_cache.store(document)
+            path_pkl = os.path.basename(self._document_parse_cache.getPicklePath(document_no))
+            self._cache.register(document_no, CacheEntryType.RawDocument, [f'{document_no}.xml', path_pkl])
+        return document
+
+    def loadDocumentTablesAsDataFrames(
+            self, document_no: str, sectionTitle: str = None, reload: bool = False
+    ) -> List[pd.DataFrame]:
+        """
+        공시서류 원본파일 내의 표(TABLE)를 DataFrame 리스트로 변환
+
+        :param document_no: 접수번호
+        :param sectionTitle: 해당 문자열을 제목에 포함하는 섹션(하위 섹션 포함)의 표만 변환, 기본값 = 전체
+        :param reload: 파일이 존재할 경우 삭제하고 다시 다운로드받을 지 여부
+        :return: list of pandas DataFrame
+        """
+        document = self.loadDocumentRawFileAsStructure(document_no, reload)
+        if document is None:
+            return []
+        return document.getTableDataFrames(sectionTitle)
+
+    def processDocumentsInParallel(
+            self, document_nos: List[str], includeHtml: bool = False,
+            ioWorkers: int = 4, processWorkers: int = None, queueSize: int = 32
+    ) -> Iterator[DocumentProcessResult]:
+        """
+        다수의 공시서류 원본파일을 I/O 스레드에서 다운로드하면서 인코딩 변환 및 구조 파싱은 프로세스 풀에서 병렬 처리
+        결과는 처리가 끝나는 순서대로 반환된다
+
+        :param document_nos: 접수번호 리스트
+        :param includeHtml: 로컬에 html 파일이 있으면 텍스트 추출도 함께 수행할 지 여부
+        :param ioWorkers: 다운로드 스레드 수
+        :param processWorkers: 파싱 프로세스 수, 기본값 = CPU 코어 수
+        :param queueSize: 단계 사이 큐의 최대 크기 (처리 대기 중인 문서 수 상한)
+        :return: DocumentProcessResult 이터레이터
+        """
+        self._log(f"process {len(document_nos)} document(s) in parallel", LogType.Command)
+        pipeline = DocumentPipeline(self, ioWorkers, processWorkers, queueSize)
+        yield from pipeline.run(document_nos, includeHtml)
+
+    def _prepareDocumentForPipeline(self, document_no: str, includeHtml: bool) -> tuple:
+        # 파싱이 끝날 때까지 원본 파일이 용량 초과로 삭제되지 않도록 표시 (_releasePipelineDocument에서 해제)
+        self._cache.pin(document_no, CacheEntryType.RawDocument)
+        if not self._isDocumentRawFileExistInLocal(document_no):
+            filenames = self._downloadDocumentRawZipFile(document_no)
+            if not filenames or not self._isDocumentRawFileExistInLocal(document_no):
+                return document_no, None, "failed to download document raw file"
+            self._cache.register(document_no, CacheEntryType.RawDocument, filenames)
+        path_xml = os.path.join(self._path_data_dir, f'{document_no}.xml')
+        path_pkl = self._document_parse_cache.getPicklePath(document_no)
+        path_html = None
+        if includeHtml and self._isDocumentHtmlFileExistInLocal(document_no):
+            path_html = os.path.join(self._path_data_dir, f'{document_no}.html')
+        args = (path_xml, path_pkl, self._config.doc_str_replace_list, path_html)
+        return document_no, args, None
+
+    def _onPipelineResult(self, result: DocumentProcessResult):
+        if result.success:
+            self._document_parse_cache.remember(result.document)
+            path_pkl = os.path.basename(self._document_parse_cache.getPicklePath(result.document_no))
+            self._cache.register(result.document_no, CacheEntryType.RawDocument, [path_pkl])
+            if self._fulltext_index is not None:
+                self._fulltext_index.addDocument(result.document_no, result.document.text, 'xml')
+                if result.html_text is not None:
+                    self._fulltext_index.addDocument(result.document_no, result.html_text, 'html')
+        else:
+            self._log(f"failed to process document (doc no: {result.document_no}) - {result.error}", LogType.Error)
+
+    def _releasePipelineDocument(self, document_no: str):
+        self._cache.unpin(document_no, CacheEntryType.RawDocument)
+
+    @returnsResult
+    def searchDocumentFullText(
+            self, query: str, limit: int = 100, snippetLength: int = 40
+    ) -> pd.DataFrame:
+        """
+        로컬에 다운로드된 공시서류(원본 xml, html)의 전문 검색 (setEnableFullTextIndex(True) 이후 다운로드된 문서 대상)
+
+        :param query: 검색어 (공백으로 구분된 여러 단어는 AND 조건)
+        :param limit: 최대 결과 수
+        :param snippetLength: 검색어 앞뒤로 발췌할 글자 수
+        :return: pandas DataFrame
+        """
+        if self._fulltext_index is None:
+            self._log("full-text index is not enabled", LogType.Error)
+            return self._createEmptyDataFrame(ColumnNames.fulltext_search)
+        tm_start = time.perf_counter()
+        results = self._fulltext_index.search(query, limit, snippetLength)
+        elapsed = (time.perf_counter() - tm_start) * 1000
+        self._log(f"full-text search '{query}' - {len(results)} result(s) (elapsed: {elapsed:.1f}ms)", LogType.Info)
+        if len(results) == 0:
+            return self._createEmptyDataFrame(ColumnNames.fulltext_search)
+        df_result = pd.DataFrame(results)
+        if self._rename_dataframe_column_names:
+            df_result.rename(columns=ColumnNames.fulltext_search, inplace=True)
+        return df_result
+
+    def rebuildFullTextIndex(self):
+        """
+        로컬에 이미 존재하는 공시서류(원본 xml, html) 중 색인되지 않은 문서를 전문 색인에 추가
+        """
+        if self._fulltext_index is None:
+            self.setEnableFullTextIndex(True)
+        count = 0
+        for name in os.listdir(self._path_data_dir):
+            document_no, ext = os.path.splitext(name)
+            source = ext[1:]
+            if source not in ['xml', 'html'] or not document_no.isdigit():
+                continue
+            if not self._fulltext_index.isIndexed(document_no, source):
+                self._addDocumentToFullTextIndex(document_no, source)
+                count += 1
+        self._log(f"added {count} document(s) to full-text index", LogType.Info)
+
+    def _addDocumentToFullTextIndex(self, document_no: str, source: str):
+        try:
+            if source == 'xml':
+                text = self._loadDocumentStructureFromLocal(document_no).text
+            else:
+                tree = html.parse(os.path.join(self._path_data_dir, f'{document_no}.html'))
+                text = tree.getroot().text_content()
+            self._fulltext_index.addDocument(document_no, text, source)
+        except Exception as e:
+            self._log(f"failed to add document to full-text index (doc no: {document_no}) - {e}", LogType.Error)
+
     def downloadDocumentAsHtmlFile(
             self, document_no: str, reload: bool = False
     ) -> str:
@@ -435,6 +1131,11 @@ class OpenDart:
             encoding = response_document.html.encoding
             html_element = self._modifyTagAttributesOfDocumentResponse(response_document)
             self._saveElementToLocalHtmlFile(html_element, document_no, encoding)
+            self._cache.register(document_no, CacheEntryType.HtmlDocument)
+            if self._fulltext_index is not None:
+                self._addDocumentToFullTextIndex(document_no, 'html')
+        else:
+            self._cache.touch(document_no, CacheEntryType.HtmlDocument)
         path_dest = os.path.join(self._path_data_dir, f'{document_no}.html')
         return path_dest
 
@@ -455,6 +1156,7 @@ class OpenDart:
         text = raw.decode(encoding=encoding)
         return text
 
+    @returnsResult
     def getCompanyInformationByName(
             self, name: str, match_exact: bool = False
     ) -> pd.DataFrame:
@@ -466,6 +1168,8 @@ class OpenDart:
         return df_result
 
     def _removeDocumentRawFileInLocal(self, document_no: str):
+        self._cache.remove(document_no, CacheEntryType.RawDocument)
+        self._document_parse_cache.discard(document_no)
         path_file = os.path.join(self._path_data_dir, f'{document_no}.xml')
         if os.path.isfile(path_file):
             os.remove(path_file)
@@ -476,27 +1180,7 @@ class OpenDart:
 
     def _solveDocumentRawFileEncodingIssue(self, document_no: str):
         path_file = os.path.join(self._path_data_dir, f'{document_no}.xml')
-        if os.path.isfile(path_file):
-            regexAnnotation = re.compile(r"<주[^>]*>")
-
-            def replaceAnnotationBracket(source: str) -> str:
-                search = regexAnnotation.search(source)
-                result = source
-                if search is not None:
-                    span = search.span()
-                    result = source[:span[0]] + '&lt;' + source[span[0]+1:span[1]-1] + '&gt;' + source[span[1]:]
-                return result
-
-            with open(path_file, 'r', encoding='euc-kr') as fp:
-                doc_lines = fp.readlines()
-                for replace_set in self._config.doc_str_replace_list:
-                    src = replace_set[0]
-                    dest = replace_set[1]
-                    doc_lines = [x.replace(src, dest) for x in doc_lines]
-                doc_lines = [replaceAnnotationBracket(x) for x in doc_lines]
-
-            with open(path_file, 'w', encoding='utf-8') as fp:
-                fp.writelines(doc_lines)
+        solveDocumentRawFileEncodingIssue(path_file, self._config.doc_str_replace_list)
 
     def _requestAndRender(self, url: str) -> requests.models.Response:
         session = HTMLSession()
@@ -560,47 +1244,90 @@ class OpenDart:
         return os.path.isfile(path_file)
 
     def _removeDocumentHtmlFileInLocal(self, document_no: str):
+        self._cache.remove(document_no, CacheEntryType.HtmlDocument)
         path_file = os.path.join(self._path_data_dir, f'{document_no}.html')
         if os.path.isfile(path_file):
             os.remove(path_file)
 
-    def _makeDataFrameFromJsonList(self, json: dict, col_names: dict) -> pd.DataFrame:
-        data_list = json.get('list')
-        df = pd.DataFrame(data_list)
-        if self._rename_dataframe_column_names:
-            df.rename(columns=col_names, inplace=True)
-        return df
-    
-    def _makeDataFrameFromJsonGroup(self, json: dict, title: str, col_names: dict) -> pd.DataFrame:
-        group = list(filter(lambda x: x.get('title') == title, json.get('group')))[0]
-        data_list = group.get('list')
-        df = pd.DataFrame(data_list)
-        if self._rename_dataframe_column_names:
-            df.rename(columns=col_names, inplace=True)
-        return df
+    def _makeDataFrameFromJsonList(
+            self, json: dict, col_names: dict, dtypes: dict = None, backend: ResultBackend = None
+    ) -> pd.DataFrame:
+        return self._makeDataFrameFromRecords(json.get('list'), col_names, dtypes, backend)
+
+    def _makeDataFramesFromJsonGroups(
+            self, json: dict, groups: List[Tuple[str, dict]], dtypes: dict = None, backend: ResultBackend = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        group 형태 응답을 한 번만 순회해 title -> DataFrame으로 변환 (응답에 없는 group은 빈 DataFrame)
+        """
+        lists = {x.get('title'): x.get('list') for x in json.get('group') or []}
+        result = dict()
+        for title, col_names in groups:
+            data_list = lists.get(title)
+            if not data_list:
+                result[title] = self._createEmptyDataFrame(
+                    col_names if self._rename_dataframe_column_names else list(col_names.keys()), backend)
+                continue
+            result[title] = self._makeDataFrameFromRecords(data_list, col_names, dtypes, backend)
+        return result
 
     """ 사업보고서 주요정보 API """
 
-    def _makeBusinessReportDataFrameCommon(
-            self, corp_code: str, year: int, rpt_code: str, api: str, col_names: dict
-    ) -> pd.DataFrame:
-        params = {'corp_code': corp_code, 'bsns_year': str(max(2015, year)), 'reprt_code': rpt_code}
-        json = self._requestAndGetJson(url_opendart.format(api), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(col_names)
-        df_result = self._makeDataFrameFromJsonList(json, col_names)
-        return df_result
+    @returnsResult
+    def getBusinessReportInfoBatch(
+            self, corpCodes: List[str], years: List[int], reportCodes: List[Union[ReportCode, str]],
+            apis: List[str] = None, maxWorkers: int = None, returnFailures: bool = False
+    ) -> Union[Dict[str, pd.DataFrame], Tuple[Dict[str, pd.DataFrame], List[Tuple[tuple, Exception]]]]:
+        """
+        [사업보고서 주요정보] 일괄 조회
+        (API x 회사 x 사업연도 x 보고서 코드) 조합을 분당 요청 수 제한 내에서 동시에 요청하고,
+        API 별로 하나의 DataFrame으로 병합 (각 행에 요청 인자(고유번호, 사업연도, 보고서코드) 열 추가)
+        데이터가 없는(013) 조합은 결과에서 빠지고, 요청 제한 초과 등 응답 오류가 난 조합은 실패로 기록된다
+
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트
+        :param years: 사업연도 리스트
+        :param reportCodes: 보고서 코드 리스트
+        :param apis: API 이름 리스트 (예: ['alotMatter', 'empSttus'], business_report_apis 참고), None이면 전체
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :param returnFailures: 실패한 (API 이름, 고유번호, 사업연도, 보고서 코드), 예외 리스트를 함께 반환할 지 여부
+        :return: dict (API 이름 -> pandas DataFrame) (returnFailures = True 이면 (dict, 실패 리스트) 튜플)
+        """
+        apis = list(business_report_apis.keys()) if apis is None else [x.replace('.json', '') for x in apis]
+        unknown = [x for x in apis if x not in business_report_apis]
+        if len(unknown) > 0:
+            raise ValueError(f"unknown business report api: {unknown}")
+        rptcodes = [x.value if isinstance(x, ReportCode) else x for x in reportCodes]
+        keys = [(a, c, y, r) for a in apis for c in corpCodes for y in years for r in rptcodes]
+        self._log(f"get business report info batch ({len(apis)} api(s), {len(keys)} request(s))", LogType.Command)
+        results = self._runBatch(self._requestBusinessReportForBatch, keys, maxWorkers)
+        result = dict()
+        for api in apis:
+            frames = [x.result for x in results if x.success and x.key[0] == api]
+            col_names = {**ColumnNames.batch_request_key, **business_report_apis[api].columns}
+            result[api] = self._concatDataFrames(frames, col_names)
+        if returnFailures:
+            return result, [(x.key, x.exception) for x in results if not x.success]
+        return result
+
+    def _requestBusinessReportForBatch(self, api: str, corp_code: str, year: int, rpt_code: str) -> pd.DataFrame:
+        spec = business_report_apis[api]
+        params, _ = self._makeEndpointParameters(spec, corp_code, year, rpt_code)
+        df = self._fetchEndpoint(spec, params, raiseOnError=True)
+        names = ColumnNames.batch_request_key if self._rename_dataframe_column_names else dict()
+        for i, (key, value) in enumerate(zip(ColumnNames.batch_request_key.keys(), [corp_code, year, rpt_code])):
+            df.insert(i, names.get(key, key), value)
+        return df
+
+    """ 상장기업 재무정보 API """
 
-    def getContingentConvertibleBondOutstandingBalanceInfo(
+    @returnsResult
+    def getSingleFinancialInformation(
             self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020008
-        [사업보고서 주요정보::1.조건부 자본증권 미상환 잔액]
-        정기보고서(사업, 분기, 반기보고서) 내에 조건부 자본증권 미상환 잔액을 제공합니다.
+        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019016
+        [상장기업 재무정보::1.단일회사 주요계정]
+        상장법인(금융업 제외)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
 
         :param corpCode: 공시대상회사의 고유번호(8자리)
         :param year: 사업연도, 2015년 이후 부터 정보제공
@@ -609,695 +1336,631 @@ class OpenDart:
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
         info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get contingent convertible bond outstanding balance info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "cndlCaplScritsNrdmpBlce.json", ColumnNames.outstanding_balance)
+        self._log("get single financial information " + info, LogType.Command)
+        params = {'corp_code': corpCode, 'bsns_year': str(max(2015, year)), 'reprt_code': rptcode}
+        json = self._requestCachedJson("fnlttSinglAcnt.json", params, ttl_periodic_report)
+        try:
+            self._checkResponseStatus(json)
+        except ResponseException as e:
+            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            return self._createEmptyDataFrame(ColumnNames.financial, self._getCallBackend())
+
+        df_result = self._makeDataFrameFromJsonList(json, ColumnNames.financial, backend=self._getCallBackend())
         return df_result
 
-    def getUnregisteredOfficerRemunerationInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
+    @returnsResult
+    def getMultiFinancialInformation(
+            self, corpCode: Union[List[str], str], year: int, reportCode: Union[ReportCode, str],
+            maxWorkers: int = None, returnFailures: bool = False
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, List[Tuple[List[str], Exception]]]]:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020013
-        [사업보고서 주요정보::2.미등기임원 보수현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 미등기임원 보수현황을 제공합니다.
+        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019017
+        [상장기업 재무정보::2.다중회사 주요계정]
+        상장법인(금융업 제외)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
+        (상장법인 복수조회 가능)
+        API 1회 호출 당 최대 회사 수(100)를 넘으면 나누어 동시에 요청하고, 결과는 입력 순서대로 병합한다
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
+        :param corpCode: 공시대상회사의 고유번호(8자리) 리스트
         :param year: 사업연도, 2015년 이후 부터 정보제공
         :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :param returnFailures: 실패한 묶음의 (고유번호 리스트, 예외) 리스트를 함께 반환할 지 여부
+        :return: pandas DataFrame (returnFailures = True 이면 (DataFrame, 실패 리스트) 튜플)
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get unregistered officer remuneration info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "unrstExctvMendngSttus.json", ColumnNames.remuneration)
+        corp_codes = [corpCode] if isinstance(corpCode, str) else list(dict.fromkeys(corpCode))
+        chunks = [corp_codes[i:i + max_multi_corp_count] for i in range(0, len(corp_codes), max_multi_corp_count)]
+        info = f"(corp count: {len(corp_codes)}, chunks: {len(chunks)}, year: {year}, report code: {rptcode})"
+        self._log("get multiple financial information " + info, LogType.Command)
+        results = self._runBatch(self._requestMultiFinancialInformationChunk,
+                                 [(x, year, rptcode) for x in chunks], maxWorkers)
+        df_result = self._concatDataFrames([x.result for x in results if x.success], ColumnNames.financial)
+        if returnFailures:
+            return df_result, [(x.key[0], x.exception) for x in results if not x.success]
         return df_result
 
-    def getDebentureOutstandingBalanceInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    def _requestMultiFinancialInformationChunk(self, corp_codes: List[str], year: int, rpt_code: str) -> pd.DataFrame:
+        params = {'corp_code': ','.join(corp_codes), 'bsns_year': str(max(2015, year)), 'reprt_code': rpt_code}
+        json = self._requestCachedJson("fnlttMultiAcnt.json", params, ttl_periodic_report)
+        try:
+            self._checkResponseStatus(json)
+        except ResponseException as e:
+            if e.status_code != 13:  # 013: 조회된 데이타가 없습니다
+                raise
+            return self._createEmptyDataFrame(ColumnNames.financial)
+        return self._makeDataFrameFromJsonList(json, ColumnNames.financial)
+
+    def _getFinancialCube(self) -> FinancialCube:
+        if self._financial_cube is None:
+            self._financial_cube = FinancialCube(os.path.join(self._path_data_dir, 'FinancialCube'))
+        return self._financial_cube
+
+    @returnsResult
+    def buildFinancialPanel(
+            self, corpCodes: List[str], years: List[int], reportCodes: List[Union[ReportCode, str]],
+            refresh: bool = False, pivot: str = None, maxWorkers: int = None
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020006
-        [사업보고서 주요정보::3.회사채 미상환 잔액]
-        정기보고서(사업, 분기, 반기보고서) 내에 회사채 미상환 잔액을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
+        [상장기업 재무정보::2.다중회사 주요계정] 기반 (회사 x 사업연도 x 보고서) 패널 구성
+        로컬 Parquet 저장소(Data/FinancialCube)에 없는 셀만 API로 조회해 추가하므로 재실행 시 새 기간만 요청한다
+        데이터가 없었던 셀(아직 공시되지 않은 기간 등)은 no_data_cache_ttl이 지나면 다시 조회한다
+        (저장소 데이터는 항상 typed 열로 보관된다)
+
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트
+        :param years: 사업연도 리스트
+        :param reportCodes: 보고서 코드 리스트
+        :param refresh: 저장 여부와 관계없이 모든 셀을 다시 조회해 교체할 지 여부
+        :param pivot: 값으로 사용할 금액 필드명 (예: 'thstrm_amount'), 지정 시 계정명을 열로 하는 wide 형태로 반환
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
         :return: pandas DataFrame
         """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get debenture outstanding balance info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "cprndNrdmpBlce.json", ColumnNames.outstanding_balance)
+        cube = self._getFinancialCube()
+        corp_codes = list(dict.fromkeys(corpCodes))
+        rptcodes = [x.value if isinstance(x, ReportCode) else x for x in reportCodes]
+        keys = []
+        for year in years:
+            for rptcode in rptcodes:
+                targets = corp_codes if refresh else cube.getMissingCorpCodes(
+                    corp_codes, year, rptcode, self._config.no_data_cache_ttl)
+                for i in range(0, len(targets), max_multi_corp_count):
+                    keys.append((targets[i:i + max_multi_corp_count], year, rptcode))
+        self._log(f"build financial panel ({len(corp_codes)} corp(s) x {len(years)} year(s) x "
+                  f"{len(rptcodes)} report(s), {len(keys)} request(s) for missing cells)", LogType.Command)
+        results = self._runBatch(self._requestMultiFinancialInformationChunk, keys, maxWorkers)
+        partitions = dict()
+        for result in results:
+            if not result.success:
+                continue  # 실패한 셀은 기록하지 않아 다음 실행 때 다시 조회
+            chunk, year, rptcode = result.key
+            frames, fetched = partitions.setdefault((year, rptcode), ([], []))
+            frames.append(self._normalizeDataFrameForStore(result.result, ColumnNames.financial))
+            fetched.extend(chunk)
+        for (year, rptcode), (frames, fetched) in partitions.items():
+            frames = [x for x in frames if len(x) > 0]
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame()
+            cube.write(df, year, rptcode, fetched, replace=refresh)
+
+        df_result = cube.read(corp_codes, list(years), rptcodes)
+        if pivot is not None:
+            df_result = pivotFinancialPanel(df_result, pivot)
+            if self._rename_dataframe_column_names:
+                df_result.index.names = [ColumnNames.financial.get(x, x) for x in df_result.index.names]
+            return df_result
+        if len(df_result) == 0:
+            return self._createEmptyDataFrame(ColumnNames.financial)
+        if self._rename_dataframe_column_names:
+            df_result.rename(columns=ColumnNames.financial, inplace=True)
         return df_result
 
-    def getShortTermBondOutstandingBalanceInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    @returnsResult
+    def screenFinancialPanel(
+            self, year: int, reportCode: Union[ReportCode, str], predicates: List[Tuple[str, str, object]],
+            fsDiv: Union[FinancialStatementDivision, str] = FinancialStatementDivision.Consolidated,
+            columns: List[str] = None
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020005
-        [사업보고서 주요정보::4.단기사채 미상환 잔액]
-        정기보고서(사업, 분기, 반기보고서) 내에 단기사채 미상환 잔액을 제공합니다.
+        로컬 재무정보 저장소(buildFinancialPanel)에서 조건을 만족하는 회사 추출 (API 요청 없음)
+        예: screenFinancialPanel(2022, ReportCode.Buisness, [('매출액', '>=', 1e12), ('operating_margin', '>', 0.1)])
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
+        :param year: 사업연도
         :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param predicates: (열 이름, 연산자, 값) 리스트
+                           열 이름 = 계정명(당기금액) 또는 computeFinancialMetrics 결과의 열 이름
+                           연산자 = '>', '>=', '<', '<=', '==', '!=', 'in', 'between'
+        :param fsDiv: 개별/연결구분 (None이면 전체)
+        :param columns: 반환할 열 리스트 (None이면 조건에 사용된 열)
+        :return: pandas DataFrame, index = (고유번호, 개별/연결구분)
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get short-term bond outstanding balance info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "srtpdPsndbtNrdmpBlce.json", ColumnNames.outstanding_balance)
+        fsdiv = fsDiv.value if isinstance(fsDiv, FinancialStatementDivision) else fsDiv
+        self._log(f"screen financial panel (year: {year}, report code: {rptcode}, "
+                  f"{len(predicates)} predicate(s))", LogType.Command)
+        df_wide = self._getFinancialCube().readScreenTable()
+        df_result = screenFinancialPanel(df_wide, int(year), rptcode, predicates, fsdiv, columns)
+        if self._rename_dataframe_column_names:
+            df_result.index.names = [ColumnNames.financial.get(x, x) for x in df_result.index.names]
         return df_result
 
-    def getPaperSecuritiesOutstandingBalanceInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    @returnsResult
+    def computeFinancialMetrics(
+            self, df: pd.DataFrame = None, corpCodes: List[str] = None, years: List[int] = None,
+            fsDiv: Union[FinancialStatementDivision, str] = None
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020004
-        [사업보고서 주요정보::5.기업어음증권 미상환 잔액]
-        정기보고서(사업, 분기, 반기보고서) 내에 기업어음증권 미상환 잔액을 제공합니다.
+        재무정보로부터 분기 단독 값, TTM(최근 4개 분기 합), 재무비율, 전년동기 대비 성장률 계산 (API 요청 없음)
+        손익/현금흐름 항목은 1분기/반기/3분기/사업보고서의 누적 금액을 차분해 분기 값으로 변환하며,
+        재무상태표 항목은 각 보고서 기준일의 값을 그대로 사용한다
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param df: 주요계정 또는 전체 재무제표 DataFrame (pyarrow Table, polars DataFrame 가능, None이면 로컬 재무정보 저장소(buildFinancialPanel)에서 로드)
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트 (None이면 전체)
+        :param years: 사업연도 리스트 (None이면 전체, TTM/성장률 계산을 위해 이전 연도도 포함하는 것을 권장)
+        :param fsDiv: 개별/연결구분 (None이면 전체)
+        :return: pandas DataFrame, index = (고유번호, 개별/연결구분, 사업연도, 분기)
         """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get paper securities outstanding balance info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "entrprsBilScritsNrdmpBlce.json", ColumnNames.outstanding_balance)
+        if df is None:
+            df = self._getFinancialCube().read(corpCodes, years)
+        else:
+            df = self._normalizeDataFrameForStore(toPandas(df), {**ColumnNames.financial, **ColumnNames.financial_all})
+            if corpCodes is not None:
+                df = df[df['corp_code'].isin(corpCodes)]
+            if years is not None:
+                df = df[df['bsns_year'].astype(int).isin(years)]
+        if fsDiv is not None and 'fs_div' in df.columns:
+            fsdiv = fsDiv.value if isinstance(fsDiv, FinancialStatementDivision) else fsDiv
+            df = df[df['fs_div'].astype(object) == fsdiv]
+        self._log(f"compute financial metrics ({len(df)} row(s))", LogType.Command)
+        if len(df) == 0:
+            return pd.DataFrame()
+        df_result = computeFinancialMetrics(df)
+        if self._rename_dataframe_column_names:
+            df_result.index.names = [ColumnNames.financial_all.get(x, x) for x in df_result.index.names]
         return df_result
 
-    def getDebtSecuritiesPublishInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    @returnsResult
+    def getEntireFinancialStatements(
+            self, corpCode: str, year: int, reportCode: Union[ReportCode, str],
+            fsDiv: Union[FinancialStatementDivision, str] = FinancialStatementDivision.Consolidated
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020003
-        [사업보고서 주요정보::6.채무증권 발행실적]
-        정기보고서(사업, 분기, 반기보고서) 내에 채무증권 발행실적을 제공합니다.
+        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019020
+        [상장기업 재무정보::4.단일회사 전체 재무제표]
+        상장법인(금융업 제외)이 제출한 정기보고서 내에 XBRL재무제표의 모든계정과목을 제공합니다.
 
         :param corpCode: 공시대상회사의 고유번호(8자리)
         :param year: 사업연도, 2015년 이후 부터 정보제공
         :param reportCode: 보고서 코드
+        :param fsDiv: 개별/연결구분 (CFS = 연결재무제표, OFS = 재무제표)
         :return: pandas DataFrame
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get debt securities publish info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "detScritsIsuAcmslt.json", ColumnNames.debt_securities)
-        return df_result
+        fsdiv = fsDiv.value if isinstance(fsDiv, FinancialStatementDivision) else fsDiv
+        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode}, fs div: {fsdiv})"
+        self._log("get entire financial statements " + info, LogType.Command)
+        try:
+            return self._requestEntireFinancialStatements(corpCode, year, rptcode, fsdiv)
+        except ResponseException as e:
+            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            return self._createEmptyDataFrame(ColumnNames.financial_all, self._getCallBackend())
 
-    def getPrivateCapitalUsageDetailInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    def _requestEntireFinancialStatements(
+            self, corp_code: str, year: int, rpt_code: Union[ReportCode, str],
+            fs_div: Union[FinancialStatementDivision, str]
     ) -> pd.DataFrame:
+        # 데이터 없음(013)은 빈 DataFrame, 그 외 응답 오류는 ResponseException 발생 (일괄 조회에서 실패로 집계)
+        rptcode = rpt_code.value if isinstance(rpt_code, ReportCode) else rpt_code
+        fsdiv = fs_div.value if isinstance(fs_div, FinancialStatementDivision) else fs_div
+        params = {'corp_code': corp_code, 'bsns_year': str(max(2015, year)), 'reprt_code': rptcode, 'fs_div': fsdiv}
+        json = self._requestCachedJson("fnlttSinglAcntAll.json", params, ttl_periodic_report)
+        try:
+            self._checkResponseStatus(json)
+        except ResponseException as e:
+            if e.status_code != 13:  # 013: 조회된 데이타가 없습니다
+                raise
+            return self._createEmptyDataFrame(ColumnNames.financial_all, self._getCallBackend())
+
+        # 응답에 없는 개별/연결구분(fs_div)은 레코드에 추가해 다른 열과 함께 생성
+        records = [dict(x, fs_div=fsdiv) for x in json.get('list') or []]
+        return self._makeDataFrameFromRecords(records, ColumnNames.financial_all, backend=self._getCallBackend())
+
+    @returnsResult
+    def getEntireFinancialStatementsBatch(
+            self, corpCodes: List[str], years: List[int], reportCodes: List[Union[ReportCode, str]],
+            fsDiv: Union[FinancialStatementDivision, str] = FinancialStatementDivision.Consolidated,
+            maxWorkers: int = None, returnFailures: bool = False
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, List[Tuple[tuple, Exception]]]]:
+        """
+        [상장기업 재무정보::4.단일회사 전체 재무제표] 일괄 조회
+        (회사 x 사업연도 x 보고서 코드) 조합을 동시에 요청해 하나의 long-format DataFrame으로 병합
+        데이터가 없는(013) 조합은 결과에서 빠지고, 요청 제한 초과 등 응답 오류가 난 조합은 실패로 기록된다
+
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트
+        :param years: 사업연도 리스트
+        :param reportCodes: 보고서 코드 리스트
+        :param fsDiv: 개별/연결구분 (CFS = 연결재무제표, OFS = 재무제표)
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :param returnFailures: 실패한 (고유번호, 사업연도, 보고서 코드, 개별/연결구분), 예외 리스트를 함께 반환할 지 여부
+        :return: pandas DataFrame (returnFailures = True 이면 (DataFrame, 실패 리스트) 튜플)
+        """
+        keys = [(c, y, r, fsDiv) for c in corpCodes for y in years for r in reportCodes]
+        self._log(f"get entire financial statements batch ({len(keys)} request(s))", LogType.Command)
+        results = self._runBatch(self._requestEntireFinancialStatements, keys, maxWorkers)
+        df_result = self._concatDataFrames([x.result for x in results if x.success], ColumnNames.financial_all)
+        if returnFailures:
+            return df_result, [(x.key, x.exception) for x in results if not x.success]
+        return df_result
+
+    def downloadFinancialStatementsRawFile(
+            self, receiptNo: str, reportCode: Union[ReportCode, str], reload: bool = False
+    ):
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020017
-        [사업보고서 주요정보::7.사모자금의 사용내역]
-        정기보고서(사업, 분기, 반기보고서) 내에 사모자금의 사용내역을 제공합니다.
+        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019019
+        [상장기업 재무정보::3.재무제표 원본파일(XBRL)]
+        상장법인이 제출한 정기보고서 내에 XBRL재무제표의 원본파일(XBRL)을 제공합니다.
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
+        :param receiptNo: 접수번호
         :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param reload: 디렉터리가 존재할 경우 삭제하고 다시 다운로드받을 지 여부
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get private capital usage detail info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "prvsrpCptalUseDtls.json", ColumnNames.equity_usage_detail)
-        return df_result
+        if reload:
+            self._removeFinancialStatementsDirInLocal(receiptNo, rptcode)
+        if not self._isFinancialStatementsDirExistInLocal(receiptNo, rptcode):
+            info = f"(receipt no: {receiptNo}, report code: {rptcode})"
+            self._log("download financial statements raw file " + info, LogType.Command)
+            params = {'rcept_no': receiptNo, 'reprt_code': rptcode}
+            dest_dir = f'fs_{receiptNo}_{rptcode}'
+            try:
+                self._requestAndExtractZipFile(url_opendart.format("fnlttXbrl.xml"), dest_dir, **params)
+            except ResponseException as e:
+                self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            if self._isFinancialStatementsDirExistInLocal(receiptNo, rptcode):
+                self._cache.register(dest_dir, CacheEntryType.FinancialStatements)
+        else:
+            self._cache.touch(f'fs_{receiptNo}_{rptcode}', CacheEntryType.FinancialStatements)
 
-    def getPublicCapitalUsageDetailInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    @returnsResult
+    def loadFinancialStatementsFacts(
+            self, receiptNo: str, reportCode: Union[ReportCode, str], lang: str = 'ko', reload: bool = False
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020016
-        [사업보고서 주요정보::8.공모자금의 사용내역]
-        정기보고서(사업, 분기, 반기보고서) 내에 공모자금의 사용내역을 제공합니다.
+        재무제표 원본파일(XBRL)의 인스턴스 문서와 레이블/표시 링크베이스를 fact 단위 DataFrame으로 변환
+        변환 결과는 XBRL 디렉터리 내 pkl 파일로 캐시된다
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
+        :param receiptNo: 접수번호
         :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get public equity usage detail info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "pssrpCptalUseDtls.json", ColumnNames.equity_usage_detail)
-        return df_result
-
-    def getEntireOfficerRemunerationByApprovalInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020014
-        [사업보고서 주요정보::9.이사·감사 전체의 보수현황(주주총회 승인금액)]
-        정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황(주주총회 승인금액)을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get entire officer remuneration by approval info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "drctrAdtAllMendngSttusGmtsckConfmAmount.json", ColumnNames.remuneration)
-        return df_result
-
-    def getEntireOfficerRemunerationByPaymentsInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020015
-        [사업보고서 주요정보::10.이사·감사 전체의 보수현황(보수지급금액 - 유형별)]
-        정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황(보수지급금액 - 유형별)을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get entire officer remuneration by payments info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "drctrAdtAllMendngSttusMendngPymntamtTyCl.json", ColumnNames.remuneration)
-        return df_result
-
-    def getStockTotalQuantityInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020002
-        [사업보고서 주요정보::11.주식의 총수 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 주식의총수현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get stock total quantity info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "stockTotqySttus.json", ColumnNames.stock_quantity)
-        return df_result
-
-    def getAccountingAuditorAndOpinionInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020009
-        [사업보고서 주요정보::12.회계감사인의 명칭 및 감사의견]
-        정기보고서(사업, 분기, 반기보고서) 내에 회계감사인의 명칭 및 감사의견을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get accounting auditor and opinion info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "accnutAdtorNmNdAdtOpinion.json", ColumnNames.audit_opinion)
-        return df_result
-
-    def getAuditServiceContractStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020010
-        [사업보고서 주요정보::13.감사용역체결현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 감사용역체결현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get audit service contract status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "adtServcCnclsSttus.json", ColumnNames.audit_service_contract)
-        return df_result
-
-    def getNonAuditServiceContractStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020011
-        [사업보고서 주요정보::14.회계감사인과의 비감사용역 계약체결 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 회계감사인과의 비감사용역 계약체결 현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get non-audit service contract status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "accnutAdtorNonAdtServcCnclsSttus.json", ColumnNames.non_audit_service_contract)
-        return df_result
-
-    def getOutsideDirectorAndChangeStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020012
-        [사업보고서 주요정보::15.사외이사 및 그 변동현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 사외이사 및 그 변동현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get outside director and change status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "outcmpnyDrctrNdChangeSttus.json", ColumnNames.outside_director)
-        return df_result
-
-    def getHybridSecuritiesOutstandingBalanceInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2020007
-        [사업보고서 주요정보::16.신종자본증권 미상환 잔액]
-        정기보고서(사업, 분기, 반기보고서) 내에 신종자본증권 미상환 잔액을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get hybrid securities outstanding balance info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "newCaplScritsNrdmpBlce.json", ColumnNames.outstanding_balance)
-        return df_result
-
-    def getCapitalIncreaseDecreaseStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019004
-        [사업보고서 주요정보::17.증자(감자) 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 증자(감자) 현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get capital increase(decrease) status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "irdsSttus.json", ColumnNames.capital_inc_dec)
-        return df_result
-
-    def getDividendDetailInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019005
-        [사업보고서 주요정보::18.배당에 관한 사항]
-        정기보고서(사업, 분기, 반기보고서) 내에 배당에 관한 사항을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get dividend detail info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "alotMatter.json", ColumnNames.dividend_detail)
-        return df_result
-
-    def getTreasuryStockAcquisitionDisposalInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019006
-        [사업보고서 주요정보::19.자기주식 취득 및 처분 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 자기주식 취득 및 처분 현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get treasury stock acquisition(disposal) info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "tesstkAcqsDspsSttus.json", ColumnNames.treasury_stock)
-        return df_result
-
-    def getMajorityShareholderStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019007
-        [사업보고서 주요정보::20.최대주주 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 최대주주 현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get majority shareholder status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "hyslrSttus.json", ColumnNames.majority_shareholder)
-        return df_result
-
-    def getMajorityShareholderChangeStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019008
-        [사업보고서 주요정보::21.최대주주 변동현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 최대주주 변동현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param lang: 레이블 언어 ('ko', 'en')
+        :param reload: 디렉터리가 존재할 경우 삭제하고 다시 다운로드받을 지 여부
+        :return: pandas DataFrame (concept, context, unit, period_type, period_start, period_end, dimensions,
+                 decimals, value, value_text, label, pres_role, pres_order)
         """
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get majority shareholder change status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "hyslrChgSttus.json", ColumnNames.majority_shareholder_change)
+        self.downloadFinancialStatementsRawFile(receiptNo, rptcode, reload)
+        dest_dir = f'fs_{receiptNo}_{rptcode}'
+        path_dir = os.path.join(self._path_data_dir, dest_dir)
+        try:
+            tm_start = time.perf_counter()
+            df_result = loadXbrlPackageFacts(path_dir, lang)
+            elapsed = time.perf_counter() - tm_start
+        except Exception as e:
+            self._log(f"failed to parse xbrl package ({dest_dir}) - {e}", LogType.Error)
+            df_result = None
+        if df_result is None:
+            return self._createEmptyDataFrame(['concept', 'context', 'unit', 'period_type', 'period_start',
+                                               'period_end', 'dimensions', 'decimals', 'value', 'value_text', 'label'])
+        self._log(f"loaded {len(df_result)} xbrl facts ({dest_dir}, elapsed: {elapsed} sec)", LogType.Info)
+        self._cache.register(dest_dir, CacheEntryType.FinancialStatements)  # pkl 파일 크기 반영
         return df_result
 
-    def getMinorityShareholderStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019009
-        [사업보고서 주요정보::22.소액주주 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 소액주주 현황을 제공합니다.
+    # TODO: XBRL택사노미재무제표양식
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
+    def _isFinancialStatementsDirExistInLocal(self, receiptNo: str, reportCode: Union[ReportCode, str]) -> bool:
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get minority shareholder status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "mrhlSttus.json", ColumnNames.minority_shareholder)
-        return df_result
-
-    def getExecutivesStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019010
-        [사업보고서 주요정보::23.임원 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 임원 현황을 제공합니다.
+        path_dir = os.path.join(self._path_data_dir, f'fs_{receiptNo}_{rptcode}')
+        return os.path.isdir(path_dir)
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
+    def _removeFinancialStatementsDirInLocal(self, receiptNo: str, reportCode: Union[ReportCode, str]):
         rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get executives status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "exctvSttus.json", ColumnNames.executives_status)
-        return df_result
+        self._cache.remove(f'fs_{receiptNo}_{rptcode}', CacheEntryType.FinancialStatements)
+        path_dir = os.path.join(self._path_data_dir, f'fs_{receiptNo}_{rptcode}')
+        if os.path.isdir(path_dir):
+            shutil.rmtree(path_dir)
 
-    def getEmployeeStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019011
-        [사업보고서 주요정보::24.직원 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 직원 현황을 제공합니다.
+    """ 증권신고서 주요정보 API """
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+    @returnsResult
+    def getDeclarationInfoBatch(
+            self, method: str, corpCodes: List[str],
+            windows: List[Tuple[Union[str, datetime.date], Union[str, datetime.date]]], maxWorkers: int = None
+    ) -> Dict[str, pd.DataFrame]:
         """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get employee status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "empSttus.json", ColumnNames.employee_status)
-        return df_result
+        [증권신고서 주요정보] 일괄 조회
+        (회사 x 기간) 조합을 동시에 요청하고, group(일반사항, 발행증권 등) 별 DataFrame을 마지막에 한 번씩만 병합
 
-    def getIndivisualOfficerRemunerationStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
+        :param method: 메서드 이름 (예: 'getEquitySecuritiesInfo')
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트
+        :param windows: (시작일, 종료일) 리스트
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :return: dict (group title -> pandas DataFrame)
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019012
-        [사업보고서 주요정보::25.이사·감사의 개인별 보수 현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 이사·감사의 개인별 보수 현황을 제공합니다.
+        spec = endpoint_registry.get(method)
+        if spec is None or spec.response != ResponseShape.Group:
+            raise ValueError(f"not a group response method: {method}")
+        keys = [(c, b, e) for c in corpCodes for b, e in windows]
+        self._log(f"get declaration info batch ({method}, {len(keys)} request(s))", LogType.Command)
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get indivisual officer remuneration status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "hmvAuditIndvdlBySttus.json", ColumnNames.indivisual_officer_remuneration)
-        return df_result
+        def request(corp_code: str, date_begin, date_end) -> Dict[str, pd.DataFrame]:
+            params = self._getParamWithBeginEndDate(corp_code, date_begin, date_end)
+            return self._fetchEndpoint(spec, params, groupAsDict=True)
 
-    def getEntireOfficerRemunerationStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019013
-        [사업보고서 주요정보::26.이사·감사 전체의 보수현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 이사·감사 전체의 보수현황을 제공합니다.
+        results = [x.result for x in self._runBatch(request, keys, maxWorkers) if x.success]
+        return {title: self._concatDataFrames([x[title] for x in results], col_names)
+                for title, col_names in spec.columns}
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get entire officer remuneration status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "hmvAuditAllSttus.json", ColumnNames.entire_officer_remuneration)
-        return df_result
+    """ 주요사항보고서 주요정보 API """
 
-    def getHighestIndivisualRemunerationInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
+    @returnsResult
+    def scanMajorEvents(
+            self, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date],
+            methods: List[str] = None, maxWorkers: int = None
+    ) -> Dict[str, pd.DataFrame]:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019014
-        [사업보고서 주요정보::27.개인별 보수지급 금액(5억이상 상위5인)]
-        정기보고서(사업, 분기, 반기보고서) 내에 개인별 보수지급 금액(5억이상 상위5인)을 제공합니다.
+        [주요사항보고서 주요정보] 시장 전체 조회
+        공시검색(pbType='B')으로 기간 내 해당 주요사항보고서를 제출한 회사만 찾은 뒤,
+        그 회사들에 대해서만 상세 API를 동시에 요청한다 (전체 회사를 대상으로 요청하지 않음)
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
+        :param dateBegin: 시작일 (접수일자)
+        :param dateEnd: 종료일 (접수일자)
+        :param methods: 메서드 이름 리스트 (예: ['getRightsIssueDecisionInfo']), None이면 보고서명이 정의된 전체
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :return: dict (메서드 이름 -> pandas DataFrame)
         """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get highest indivisual remuneration info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "indvdlByPay.json", ColumnNames.indivisual_officer_remuneration)
-        return df_result
-
-    def getOtherCorporationInvestmentStatusInfo(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS002&apiId=2019015
-        [사업보고서 주요정보::28.타법인 출자현황]
-        정기보고서(사업, 분기, 반기보고서) 내에 타법인 출자현황을 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get other corporation investment status info " + info, LogType.Command)
-        df_result = self._makeBusinessReportDataFrameCommon(
-            corpCode, year, rptcode, "otrCprInvstmntSttus.json", ColumnNames.other_corp_investment)
-        return df_result
-
-    """ 상장기업 재무정보 API """
+        if methods is None:
+            specs = [x for x in endpoint_registry.values() if x.report_name is not None]
+        else:
+            specs = [endpoint_registry.get(x) for x in methods]
+            unknown = [x for x, spec in zip(methods, specs) if spec is None or spec.report_name is None]
+            if len(unknown) > 0:
+                raise ValueError(f"not a major event method: {unknown}")
+        date_begin = self._toDate(dateBegin)
+        date_end = self._toDate(dateEnd)
+        self._log(f"scan major events ({date_begin} ~ {date_end}, {len(specs)} method(s))", LogType.Command)
+
+        # corp_code 없이 공시검색 시 기간은 최대 3개월
+        frames = []
+        chunk_begin = date_begin
+        while chunk_begin <= date_end:
+            chunk_end = min(date_end, chunk_begin + datetime.timedelta(days=89))
+            frames.append(self.searchDocument(
+                dateEnd=chunk_end, dateBegin=chunk_begin, onlyLastReport=False, pbType='B'))
+            chunk_begin = chunk_end + datetime.timedelta(days=1)
+        df_search = pd.concat([x for x in frames if len(x) > 0] or frames[:1], ignore_index=True)
+        if self._rename_dataframe_column_names:
+            df_search = df_search.rename(columns={v: k for k, v in ColumnNames.search_document.items()})
+
+        keys = []
+        if len(df_search) > 0:
+            report_names = df_search['report_nm'].astype(str).str.replace(' ', '', regex=False)
+            for spec in specs:
+                matched = report_names.str.contains(spec.reportNameToken, regex=False)
+                corp_codes = list(dict.fromkeys(df_search.loc[matched, 'corp_code'].astype(str)))
+                keys.extend([(spec, x) for x in corp_codes])
+        self._log(f"found {len(keys)} (method, corp) pair(s) from {len(df_search)} filing(s)", LogType.Info)
+
+        def request(spec: EndpointSpec, corp_code: str) -> pd.DataFrame:
+            params = self._getParamWithBeginEndDate(corp_code, date_begin, date_end)
+            return self._fetchEndpoint(spec, params)
+
+        results = self._runBatch(request, keys, maxWorkers)
+        result = dict()
+        for spec in specs:
+            frames = [x.result for x in results if x.success and x.key[0] is spec]
+            result[spec.name] = self._concatDataFrames(frames, spec.columns)
+        return result
 
-    def getSingleFinancialInformation(
-            self, corpCode: str, year: int, reportCode: Union[ReportCode, str]
+    @staticmethod
+    def _toDate(value: Union[str, datetime.date]) -> datetime.date:
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        return datetime.datetime.strptime(value, '%Y%m%d').date()
+
+    """ 로컬 메타데이터 사본 (mirror.py) """
+
+    @returnsResult
+    def queryLocalFilings(
+            self, corpCode: str = None, dateBegin: Union[str, datetime.date] = None,
+            dateEnd: Union[str, datetime.date] = None, pbType: str = None, pbTypeDetail: str = None,
+            corpCls: str = None, limit: int = None
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019016
-        [상장기업 재무정보::1.단일회사 주요계정]
-        상장법인(금융업 제외)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
+        로컬 사본(setEnableMetadataMirror(True) 이후 공시검색으로 받은 공시)에서 공시 목록 조회 (API 요청 없음)
 
         :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
-        :return: pandas DataFrame
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get single financial information " + info, LogType.Command)
-        params = {'corp_code': corpCode, 'bsns_year': str(max(2015, year)), 'reprt_code': rptcode}
-        json = self._requestAndGetJson(url_opendart.format("fnlttSinglAcnt.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.financial)
-
-        df_result = self._makeDataFrameFromJsonList(json, ColumnNames.financial)
-        return df_result
+        :param dateBegin: 접수일자 시작
+        :param dateEnd: 접수일자 종료
+        :param pbType: 공시유형 (공시유형을 지정해 검색한 공시만 해당)
+        :param pbTypeDetail: 공시상세유형 (공시상세유형을 지정해 검색한 공시만 해당)
+        :param corpCls: 법인구분 (Y, K, N, E)
+        :param limit: 최대 결과 수
+        :return: pandas DataFrame (접수일자 내림차순)
+        """
+        if self._metadata_mirror is None:
+            self._log("metadata mirror is not enabled", LogType.Error)
+            return self._createEmptyDataFrame(ColumnNames.local_filing)
+        date_begin = self._toDate(dateBegin).strftime('%Y%m%d') if dateBegin is not None else None
+        date_end = self._toDate(dateEnd).strftime('%Y%m%d') if dateEnd is not None else None
+        df_result = self._metadata_mirror.queryFilings(
+            corpCode, date_begin, date_end, pbType, pbTypeDetail, corpCls, limit)
+        if self._rename_dataframe_column_names:
+            df_result.rename(columns=ColumnNames.local_filing, inplace=True)
+        return self._convertColumnTypes(df_result, ColumnNames.local_filing)
 
-    def getMultiFinancialInformation(
-            self, corpCode: List[str], year: int, reportCode: Union[ReportCode, str]
+    @returnsResult
+    def queryLocalCompanies(
+            self, indutyCode: str = None, corpCls: str = None, name: str = None
     ) -> pd.DataFrame:
         """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019017
-        [상장기업 재무정보::2.다중회사 주요계정]
-        상장법인(금융업 제외)이 제출한 정기보고서 내에 XBRL재무제표의 주요계정과목(재무상태표, 손익계산서)을 제공합니다.
-        (상장법인 복수조회 가능)
+        로컬 사본(기업개황 응답)에서 회사 조회 (API 요청 없음, syncCompanyMirror로 상장회사 기업개황을 미리 채울 수 있다)
 
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param year: 사업연도, 2015년 이후 부터 정보제공
-        :param reportCode: 보고서 코드
+        :param indutyCode: 업종코드 (앞자리 일치)
+        :param corpCls: 법인구분 (Y, K, N, E)
+        :param name: 회사명(정식명칭/종목명)에 포함된 문자열
         :return: pandas DataFrame
         """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
-        self._log("get multiple financial information " + info, LogType.Command)
-        params = {'corp_code': ','.join(corpCode), 'bsns_year': str(max(2015, year)), 'reprt_code': rptcode}
-        json = self._requestAndGetJson(url_opendart.format("fnlttMultiAcnt.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.financial)
-
-        df_result = self._makeDataFrameFromJsonList(json, ColumnNames.financial)
-        return df_result
-
-    def downloadFinancialStatementsRawFile(
-            self, receiptNo: str, reportCode: Union[ReportCode, str], reload: bool = False
-    ):
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS003&apiId=2019019
-        [상장기업 재무정보::3.재무제표 원본파일(XBRL)]
-        상장법인이 제출한 정기보고서 내에 XBRL재무제표의 원본파일(XBRL)을 제공합니다.
-
-        :param receiptNo: 접수번호
-        :param reportCode: 보고서 코드
-        :param reload: 디렉터리가 존재할 경우 삭제하고 다시 다운로드받을 지 여부
-        """
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        if reload:
-            self._removeFinancialStatementsDirInLocal(receiptNo, rptcode)
-        if not self._isFinancialStatementsDirExistInLocal(receiptNo, rptcode):
-            info = f"(receipt no: {receiptNo}, report code: {rptcode})"
-            self._log("download financial statements raw file " + info, LogType.Command)
-            params = {'rcept_no': receiptNo, 'reprt_code': rptcode}
-            dest_dir = f'fs_{receiptNo}_{rptcode}'
-            try:
-                self._requestAndExtractZipFile(url_opendart.format("fnlttXbrl.xml"), dest_dir, **params)
-            except ResponseException as e:
-                self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-
-    # TODO: 단일회사 전체 재무제표, XBRL택사노미재무제표양식
-
-    def _isFinancialStatementsDirExistInLocal(self, receiptNo: str, reportCode: Union[ReportCode, str]) -> bool:
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        path_dir = os.path.join(self._path_data_dir, f'fs_{receiptNo}_{rptcode}')
-        return os.path.isdir(path_dir)
-
-    def _removeFinancialStatementsDirInLocal(self, receiptNo: str, reportCode: Union[ReportCode, str]):
-        rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
-        path_dir = os.path.join(self._path_data_dir, f'fs_{receiptNo}_{rptcode}')
-        if os.path.isdir(path_dir):
-            shutil.rmtree(path_dir)
-
-    """ 지분공시 종합정보 API """
-
-    def getMajorStockInformation(
-            self, corpCode: str
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS004&apiId=2019021
-        [지분공시 종합정보::1.대량보유 상황보고]
-        주식등의 대량보유상황보고서 내에 대량보유 상황보고 정보를 제공합니다.
-
+        if self._metadata_mirror is None:
+            self._log("metadata mirror is not enabled", LogType.Error)
+            return self._createEmptyDataFrame(ColumnNames.company)
+        df_result = self._metadata_mirror.queryCompanies(indutyCode, corpCls, name)
+        if self._rename_dataframe_column_names:
+            df_result.rename(columns=ColumnNames.company, inplace=True)
+        return self._convertColumnTypes(df_result, ColumnNames.company)
+
+    def syncCompanyMirror(
+            self, corpCodes: List[str] = None, maxAgeDays: int = None, maxWorkers: int = None
+    ) -> int:
+        """
+        로컬 사본에 기업개황이 없는(또는 maxAgeDays일보다 오래된) 회사만 기업개황을 요청해 갱신
+
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트 (None이면 종목코드가 있는 상장회사 전체)
+        :param maxAgeDays: 기업개황을 다시 요청할 경과 일수 (None이면 이미 있는 회사는 요청하지 않음)
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :return: 갱신한 회사 수
+        """
+        if self._metadata_mirror is None:
+            self._log("metadata mirror is not enabled", LogType.Error)
+            return 0
+        if corpCodes is None:
+            corpCodes = self._metadata_mirror.getListedCorpCodes()
+        updated = self._metadata_mirror.getCompanyUpdateTimes()
+        cutoff = time.time() - maxAgeDays * 24 * 60 * 60 if maxAgeDays is not None else None
+        targets = [x for x in dict.fromkeys(corpCodes)
+                   if x not in updated or (cutoff is not None and updated[x] < cutoff)]
+        self._log(f"sync company mirror ({len(targets)} request(s))", LogType.Command)
+        results = self._runBatch(self.getCompanyInformation, [(x,) for x in targets], maxWorkers)
+        return len([x for x in results if x.success and len(x.result) > 0])
+
+    """ 대용량 조회 결과 내보내기 (sink.py) """
+
+    def exportSearchDocument(
+            self, path: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date] = None,
+            corpCode: str = None, pbType: str = None, pbTypeDetail: str = None, onlyLastReport: bool = False
+    ) -> int:
+        """
+        [공시정보::1.공시검색] 결과를 메모리에 모으지 않고 페이지 단위로 Parquet 데이터셋에 기록
+        {path}/endpoint=list/year={연도}/month={월}/part-*.parquet (접수일자 기준 분할, 원본 필드명 + typed 열)
+        월 단위로 조회하고 완료한 달은 manifest에 기록해 재실행 시 건너뛰며, 접수번호(rcept_no)가 이미 기록된 행은 제외한다
+        (당일이 포함된 달은 이후 공시가 추가될 수 있으므로 완료 처리하지 않는다)
+
+        :param path: 데이터셋 경로
+        :param dateBegin: 검색시작 접수일자
+        :param dateEnd: 검색종료 접수일자, 기본값 = 호출당일
         :param corpCode: 공시대상회사의 고유번호(8자리)
-        :return: pandas DataFrame
-        """
-        self._log(f"get major stock information (corp code: {corpCode})", LogType.Command)
-        params = {'corp_code': corpCode}
-        json = self._requestAndGetJson(url_opendart.format("majorstock.json"), **params)
+        :param pbType: 공시유형 (define -> dict_pblntf_ty 참고)
+        :param pbTypeDetail: 공시유형 (define -> dict_pblntf_detail_ty 참고)
+        :param onlyLastReport: 최종보고서만 검색여부
+        :return: 새로 기록한 행 수
+        """
+        date_begin = self._toDate(dateBegin)
+        date_end = self._toDate(dateEnd) if dateEnd is not None else datetime.date.today()
+        self._log(f"export search document ({date_begin} ~ {date_end}) to {path}", LogType.Command)
+        sink = ParquetDatasetSink(path, key_columns=['rcept_no'])
+        filters = '/'.join([corpCode or '*', pbType or '*', pbTypeDetail or '*', 'Y' if onlyLastReport else 'N'])
+        rows = 0
+        chunk_begin = date_begin
         try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.major_stock)
-
-        df_result = self._makeDataFrameFromJsonList(json, ColumnNames.major_stock)
-        return df_result
-
-    def getExecutiveStockInformation(
-            self, corpCode: str
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/main.do?apiGrpCd=DS004
-        [지분공시 종합정보::2.임원ㆍ주요주주 소유보고]
-        임원ㆍ주요주주특정증권등 소유상황보고서 내에 임원ㆍ주요주주 소유보고 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :return: pandas DataFrame
-        """
-        self._log(f"get executive stock information (corp code: {corpCode})", LogType.Command)
-        params = {'corp_code': corpCode}
-        json = self._requestAndGetJson(url_opendart.format("elestock.json"), **params)
+            while chunk_begin <= date_end:
+                next_month = (chunk_begin.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+                chunk_end = min(date_end, next_month - datetime.timedelta(days=1))
+                chunk = f"list/{filters}/{chunk_begin.strftime('%Y%m%d')}-{chunk_end.strftime('%Y%m%d')}"
+                if not sink.isChunkDone(chunk):
+                    params = self._makeSearchDocumentParameters(
+                        corpCode, chunk_end, chunk_begin, onlyLastReport, 1, 100, pbType, pbTypeDetail)
+                    try:
+                        for records in self._iterSearchDocumentPages(params):
+                            self._invalidateCorrectedReports(records)
+                            if self._metadata_mirror is not None:
+                                self._metadata_mirror.upsertFilings(records, pbType, pbTypeDetail)
+                            rows += self._writeSearchDocumentRecords(sink, records)
+                    except ResponseException as e:
+                        if e.status_code != 13:  # 013 = 조회된 데이타가 없음
+                            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+                            break
+                    if chunk_end < datetime.date.today():
+                        sink.commitChunk(chunk)
+                chunk_begin = chunk_end + datetime.timedelta(days=1)
+        finally:
+            sink.close()
+        self._log(f"exported {rows} row(s) to {path}", LogType.Info)
+        return rows
+
+    def _writeSearchDocumentRecords(self, sink: ParquetDatasetSink, records: List[dict]) -> int:
+        months = dict()
+        for record in records:
+            months.setdefault(str(record.get('rcept_dt'))[:6], []).append(record)
+        rows = 0
+        for month, month_records in months.items():
+            df = self._applyColumnTypes(pd.DataFrame(month_records))
+            rows += sink.write(df, (('endpoint', 'list'), ('year', month[:4]), ('month', month[4:])))
+        return rows
+
+    def exportBusinessReportInfo(
+            self, path: str, corpCodes: List[str], years: List[int], reportCodes: List[Union[ReportCode, str]],
+            apis: List[str] = None, maxWorkers: int = None
+    ) -> int:
+        """
+        [사업보고서 주요정보] 일괄 조회 결과를 메모리에 모으지 않고 Parquet 데이터셋에 기록
+        {path}/endpoint={API 이름}/year={사업연도}/part-*.parquet (원본 필드명 + typed 열 + 요청 인자 열)
+        (API x 회사 x 사업연도 x 보고서 코드) 단위로 완료 여부를 manifest에 기록해 재실행 시 완료된 요청은 건너뛴다
+        (조회된 데이터가 없는 요청(013)은 완료로 기록하고, 그 외 오류가 발생한 요청은 다음 실행 때 다시 요청한다)
+
+        :param path: 데이터셋 경로
+        :param corpCodes: 공시대상회사의 고유번호(8자리) 리스트
+        :param years: 사업연도 리스트
+        :param reportCodes: 보고서 코드 리스트
+        :param apis: API 이름 리스트 (business_report_apis 참고), None이면 전체
+        :param maxWorkers: 동시 요청 수 (기본값 = setMaxConcurrentRequests 설정값)
+        :return: 새로 기록한 행 수
+        """
+        apis = list(business_report_apis.keys()) if apis is None else [x.replace('.json', '') for x in apis]
+        unknown = [x for x in apis if x not in business_report_apis]
+        if len(unknown) > 0:
+            raise ValueError(f"unknown business report api: {unknown}")
+        rptcodes = [x.value if isinstance(x, ReportCode) else x for x in reportCodes]
+        sink = ParquetDatasetSink(path)
+        keys = [(a, c, y, r) for a in apis for c in corpCodes for y in years for r in rptcodes]
+        keys = [x for x in keys if not sink.isChunkDone('/'.join([str(v) for v in x]))]
+        self._log(f"export business report info ({len(keys)} request(s)) to {path}", LogType.Command)
+        # 결과를 일정 개수씩 나누어 요청하고 바로 기록해 메모리 사용량을 제한
+        step = (maxWorkers or self._executor.maxWorkers) * 16
+        rows = 0
         try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(ColumnNames.executive_stock)
-
-        df_result = self._makeDataFrameFromJsonList(json, ColumnNames.executive_stock)
-        return df_result
-
-    """ 주요사항보고서 주요정보 API """
+            for i in range(0, len(keys), step):
+                results = self._runBatch(self._requestBusinessReportForExport, keys[i:i + step], maxWorkers)
+                for result in results:
+                    if not result.success:
+                        continue
+                    api, _, year, _ = result.key
+                    rows += sink.write(result.result, (('endpoint', api), ('year', year)))
+                    sink.commitChunk('/'.join([str(v) for v in result.key]))
+        finally:
+            sink.close()
+        self._log(f"exported {rows} row(s) to {path}", LogType.Info)
+        return rows
+
+    def _requestBusinessReportForExport(self, api: str, corp_code: str, year: int, rpt_code: str) -> pd.DataFrame:
+        spec = business_report_apis[api]
+        params, _ = self._makeEndpointParameters(spec, corp_code, year, rpt_code)
+        json = self._requestEndpointJson(spec, params)
+        if json.get('status') == '013':
+            return pd.DataFrame()
+        self._checkResponseStatus(json)
+        df = pd.DataFrame(json.get('list'))
+        for i, (key, value) in enumerate(zip(ColumnNames.batch_request_key.keys(), [corp_code, year, rpt_code])):
+            df.insert(i, key, value)
+        return self._applyColumnTypes(df, dtypes=spec.dtypes)
+
+    """ 선언적 API 정의 (endpoints.py) 공통 처리 """
 
     @staticmethod
     def _getParamWithBeginEndDate(
@@ -1314,346 +1977,77 @@ class OpenDart:
             params['end_de'] = dateEnd
         return params
 
-    def _makeHighlightsDataFrameCommon(
-            self, corp_code: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date],
-            api: str, col_names: dict
-    ) -> pd.DataFrame:
-        params = self._getParamWithBeginEndDate(corp_code, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format(api), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            return self._createEmptyDataFrame(col_names)
-        df_result = self._makeDataFrameFromJsonList(json, col_names)
-        return df_result
-
-    def getBankruptcyOccurrenceInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020019
-        [주요사항보고서 주요정보::1.부도발생]
-        주요사항보고서(부도발생) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get bankruptcy occurrence info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "dfOcr.json", ColumnNames.bankruptcy)
-        return df_result
-
-    def getBusinessSuspensionInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020020
-        [주요사항보고서 주요정보::2.영업정지]
-        주요사항보고서(영업정지) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get business suspension info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "bsnSp.json", ColumnNames.suspension)
-        return df_result
-
-    def getRehabilitationProcedureInitiateInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020021
-        [주요사항보고서 주요정보::3.회생절차 개시신청]
-        주요사항보고서(회생절차 개시신청) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get rehabilitation procedure initiate info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "ctrcvsBgrq.json", ColumnNames.rehabilitation)
-        return df_result
-
-    def getDissolutionReasonOccurrenceInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020022
-        [주요사항보고서 주요정보::4.해산사유 발생]
-        주요사항보고서(해산사유 발생) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get dissolution reason occurrence info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "dsRsOcr.json", ColumnNames.dissolution)
-        return df_result
-
-    def getRightsIssueDecisionInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020023
-        [주요사항보고서 주요정보::5.유상증자 결정]
-        주요사항보고서(유상증자 결정) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get rights issue decision info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "piicDecsn.json", ColumnNames.rights_issue_decision)
-        return df_result
-
-    def getBonusIssueDecisionInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020024
-        [주요사항보고서 주요정보::6.무상증자 결정]
-        주요사항보고서(무상증자 결정) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get bonus issue decision info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "fricDecsn.json", ColumnNames.bonus_issue_decision)
-        return df_result
-
-    def getRightsBonusIssueDecisionInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> pd.DataFrame:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS005&apiId=2020025
-        [주요사항보고서 주요정보::7.유무상증자 결정]
-        주요사항보고서(유무상증자 결정) 내에 주요 정보를 제공합니다.
-
-        :param corpCode: 공시대상회사의 고유번호(8자리)
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: pandas DataFrame
-        """
-        info = f"(corp code: {corpCode})"
-        self._log("get rights/bonus issue decision info " + info, LogType.Command)
-        df_result = self._makeHighlightsDataFrameCommon(
-            corpCode, dateBegin, dateEnd, "pifricDecsn.json", ColumnNames.rights_bonus_issue_decision)
-        return df_result
-
-    # TODO: 감자 결정 ~
-
-    """ 증권신고서 주요정보 API """
-
-    def getStockExchangeInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020058
-        [증권신고서 주요정보::1.주식의포괄적교환·이전]
-        증권신고서(주식의포괄적교환·이전) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames (일반사항, 발행증권, 당사회사에관한사항)
-        """
-        self._log(f"get declaration info - stock exchange ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("extrRs.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_stock = self._createEmptyDataFrame(ColumnNames.declaration_stock)
-            df_detail = self._createEmptyDataFrame(ColumnNames.declaration_detail)
-            return df_normal, df_stock, df_detail
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_stock = self._makeDataFrameFromJsonGroup(json, '발행증권', ColumnNames.declaration_stock)
-        df_detail = self._makeDataFrameFromJsonGroup(json, '당사회사에관한사항', ColumnNames.declaration_detail)
-        return df_normal, df_stock, df_detail
-
-    def getMergeInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020057
-        [증권신고서 주요정보::2.합병]
-        증권신고서(합병) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames (일반사항, 발행증권, 당사회사에관한사항)
-        """
-        self._log(f"get declaration info - merge ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("mgRs.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_stock = self._createEmptyDataFrame(ColumnNames.declaration_stock)
-            df_detail = self._createEmptyDataFrame(ColumnNames.declaration_detail)
-            return df_normal, df_stock, df_detail
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_stock = self._makeDataFrameFromJsonGroup(json, '발행증권', ColumnNames.declaration_stock)
-        df_detail = self._makeDataFrameFromJsonGroup(json, '당사회사에관한사항', ColumnNames.declaration_detail)
-        return df_normal, df_stock, df_detail
-
-    def getDepositaryReceiptInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020056
-        [증권신고서 주요정보::3.증권예탁증권]
-        증권신고서(증권예탁증권) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames (일반사항, 증권의종류, 인수인정보, 자금의사용목적, 매출인에관한사항)
-        """
-        self._log(f"get declaration info - depositary receipt ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("stkdpRs.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_type = self._createEmptyDataFrame(ColumnNames.declaration_type)
-            df_takeover = self._createEmptyDataFrame(ColumnNames.declaration_takeover)
-            df_purpose = self._createEmptyDataFrame(ColumnNames.declaration_purpose)
-            df_seller = self._createEmptyDataFrame(ColumnNames.declaration_seller)
-            return df_normal, df_type, df_takeover, df_purpose, df_seller
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_type = self._makeDataFrameFromJsonGroup(json, '증권의종류', ColumnNames.declaration_type)
-        df_takeover = self._makeDataFrameFromJsonGroup(json, '인수인정보', ColumnNames.declaration_takeover)
-        df_purpose = self._makeDataFrameFromJsonGroup(json, '자금의사용목적', ColumnNames.declaration_purpose)
-        df_seller = self._makeDataFrameFromJsonGroup(json, '매출인에관한사항', ColumnNames.declaration_seller)
-        return df_normal, df_type, df_takeover, df_purpose, df_seller
-
-    def getDebtSecuritiesInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020055
-        [증권신고서 주요정보::4.채무증권]
-        증권신고서(채무증권) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames (일반사항, 인수인정보, 자금의사용목적, 매출인에관한사항)
-        """
-        self._log(f"get declaration info - dept securites ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("bdRs.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_takeover = self._createEmptyDataFrame(ColumnNames.declaration_takeover)
-            df_purpose = self._createEmptyDataFrame(ColumnNames.declaration_purpose)
-            df_seller = self._createEmptyDataFrame(ColumnNames.declaration_seller)
-            return df_normal, df_takeover, df_purpose, df_seller
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_takeover = self._makeDataFrameFromJsonGroup(json, '인수인정보', ColumnNames.declaration_takeover)
-        df_purpose = self._makeDataFrameFromJsonGroup(json, '자금의사용목적', ColumnNames.declaration_purpose)
-        df_seller = self._makeDataFrameFromJsonGroup(json, '매출인에관한사항', ColumnNames.declaration_seller)
-        return df_normal, df_takeover, df_purpose, df_seller
-
-    def getEquitySecuritiesInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020054
-        [증권신고서 주요정보::5.지분증권]
-        증권신고서(지분증권) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames
-                 (일반사항, 증권의 종류, 인수인정보, 자금의사용목적, 매출인에관한사항, 일반청약자환매청구권)
-        """
-        self._log(f"get declaration info - equity securites ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("estkRs.json"), **params)
-        try:
-            self._checkResponseStatus(json)
-        except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_type = self._createEmptyDataFrame(ColumnNames.declaration_type)
-            df_takeover = self._createEmptyDataFrame(ColumnNames.declaration_takeover)
-            df_purpose = self._createEmptyDataFrame(ColumnNames.declaration_purpose)
-            df_seller = self._createEmptyDataFrame(ColumnNames.declaration_seller)
-            df_putback = self._createEmptyDataFrame(ColumnNames.declaration_putback)
-            return df_normal, df_type, df_takeover, df_purpose, df_seller, df_putback
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_type = self._makeDataFrameFromJsonGroup(json, '증권의종류', ColumnNames.declaration_type)
-        df_takeover = self._makeDataFrameFromJsonGroup(json, '인수인정보', ColumnNames.declaration_takeover)
-        df_purpose = self._makeDataFrameFromJsonGroup(json, '자금의사용목적', ColumnNames.declaration_purpose)
-        df_seller = self._makeDataFrameFromJsonGroup(json, '매출인에관한사항', ColumnNames.declaration_seller)
-        df_putback = self._makeDataFrameFromJsonGroup(json, '일반청약자환매청구권', ColumnNames.declaration_putback)
-        return df_normal, df_type, df_takeover, df_purpose, df_seller, df_putback
-
-    def getDivisionInfo(
-            self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
-    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-        """
-        https://opendart.fss.or.kr/guide/detail.do?apiGrpCd=DS006&apiId=2020059
-        [증권신고서 주요정보::6.분할]
-        증권신고서(분할) 내에 요약 정보를 제공합니다.
-
-        :param corpCode: 고유번호
-        :param dateBegin: 시작일
-        :param dateEnd: 종료일
-        :return: tuple of pandas DataFrames (일반사항, 발행증권, 당사회사에관한사항)
-        """
-        self._log(f"get declaration info - division ({corpCode})", LogType.Command)
-        params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
-        json = self._requestAndGetJson(url_opendart.format("dvRs.json"), **params)
+    def _makeEndpointParameters(self, spec: EndpointSpec, *args) -> Tuple[dict, str]:
+        if spec.params == ParamShape.CorpYearReport:
+            corpCode, year, reportCode = args
+            rptcode = reportCode.value if isinstance(reportCode, ReportCode) else reportCode
+            params = {'corp_code': corpCode, 'bsns_year': str(max(2015, year)), 'reprt_code': rptcode}
+            info = f"(corp code: {corpCode}, year: {year}, report code: {rptcode})"
+        elif spec.params == ParamShape.CorpDateRange:
+            corpCode, dateBegin, dateEnd = args
+            params = self._getParamWithBeginEndDate(corpCode, dateBegin, dateEnd)
+            info = f"(corp code: {corpCode})"
+        else:
+            corpCode, = args
+            params = {'corp_code': corpCode}
+            info = f"(corp code: {corpCode})"
+        return params, info
+
+    def _requestEndpoint(self, spec: EndpointSpec, *args) -> Union[pd.DataFrame, Tuple[pd.DataFrame, ...]]:
+        params, info = self._makeEndpointParameters(spec, *args)
+        self._log(f"{spec.log} {info}", LogType.Command)
+        return self._fetchEndpoint(spec, params, backend=self._getCallBackend())
+
+    def _fetchEndpoint(
+            self, spec: EndpointSpec, params: dict, groupAsDict: bool = False, backend: ResultBackend = None,
+            raiseOnError: bool = False
+    ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, ...], Dict[str, pd.DataFrame]]:
+        # raiseOnError = True 이면 데이터 없음(013) 외의 응답 오류는 ResponseException 발생 (일괄 조회에서 실패로 집계)
+        json = self._requestEndpointJson(spec, params)
         try:
             self._checkResponseStatus(json)
         except ResponseException as e:
-            self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
-            df_normal = self._createEmptyDataFrame(ColumnNames.declaration_normal)
-            df_stock = self._createEmptyDataFrame(ColumnNames.declaration_stock)
-            df_detail = self._createEmptyDataFrame(ColumnNames.declaration_detail)
-            return df_normal, df_stock, df_detail
-
-        df_normal = self._makeDataFrameFromJsonGroup(json, '일반사항', ColumnNames.declaration_normal)
-        df_stock = self._makeDataFrameFromJsonGroup(json, '발행증권', ColumnNames.declaration_stock)
-        df_detail = self._makeDataFrameFromJsonGroup(json, '당사회사에관한사항', ColumnNames.declaration_detail)
-        return df_normal, df_stock, df_detail
+            if raiseOnError and e.status_code != 13:
+                raise
+            if not raiseOnError:
+                self._log(f"response exception({e.status_code}) - {e.message}", LogType.Error)
+            if spec.response == ResponseShape.List:
+                return self._createEmptyDataFrame(spec.columns, backend)
+            json = dict()
+        if spec.response == ResponseShape.List:
+            return self._makeDataFrameFromJsonList(json, spec.columns, spec.dtypes, backend)
+        frames = self._makeDataFramesFromJsonGroups(json, spec.columns, spec.dtypes, backend)
+        return frames if groupAsDict else tuple(frames.values())
+
+    def _requestEndpointJson(self, spec: EndpointSpec, params: dict) -> dict:
+        return self._requestCachedJson(spec.path, params, spec.cache_ttl)
+
+
+def _makeEndpointMethod(spec: EndpointSpec):
+    if spec.params == ParamShape.CorpYearReport:
+        def method(self, corpCode: str, year: int, reportCode: Union[ReportCode, str]):
+            return self._requestEndpoint(spec, corpCode, year, reportCode)
+    elif spec.params == ParamShape.CorpDateRange:
+        def method(
+                self, corpCode: str, dateBegin: Union[str, datetime.date], dateEnd: Union[str, datetime.date]
+        ):
+            return self._requestEndpoint(spec, corpCode, dateBegin, dateEnd)
+    else:
+        def method(self, corpCode: str):
+            return self._requestEndpoint(spec, corpCode)
+    if spec.response == ResponseShape.Group:
+        method.__annotations__['return'] = Tuple[tuple([pd.DataFrame] * len(spec.columns))]
+    else:
+        method.__annotations__['return'] = pd.DataFrame
+    method.__name__ = spec.name
+    method.__qualname__ = f'OpenDart.{spec.name}'
+    method.__doc__ = spec.makeDocString()
+    return returnsResult(method)
+
+
+for _spec in endpoint_registry.values():
+    setattr(OpenDart, _spec.name, _makeEndpointMethod(_spec))
+
+# 사업보고서 주요정보 API 이름 -> API 정의 (getBusinessReportInfoBatch 참고)
+business_report_apis = OrderedDict(
+    [(x.api, x) for x in endpoint_registry.values() if x.params == ParamShape.CorpYearReport])
@@ -0,0 +1,268 @@
+# Author: Yogyui
+import os
+import json
+import glob
+import time
+import datetime
+import operator
+import threading
+import pandas as pd
+from typing import List, Iterable, Tuple, Any
+from define import ColumnTypes
+from metrics import computeFinancialMetrics
+
+
+screen_operators = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    'in': lambda series, value: series.isin(value),
+    'between': lambda series, value: series.between(value[0], value[1])
+}
+
+
+def checkParquetEngine():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("pyarrow is required for the local columnar store (pip install pyarrow)")
+
+
+class FinancialCube:
+    """
+    상장기업 재무정보(주요계정)를 사업연도/보고서 코드 단위로 분할 저장하는 로컬 Parquet 저장소
+    {root}/bsns_year={연도}/reprt_code={보고서코드}/part-*.parquet
+    각 파티션의 _cells.json에는 데이터를 받은 회사 고유번호를, _empty_cells.json에는 데이터가 없었던 회사와 조회 시각을 기록한다
+    (데이터가 없었던 셀은 아직 공시되지 않은 기간일 수 있으므로 유효기간이 지나면 다시 조회 대상이 된다)
+    """
+    max_part_count = 8
+
+    def __init__(self, path_root: str):
+        checkParquetEngine()
+        self._path_root = path_root
+        self._lock = threading.Lock()
+        self._partition_cache = dict()  # (year, rptcode) -> (mtime, DataFrame)
+        self._screen_cache = dict()  # value -> (signature, DataFrame)
+        if not os.path.isdir(path_root):
+            os.makedirs(path_root)
+
+    @property
+    def path(self) -> str:
+        return self._path_root
+
+    def _partitionPath(self, year: int, rptcode: str) -> str:
+        return os.path.join(self._path_root, f'bsns_year={year}', f'reprt_code={rptcode}')
+
+    def _loadCells(self, year: int, rptcode: str, name: str = '_cells.json') -> dict:
+        path_file = os.path.join(self._partitionPath(year, rptcode), name)
+        if not os.path.isfile(path_file):
+            return dict()
+        with open(path_file, 'r', encoding='utf-8') as fp:
+            return json.load(fp)
+
+    def _saveCells(self, year: int, rptcode: str, cells: dict, name: str = '_cells.json'):
+        path_file = os.path.join(self._partitionPath(year, rptcode), name)
+        with open(path_file + '.tmp', 'w', encoding='utf-8') as fp:
+            json.dump(cells, fp)
+        os.replace(path_file + '.tmp', path_file)
+
+    def listPartitions(self) -> List[tuple]:
+        result = []
+        for path in glob.glob(os.path.join(self._path_root, 'bsns_year=*', 'reprt_code=*')):
+            rptcode = os.path.basename(path).split('=')[-1]
+            year = int(os.path.basename(os.path.dirname(path)).split('=')[-1])
+            result.append((year, rptcode))
+        return sorted(result)
+
+    def getMissingCorpCodes(
+            self, corp_codes: Iterable[str], year: int, rptcode: str, empty_ttl: float = 0
+    ) -> List[str]:
+        """
+        조회가 필요한 회사 고유번호 (데이터를 받은 적이 없고, 데이터가 없었던 조회가 empty_ttl초 이내에 없었던 회사)
+        """
+        cells = self._loadCells(year, rptcode)
+        empty_cells = self._loadCells(year, rptcode, '_empty_cells.json')
+        cutoff = (datetime.datetime.now() - datetime.timedelta(seconds=empty_ttl)).isoformat(timespec='seconds')
+        return [x for x in corp_codes if x not in cells and empty_cells.get(x, '') <= cutoff]
+
+    def write(self, df: pd.DataFrame, year: int, rptcode: str, corp_codes: List[str], replace: bool = False):
+        """
+        조회 결과를 파티션에 추가하고 조회한 회사를 데이터 유무에 따라 구분해 기록
+
+        :param df: 원본 필드명의 DataFrame (해당 파티션 데이터만)
+        :param year: 사업연도
+        :param rptcode: 보고서 코드
+        :param corp_codes: 조회를 완료한 회사 고유번호 (데이터가 없었던 회사 포함)
+        :param replace: 기존에 저장된 해당 회사들의 행을 교체할 지 여부
+        """
+        with self._lock:
+            path_dir = self._partitionPath(year, rptcode)
+            if not os.path.isdir(path_dir):
+                os.makedirs(path_dir)
+            parts = sorted(glob.glob(os.path.join(path_dir, 'part-*.parquet')))
+            if replace and len(parts) > 0:
+                df_prev = self._readParts(parts)
+                df = pd.concat([df_prev[~df_prev['corp_code'].isin(corp_codes)], df], ignore_index=True)
+                self._writePart(df, path_dir)
+                for path in parts:
+                    os.remove(path)
+            elif len(df) > 0:
+                self._writePart(df, path_dir)
+                if len(parts) + 1 > self.max_part_count:
+                    self._compact(path_dir)
+            filled = set(df['corp_code']) if len(df) > 0 else set()
+            cells = self._loadCells(year, rptcode)
+            empty_cells = self._loadCells(year, rptcode, '_empty_cells.json')
+            now = datetime.datetime.now().isoformat(timespec='seconds')
+            for corp_code in corp_codes:
+                if corp_code in filled:
+                    cells[corp_code] = now
+                    empty_cells.pop(corp_code, None)
+                else:
+                    if replace:
+                        cells.pop(corp_code, None)
+                    if corp_code not in cells:
+                        empty_cells[corp_code] = now
+            self._saveCells(year, rptcode, cells)
+            self._saveCells(year, rptcode, empty_cells, '_empty_cells.json')
+            self._partition_cache.pop((year, rptcode), None)
+
+    @staticmethod
+    def _writePart(df: pd.DataFrame, path_dir: str):
+        name = f'part-{time.time_ns()}.parquet'
+        df.to_parquet(os.path.join(path_dir, name), index=False)
+
+    def _compact(self, path_dir: str):
+        parts = sorted(glob.glob(os.path.join(path_dir, 'part-*.parquet')))
+        df = self._readParts(parts)
+        self._writePart(df, path_dir)
+        for path in parts:
+            os.remove(path)
+
+    @staticmethod
+    def _readParts(parts: List[str]) -> pd.DataFrame:
+        frames = [pd.read_parquet(x) for x in parts]
+        if len(frames) == 0:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        for col in df.columns:
+            if col in ColumnTypes.category:
+                df[col] = df[col].astype('category')
+        return df
+
+    def readPartition(self, year: int, rptcode: str) -> pd.DataFrame:
+        path_dir = self._partitionPath(year, rptcode)
+        parts = sorted(glob.glob(os.path.join(path_dir, 'part-*.parquet')))
+        if len(parts) == 0:
+            return pd.DataFrame()
+        mtime = max([os.path.getmtime(x) for x in parts])
+        cached = self._partition_cache.get((year, rptcode))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        df = self._readParts(parts)
+        self._partition_cache[(year, rptcode)] = (mtime, df)
+        return df
+
+    def read(self, corp_codes: List[str] = None, years: List[int] = None, rptcodes: List[str] = None) -> pd.DataFrame:
+        """
+        저장된 데이터 조회 (인자가 None이면 해당 조건으로 필터링하지 않음)
+        """
+        frames = []
+        for year, rptcode in self.listPartitions():
+            if years is not None and year not in years:
+                continue
+            if rptcodes is not None and rptcode not in rptcodes:
+                continue
+            df = self.readPartition(year, rptcode)
+            if corp_codes is not None and len(df) > 0:
+                df = df[df['corp_code'].isin(corp_codes)]
+            frames.append(df)
+        frames = [x for x in frames if len(x) > 0]
+        if len(frames) == 0:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        for col in df.columns:
+            if col in ColumnTypes.category:
+                df[col] = df[col].astype('category')
+        return df
+
+    def _getSignature(self) -> tuple:
+        signature = []
+        for year, rptcode in self.listPartitions():
+            parts = glob.glob(os.path.join(self._partitionPath(year, rptcode), 'part-*.parquet'))
+            signature.append((year, rptcode, len(parts), max([os.path.getmtime(x) for x in parts], default=0)))
+        return tuple(signature)
+
+    def readScreenTable(self, value: str = 'thstrm_amount') -> pd.DataFrame:
+        """
+        스크리닝용 wide 테이블 (계정명 열 + 파생지표 열)
+        index = (bsns_year, reprt_code, corp_code, fs_div) 로 정렬되어 있어 기간 단위 슬라이싱이 빠르며,
+        저장소 파티션이 변경되지 않으면 메모리에 캐시된 테이블을 재사용한다
+        """
+        signature = self._getSignature()
+        cached = self._screen_cache.get(value)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        df = self.read()
+        if len(df) == 0:
+            return pd.DataFrame()
+        index = ['bsns_year', 'reprt_code', 'corp_code', 'fs_div']
+        df_wide = pivotFinancialPanel(df, value).reset_index()
+        df_wide['bsns_year'] = df_wide['bsns_year'].astype(int)
+        for col in index[1:]:
+            df_wide[col] = df_wide[col].astype(str)
+        df_wide = df_wide.set_index(index)
+        df_metrics = computeFinancialMetrics(df)
+        if len(df_metrics) > 0:
+            df_metrics = df_metrics.reset_index().drop(columns='quarter').set_index(index)
+            df_wide = df_wide.join(df_metrics, how='left')
+        df_wide = df_wide.sort_index()
+        self._screen_cache[value] = (signature, df_wide)
+        return df_wide
+
+
+def screenFinancialPanel(
+        df_wide: pd.DataFrame, year: int, rptcode: str, predicates: List[Tuple[str, str, Any]],
+        fs_div: str = None, columns: List[str] = None
+) -> pd.DataFrame:
+    """
+    스크리닝용 wide 테이블에서 특정 기간(사업연도, 보고서 코드)의 조건을 모두 만족하는 회사 추출
+
+    :param df_wide: FinancialCube.readScreenTable 결과
+    :param predicates: (열 이름, 연산자, 값) 리스트, 연산자 = '>', '>=', '<', '<=', '==', '!=', 'in', 'between'
+    :param fs_div: 개별/연결구분 (None이면 전체)
+    :param columns: 반환할 열 리스트 (None이면 조건에 사용된 열)
+    """
+    if len(df_wide) == 0:
+        return pd.DataFrame()
+    try:
+        df = df_wide.loc[(year, rptcode)]
+    except KeyError:
+        return pd.DataFrame()
+    if fs_div is not None:
+        df = df[df.index.get_level_values('fs_div') == fs_div]
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in predicates:
+        if op not in screen_operators:
+            raise ValueError(f"unsupported operator: {op}")
+        if column not in df.columns:
+            raise KeyError(f"unknown column: {column}")
+        mask &= screen_operators[op](df[column], value).fillna(False).astype(bool)
+    if columns is None:
+        columns = list(dict.fromkeys([x[0] for x in predicates]))
+    return df.loc[mask.to_numpy(), columns]
+
+
+def pivotFinancialPanel(df: pd.DataFrame, value: str = 'thstrm_amount') -> pd.DataFrame:
+    """
+    long-format 재무정보를 (고유번호, 사업연도, 보고서코드, 개별/연결구분) x 계정명 형태로 변환
+    """
+    index = ['corp_code', 'bsns_year', 'reprt_code', 'fs_div']
+    if len(df) == 0:
+        return pd.DataFrame()
+    df_pivot = df.pivot_table(index=index, columns='account_nm', values=value, aggfunc='first', observed=True)
+    df_pivot.columns.name = None
+    return df_pivot
@@ -0,0 +1,170 @@
+# Author: Yogyui
+import os
+import time
+import queue
+import pickle
+import threading
+from lxml import html
+from typing import List, Iterator, Union
+from concurrent.futures import ProcessPoolExecutor, Future
+from document import DartDocument, parseDocumentRawFile, solveDocumentRawFileEncodingIssue
+
+
+class DocumentProcessResult:
+    """
+    파이프라인 처리 결과 (프로세스 간 전달을 위해 lxml 객체 대신 순수 파이썬 객체만 보관)
+    """
+    document_no: str
+    document: Union[DartDocument, None]
+    html_text: Union[str, None]
+    error: Union[str, None]
+    elapsed: float
+
+    def __init__(self, document_no: str, document: DartDocument = None, html_text: str = None,
+                 error: str = None, elapsed: float = 0.):
+        self.document_no = document_no
+        self.document = document
+        self.html_text = html_text
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f"<DocumentProcessResult doc no={self.document_no} error={self.error}>"
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def processDocumentFiles(
+        document_no: str, path_xml: str, path_pkl: str, replace_list: List[tuple], path_html: str = None
+) -> DocumentProcessResult:
+    """
+    프로세스 풀 워커에서 실행되는 후처리 (인코딩 변환 -> 구조 파싱 -> pkl 저장, html 텍스트 추출)
+    인코딩 변환 여부는 파일 내용으로 판단한다 (이전 실행에서 다운로드만 되고 변환되지 않은 파일도 변환)
+    """
+    tm_start = time.perf_counter()
+    try:
+        solveDocumentRawFileEncodingIssue(path_xml, replace_list)
+        document = parseDocumentRawFile(path_xml, document_no)
+        with open(path_pkl, 'wb') as fp:
+            pickle.dump(document, fp)
+        html_text = None
+        if path_html is not None and os.path.isfile(path_html):
+            tree = html.parse(path_html)
+            html_text = tree.getroot().text_content()
+        return DocumentProcessResult(document_no, document, html_text, elapsed=time.perf_counter() - tm_start)
+    except Exception as e:
+        return DocumentProcessResult(document_no, error=repr(e), elapsed=time.perf_counter() - tm_start)
+
+
+class DocumentPipeline:
+    """
+    다수의 공시서류를 처리하는 3단 파이프라인
+    (I/O 스레드: 다운로드) -> 제한 큐 -> (프로세스 풀: 인코딩 변환/파싱) -> 결과 이터레이터
+    결과를 소비하지 않으면 queueSize 만큼만 선행 처리한 뒤 다운로드가 대기한다
+    """
+    _stop_item = object()
+
+    def __init__(self, opendart, ioWorkers: int = 4, processWorkers: int = None, queueSize: int = 32):
+        self._opendart = opendart
+        self._io_workers = max(1, ioWorkers)
+        self._process_workers = processWorkers
+        self._queue_size = max(1, queueSize)
+
+    def run(self, document_nos: List[str], includeHtml: bool = False) -> Iterator[DocumentProcessResult]:
+        queue_download = queue.Queue(maxsize=self._queue_size)
+        queue_result = queue.Queue()
+        slots = threading.Semaphore(self._queue_size)
+        stop = threading.Event()
+        iter_lock = threading.Lock()
+        iter_document_nos = iter(dict.fromkeys(document_nos))
+        pending = set()  # 준비 단계를 거쳐 결과가 아직 반환되지 않은 문서 (원본 파일 삭제 방지 해제 대상)
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    queue_download.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def release(document_no: str):
+            with iter_lock:
+                if document_no not in pending:
+                    return
+                pending.discard(document_no)
+            self._opendart._releasePipelineDocument(document_no)
+
+        def download():
+            while not stop.is_set():
+                with iter_lock:
+                    document_no = next(iter_document_nos, None)
+                    if document_no is not None:
+                        pending.add(document_no)
+                if document_no is None:
+                    break
+                try:
+                    item = self._opendart._prepareDocumentForPipeline(document_no, includeHtml)
+                except Exception as e:
+                    item = (document_no, None, repr(e))
+                if not put(item) or stop.is_set():
+                    release(document_no)
+
+        def dispatch():
+            with ProcessPoolExecutor(self._process_workers) as pool:
+                while not stop.is_set():
+                    try:
+                        item = queue_download.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    if item is self._stop_item:
+                        break
+                    while not slots.acquire(timeout=0.5):
+                        if stop.is_set():
+                            break
+                    if stop.is_set():
+                        break
+                    document_no, args, error = item
+                    if args is None:
+                        queue_result.put(DocumentProcessResult(document_no, error=error))
+                        continue
+                    future = pool.submit(processDocumentFiles, document_no, *args)
+                    future.add_done_callback(lambda f, n=document_no: queue_result.put(self._unwrap(f, n)))
+            queue_result.put(self._stop_item)
+
+        downloaders = [threading.Thread(target=download, daemon=True) for _ in range(self._io_workers)]
+        dispatcher = threading.Thread(target=dispatch, daemon=True)
+
+        def finish():
+            for thread in downloaders:
+                thread.join()
+            put(self._stop_item)
+
+        for thread in downloaders:
+            thread.start()
+        dispatcher.start()
+        threading.Thread(target=finish, daemon=True).start()
+        try:
+            while True:
+                result = queue_result.get()
+                if result is self._stop_item:
+                    break
+                slots.release()
+                self._opendart._onPipelineResult(result)
+                release(result.document_no)
+                yield result
+        finally:
+            stop.set()
+            with iter_lock:
+                leftovers = list(pending)
+            for document_no in leftovers:
+                release(document_no)
+
+    @staticmethod
+    def _unwrap(future: Future, document_no: str) -> DocumentProcessResult:
+        try:
+            return future.result()
+        except Exception as e:
+            return DocumentProcessResult(document_no, error=repr(e))
@@ -0,0 +1,155 @@
+# Author: Yogyui
+import os
+import json
+import glob
+import time
+import datetime
+import threading
+import pandas as pd
+from typing import List, Tuple, Any
+from define import ColumnTypes
+from panel import checkParquetEngine
+
+
+class ParquetDatasetSink:
+    """
+    대량 조회 결과를 Hive 형식으로 분할된 Parquet 데이터셋에 순차적으로 기록 (메모리에는 max_buffer_rows 행까지만 보관)
+    예: {root}/endpoint=list/year=2022/month=01/part-*.parquet
+
+    _manifest.json에는 기록을 완료한 조회 단위(chunk)를 저장해 중단 후 재실행 시 완료된 단위를 건너뛰며,
+    key_columns가 지정되면 같은 파티션에 이미 기록된 키(예: rcept_no)를 가진 행은 다시 기록하지 않는다
+    """
+    max_buffer_rows = 50000
+    max_pending_chunks = 1000
+
+    def __init__(self, path_root: str, key_columns: List[str] = None):
+        checkParquetEngine()
+        self._path_root = path_root
+        self._path_manifest = os.path.join(path_root, '_manifest.json')
+        self._key_columns = key_columns
+        self._lock = threading.Lock()
+        self._buffers = dict()  # partition path -> list of DataFrame
+        self._buffer_rows = 0
+        self._pending_chunks = []  # 버퍼에 데이터가 남아 있는 완료 단위 (flush 후 manifest에 기록)
+        self._partition_keys = dict()  # partition path -> set of key tuple
+        if not os.path.isdir(path_root):
+            os.makedirs(path_root)
+        self._manifest = self._loadManifest()
+
+    @property
+    def path(self) -> str:
+        return self._path_root
+
+    def _loadManifest(self) -> dict:
+        manifest = {'key_columns': self._key_columns, 'chunks': dict(), 'row_count': 0}
+        if os.path.isfile(self._path_manifest):
+            with open(self._path_manifest, 'r', encoding='utf-8') as fp:
+                manifest.update(json.load(fp))
+        return manifest
+
+    def _saveManifest(self):
+        with open(self._path_manifest + '.tmp', 'w', encoding='utf-8') as fp:
+            json.dump(self._manifest, fp, ensure_ascii=False, indent=1)
+        os.replace(self._path_manifest + '.tmp', self._path_manifest)
+
+    def _partitionPath(self, partition: Tuple[Tuple[str, Any], ...]) -> str:
+        return os.path.join(self._path_root, *[f'{k}={v}' for k, v in partition])
+
+    def isChunkDone(self, chunk: str) -> bool:
+        return chunk in self._manifest['chunks']
+
+    def getRowCount(self) -> int:
+        return self._manifest['row_count']
+
+    def _getPartitionKeys(self, path_dir: str) -> set:
+        keys = self._partition_keys.get(path_dir)
+        if keys is None:
+            keys = set()
+            for path in glob.glob(os.path.join(path_dir, 'part-*.parquet')):
+                df = pd.read_parquet(path, columns=self._key_columns)
+                keys.update(zip(*[df[x].astype(str) for x in self._key_columns]))
+            self._partition_keys[path_dir] = keys
+        return keys
+
+    def write(self, df: pd.DataFrame, partition: Tuple[Tuple[str, Any], ...]) -> int:
+        """
+        파티션에 행 추가 (버퍼가 가득 차면 파일로 기록)
+
+        :param df: 원본 필드명의 DataFrame
+        :param partition: ((파티션 열 이름, 값), ...) 예: (('endpoint', 'list'), ('year', 2022), ('month', '01'))
+        :return: 중복을 제외하고 추가된 행 수
+        """
+        if len(df) == 0:
+            return 0
+        with self._lock:
+            path_dir = self._partitionPath(partition)
+            if self._key_columns:
+                keys = self._getPartitionKeys(path_dir)
+                mask = []
+                for key in zip(*[df[x].astype(str) for x in self._key_columns]):
+                    mask.append(key not in keys)
+                    keys.add(key)
+                df = df[mask]
+                if len(df) == 0:
+                    return 0
+            self._buffers.setdefault(path_dir, []).append(df)
+            self._buffer_rows += len(df)
+            if self._buffer_rows >= self.max_buffer_rows:
+                self._flush()
+            return len(df)
+
+    def commitChunk(self, chunk: str):
+        """
+        조회 단위 완료 표시 (해당 단위의 행이 모두 파일로 기록된 후 manifest에 저장된다)
+        """
+        with self._lock:
+            self._pending_chunks.append(chunk)
+            if len(self._pending_chunks) >= self.max_pending_chunks:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        for path_dir, frames in self._buffers.items():
+            if not os.path.isdir(path_dir):
+                os.makedirs(path_dir)
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            name = f'part-{time.time_ns()}.parquet'
+            df.to_parquet(os.path.join(path_dir, name + '.tmp'), index=False)
+            os.replace(os.path.join(path_dir, name + '.tmp'), os.path.join(path_dir, name))
+        now = datetime.datetime.now().isoformat(timespec='seconds')
+        self._manifest['chunks'].update({x: now for x in self._pending_chunks})
+        self._manifest['row_count'] += self._buffer_rows
+        self._buffers.clear()
+        self._buffer_rows = 0
+        self._pending_chunks.clear()
+        self._saveManifest()
+
+    def close(self):
+        self.flush()
+        self._partition_keys.clear()
+
+    def read(self, **partition) -> pd.DataFrame:
+        """
+        기록된 데이터 조회 (파티션 열 이름=값 으로 필터링, 예: read(endpoint='list', year=2022))
+        파일 별로 열 구성이 다를 수 있으므로 파일 단위로 읽어 병합한다
+        """
+        frames = []
+        for path in sorted(glob.glob(os.path.join(self._path_root, '**', 'part-*.parquet'), recursive=True)):
+            directory = os.path.relpath(os.path.dirname(path), self._path_root)
+            values = dict([x.split('=', 1) for x in directory.split(os.sep) if '=' in x])
+            if any([values.get(k) != str(v) for k, v in partition.items()]):
+                continue
+            df = pd.read_parquet(path)
+            for name, value in values.items():
+                df[name] = value
+            frames.append(df)
+        if len(frames) == 0:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        for col in df.columns:
+            if col in ColumnTypes.category:
+                df[col] = df[col].astype('category')
+        return df
@@ -0,0 +1,256 @@
+# Author: Yogyui
+import queue
+import asyncio
+import datetime
+import threading
+from collections import OrderedDict
+from typing import List, Iterator, AsyncIterator, Union
+from Util import Callback
+
+
+timezone_kst = datetime.timezone(datetime.timedelta(hours=9))
+
+
+class Filing:
+    """
+    새로 접수된 공시 1건 (list.json 응답 레코드)
+    """
+    rcept_no: str
+    corp_code: str
+    corp_name: str
+    stock_code: str
+    corp_cls: str
+    report_nm: str
+    flr_nm: str
+    rcept_dt: str
+    rm: str
+    detected_at: datetime.datetime
+
+    def __init__(self, record: dict, detected_at: datetime.datetime = None):
+        self.rcept_no = record.get('rcept_no')
+        self.corp_code = record.get('corp_code')
+        self.corp_name = record.get('corp_name')
+        self.stock_code = record.get('stock_code')
+        self.corp_cls = record.get('corp_cls')
+        self.report_nm = record.get('report_nm')
+        self.flr_nm = record.get('flr_nm')
+        self.rcept_dt = record.get('rcept_dt')
+        self.rm = record.get('rm')
+        self.detected_at = detected_at or datetime.datetime.now()
+
+    def __repr__(self):
+        return f"<Filing rcept no={self.rcept_no} corp={self.corp_name} report={self.report_nm}>"
+
+
+class FilingWatcher:
+    """
+    공시검색(list.json)의 최신 페이지를 주기적으로 조회해 새로 접수된 공시를 알림
+    (sig_filing 콜백, 스레드 안전 큐(iterFilings), asyncio 비동기 이터레이터(stream) 중 원하는 방식으로 수신)
+
+    조회 간격은 장 운영 시간(평일 09:00 ~ 15:30)에 가장 짧고, 공시 접수 시간(평일 07:00 ~ 19:00), 그 외 시간 순으로 길어지며
+    새 공시가 없으면 각 구간 최대값까지 점차 늘어나고, 새 공시가 발견되면 다시 최소값으로 돌아간다
+    한 번의 조회에서 첫 페이지가 모두 새 공시이면 이미 알림한 공시가 나올 때까지 다음 페이지를 조회한다
+    """
+    interval_market = (3., 15.)  # (최소, 최대) 초
+    interval_business = (10., 60.)
+    interval_idle = (60., 600.)
+    backoff_factor = 1.5
+    max_catchup_pages = 10
+    max_seen_count = 20000
+
+    def __init__(
+            self, opendart, corpCodes: List[str] = None, pbTypes: List[str] = None, pbTypeDetails: List[str] = None,
+            corpClasses: List[str] = None, emitExisting: bool = False, queueSize: int = 0
+    ):
+        """
+        :param opendart: OpenDart 객체
+        :param corpCodes: 공시대상회사의 고유번호 리스트 (None이면 전체)
+        :param pbTypes: 공시유형 리스트 (None이면 전체, define -> dict_pblntf_ty 참고)
+        :param pbTypeDetails: 공시상세유형 리스트 (None이면 전체, 지정 시 pbTypes 대신 사용)
+        :param corpClasses: 법인구분 리스트 (Y = 유가, K = 코스닥, N = 코넥스, E = 기타)
+        :param emitExisting: 시작 시점에 이미 접수되어 있던 당일 공시도 알림할 지 여부
+        :param queueSize: 큐 최대 크기 (0 = 제한 없음, 가득 차면 가장 오래된 공시를 버림)
+        """
+        self._opendart = opendart
+        self._corp_codes = set(corpCodes) if corpCodes else None
+        self._corp_classes = set(corpClasses) if corpClasses else None
+        self._queries = self._makeQueries(corpCodes, pbTypes, pbTypeDetails, corpClasses)
+        self._emit_existing = emitExisting
+        self._queue = queue.Queue(maxsize=queueSize)
+        self._seen = OrderedDict()  # rcept_no -> None (최근 max_seen_count 건)
+        self._primed = False
+        self._interval = None
+        self._thread: Union[threading.Thread, None] = None
+        self._stop = threading.Event()
+        self._poll_count = 0
+        self.sig_filing = Callback(Filing)
+        self.sig_error = Callback(str)
+
+    @staticmethod
+    def _makeQueries(
+            corpCodes: List[str], pbTypes: List[str], pbTypeDetails: List[str], corpClasses: List[str]
+    ) -> List[dict]:
+        # 서버에서 거를 수 있는 조건은 요청 인자로 전달 (여러 값이면 공시유형은 유형별로 요청, 나머지는 수신 후 필터링)
+        base = dict()
+        if corpCodes and len(corpCodes) == 1:
+            base['corp_code'] = corpCodes[0]
+        if corpClasses and len(corpClasses) == 1:
+            base['corp_cls'] = corpClasses[0]
+        if pbTypeDetails:
+            return [dict(base, pblntf_detail_ty=x) for x in dict.fromkeys(pbTypeDetails)]
+        if pbTypes:
+            return [dict(base, pblntf_ty=x) for x in dict.fromkeys(pbTypes)]
+        return [base]
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def pollCount(self) -> int:
+        return self._poll_count
+
+    def isRunning(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.isRunning():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='FilingWatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _getIntervalRange(self, now: datetime.datetime = None) -> tuple:
+        now = now or datetime.datetime.now(timezone_kst)
+        if now.weekday() >= 5:
+            return self.interval_idle
+        minutes = now.hour * 60 + now.minute
+        if 9 * 60 <= minutes < 15 * 60 + 30:
+            return self.interval_market
+        if 7 * 60 <= minutes < 19 * 60:
+            return self.interval_business
+        return self.interval_idle
+
+    def _loop(self):
+        while not self._stop.is_set():
+            lower, upper = self._getIntervalRange()
+            try:
+                count = self.poll()
+                if count > 0 or self._interval is None:
+                    self._interval = lower
+                else:
+                    self._interval = min(upper, max(lower, self._interval * self.backoff_factor))
+            except Exception as e:
+                self._interval = min(upper, max(lower, (self._interval or lower) * self.backoff_factor * 2))
+                self._opendart._onWatcherError(str(e))
+                self.sig_error.emit(str(e))
+            self._stop.wait(self._interval)
+
+    def poll(self) -> int:
+        """
+        최신 공시를 1회 조회해 새 공시를 알림 (start 없이 직접 호출해도 된다)
+
+        :return: 새로 알림한 공시 수
+        """
+        # 모든 쿼리가 성공한 뒤에만 seen 에 반영해야 중간 실패 시 이미 받은 공시가 유실되지 않는다
+        collected = set()
+        fetched = []
+        for query in self._queries:
+            fetched.append((query, self._fetchNewRecords(query, collected)))
+        records = []
+        for query, new_records in fetched:
+            self._opendart._onWatcherRecords(new_records, query)
+            records.extend(new_records)
+        for rcept_no in collected:
+            self._seen[rcept_no] = None
+        while len(self._seen) > self.max_seen_count:
+            self._seen.popitem(last=False)
+        self._poll_count += 1
+        records.sort(key=lambda x: x.get('rcept_no') or '')
+        emit = self._primed or self._emit_existing
+        self._primed = True
+        if not emit:
+            return 0
+        count = 0
+        now = datetime.datetime.now()
+        for record in records:
+            if self._corp_codes is not None and record.get('corp_code') not in self._corp_codes:
+                continue
+            if self._corp_classes is not None and record.get('corp_cls') not in self._corp_classes:
+                continue
+            filing = Filing(record, now)
+            self._put(filing)
+            self.sig_filing.emit(filing)
+            count += 1
+        return count
+
+    def _fetchNewRecords(self, query: dict, collected: set) -> List[dict]:
+        # seen 은 갱신하지 않고, 이번 poll 에서 새로 수집한 접수번호를 collected 에 추가
+        today = datetime.datetime.now(timezone_kst).date()
+        # 자정 직후에도 전날 늦게 접수된 공시를 놓치지 않도록 전날부터 조회
+        params = dict(query, bgn_de=(today - datetime.timedelta(days=1)).strftime('%Y%m%d'),
+                      end_de=today.strftime('%Y%m%d'), page_count=100)
+        result = []
+        for page in range(1, self.max_catchup_pages + 1):
+            params['page_no'] = page
+            json = self._opendart._requestWatcherPage(params)
+            status = json.get('status')
+            if status == '013':  # 조회된 데이타가 없음
+                break
+            if status != '000':
+                raise RuntimeError(f"response exception({status}) - {json.get('message')}")
+            records = json.get('list') or []
+            new_records = [x for x in records if x.get('rcept_no') not in self._seen]
+            for record in new_records:
+                rcept_no = record.get('rcept_no')
+                if rcept_no not in collected:
+                    collected.add(rcept_no)
+                    result.append(record)
+            if len(new_records) < len(records) or page >= (json.get('total_page') or 1) or not self._primed:
+                break
+        return result
+
+    def _put(self, filing: Filing):
+        while True:
+            try:
+                self._queue.put_nowait(filing)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float = None) -> Union[Filing, None]:
+        """
+        큐에서 새 공시 1건을 꺼냄 (timeout 동안 없으면 None)
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def iterFilings(self, timeout: float = 1.) -> Iterator[Filing]:
+        """
+        감시가 중지될 때까지 새 공시를 차례로 반환하는 이터레이터
+        """
+        while self.isRunning() or not self._queue.empty():
+            filing = self.get(timeout)
+            if filing is not None:
+                yield filing
+
+    async def stream(self, timeout: float = 1.) -> AsyncIterator[Filing]:
+        """
+        asyncio용 비동기 이터레이터 (async for filing in watcher.stream(): ...)
+        """
+        loop = asyncio.get_running_loop()
+        while self.isRunning() or not self._queue.empty():
+            filing = await loop.run_in_executor(None, self.get, timeout)
+            if filing is not None:
+                yield filing
@@ -0,0 +1,207 @@
+# Author: Yogyui
+import os
+import numpy as np
+import pandas as pd
+from lxml import etree
+from typing import Dict, Union
+
+
+ns_xbrli = 'http://www.xbrl.org/2003/instance'
+ns_xbrldi = 'http://xbrl.org/2006/xbrldi'
+ns_link = 'http://www.xbrl.org/2003/linkbase'
+ns_xlink = 'http://www.w3.org/1999/xlink'
+ns_xsi = 'http://www.w3.org/2001/XMLSchema-instance'
+role_label = 'http://www.xbrl.org/2003/role/label'
+
+facts_pickle_name = 'facts.pkl'
+
+
+def _qname(ns: str, name: str) -> str:
+    return '{%s}%s' % (ns, name)
+
+
+def _conceptIdFromHref(href: str) -> str:
+    # 'entity00126380_2020-12-31.xsd#ifrs-full_Revenue' -> 'ifrs-full_Revenue'
+    return href.split('#')[-1]
+
+
+def findXbrlPackageFiles(path_dir: str, lang: str = 'ko') -> Dict[str, str]:
+    """
+    XBRL 재무제표 원본 디렉터리에서 인스턴스 문서 및 링크베이스 파일 경로 탐색
+
+    :return: dict (instance, label, presentation)
+    """
+    result = {'instance': None, 'label': None, 'presentation': None}
+    labels = dict()
+    for name in sorted(os.listdir(path_dir)):
+        path = os.path.join(path_dir, name)
+        if name.endswith('.xbrl'):
+            result['instance'] = path
+        elif name.endswith('_pre.xml'):
+            result['presentation'] = path
+        elif '_lab' in name and name.endswith('.xml'):
+            labels[name.split('_lab')[-1][1:-4]] = path  # '_lab-ko.xml' -> 'ko'
+    result['label'] = labels.get(lang, next(iter(labels.values()), None))
+    return result
+
+
+def parseLabelLinkbase(path_file: str) -> Dict[str, str]:
+    """
+    레이블 링크베이스에서 개념(concept) ID -> 표준 레이블 매핑 추출
+    """
+    locators = dict()  # xlink:label -> concept id
+    labels = dict()  # xlink:label -> text
+    arcs = []
+    tag_loc = _qname(ns_link, 'loc')
+    tag_label = _qname(ns_link, 'label')
+    tag_arc = _qname(ns_link, 'labelArc')
+    attr_label = _qname(ns_xlink, 'label')
+    attr_role = _qname(ns_xlink, 'role')
+    for _, element in etree.iterparse(path_file, events=('end',), tag=(tag_loc, tag_label, tag_arc), huge_tree=True):
+        if element.tag == tag_loc:
+            locators[element.get(attr_label)] = _conceptIdFromHref(element.get(_qname(ns_xlink, 'href')))
+        elif element.tag == tag_label:
+            if element.get(attr_role, role_label) == role_label:
+                labels[element.get(attr_label)] = (element.text or '').strip()
+        else:
+            arcs.append((element.get(_qname(ns_xlink, 'from')), element.get(_qname(ns_xlink, 'to'))))
+        element.clear()
+    result = dict()
+    for src, dest in arcs:
+        if src in locators and dest in labels:
+            result.setdefault(locators[src], labels[dest])
+    return result
+
+
+def parsePresentationLinkbase(path_file: str) -> Dict[str, tuple]:
+    """
+    표시 링크베이스에서 개념(concept) ID -> (role, 표시순서) 매핑 추출 (여러 role에 속하면 첫 번째)
+    """
+    result = dict()
+    tag_link = _qname(ns_link, 'presentationLink')
+    attr_label = _qname(ns_xlink, 'label')
+    for _, link in etree.iterparse(path_file, events=('end',), tag=tag_link, huge_tree=True):
+        role = link.get(_qname(ns_xlink, 'role'), '').split('/')[-1]
+        locators = dict()
+        for loc in link.iterfind(_qname(ns_link, 'loc')):
+            locators[loc.get(attr_label)] = _conceptIdFromHref(loc.get(_qname(ns_xlink, 'href')))
+        for arc in link.iterfind(_qname(ns_link, 'presentationArc')):
+            concept = locators.get(arc.get(_qname(ns_xlink, 'to')))
+            if concept is not None and concept not in result:
+                result[concept] = (role, float(arc.get('order', 'nan')))
+        link.clear()
+    return result
+
+
+def parseXbrlInstance(path_file: str) -> pd.DataFrame:
+    """
+    XBRL 인스턴스 문서를 iterparse로 스트리밍하며 fact를 열(column) 단위로 수집
+
+    :return: pandas DataFrame (concept, context, period_type, period_start, period_end, dimensions,
+             unit, decimals, value, value_text)
+    """
+    tag_context = _qname(ns_xbrli, 'context')
+    tag_unit = _qname(ns_xbrli, 'unit')
+    tag_start = _qname(ns_xbrli, 'startDate')
+    tag_end = _qname(ns_xbrli, 'endDate')
+    tag_instant = _qname(ns_xbrli, 'instant')
+    tag_member = _qname(ns_xbrldi, 'explicitMember')
+    tag_measure = _qname(ns_xbrli, 'measure')
+    attr_nil = _qname(ns_xsi, 'nil')
+
+    contexts = dict()  # id -> (period_type, start, end, dimensions)
+    units = dict()  # id -> measure
+    col_concept, col_context, col_unit, col_decimals, col_text = [], [], [], [], []
+    root = None
+    for event, element in etree.iterparse(path_file, events=('start', 'end'), huge_tree=True):
+        if event == 'start':
+            if root is None:
+                root = element
+            continue
+        if element.getparent() is not root:
+            continue
+        if element.tag == tag_context:
+            instant = element.findtext('.//' + tag_instant)
+            dims = ';'.join([f"{x.get('dimension')}={(x.text or '').strip()}" for x in element.iter(tag_member)])
+            if instant is not None:
+                contexts[element.get('id')] = ('instant', None, instant.strip(), dims)
+            else:
+                start = element.findtext('.//' + tag_start)
+                end = element.findtext('.//' + tag_end)
+                contexts[element.get('id')] = (
+                    'duration', start.strip() if start else None, end.strip() if end else None, dims)
+        elif element.tag == tag_unit:
+            measures = [(x.text or '').strip() for x in element.iter(tag_measure)]
+            units[element.get('id')] = '/'.join(measures)
+        elif element.get('contextRef') is not None and isinstance(element.tag, str):
+            qname = etree.QName(element)
+            prefix = element.prefix if element.prefix else qname.namespace
+            col_concept.append(f'{prefix}_{qname.localname}')
+            col_context.append(element.get('contextRef'))
+            col_unit.append(element.get('unitRef'))
+            col_decimals.append(element.get('decimals'))
+            col_text.append(None if element.get(attr_nil) == 'true' else (element.text or '').strip())
+        element.clear()
+        while element.getprevious() is not None:
+            del root[0]
+
+    df = pd.DataFrame({
+        'concept': pd.Categorical(col_concept),
+        'context': pd.Categorical(col_context),
+    })
+    # context/unit 속성은 카테고리 코드로 인덱싱해 한 번에 펼친다
+    ctx_categories = df['context'].cat.categories
+    ctx_table = [contexts.get(x, (None, None, None, '')) for x in ctx_categories]
+    codes = df['context'].cat.codes.to_numpy()
+    unit_ids = pd.Categorical(col_unit)
+    unit_table = np.array([units.get(x, x) for x in unit_ids.categories] + [None], dtype=object)
+    df['unit'] = pd.Categorical(unit_table[unit_ids.codes])
+    for i, name in enumerate(['period_type', 'period_start', 'period_end', 'dimensions']):
+        values = np.array([x[i] for x in ctx_table] + [None], dtype=object)[codes]
+        if name in ['period_start', 'period_end']:
+            df[name] = pd.to_datetime(pd.Series(values), format='%Y-%m-%d', errors='coerce')
+        else:
+            df[name] = pd.Categorical(values)
+    decimals = pd.Series(col_decimals, dtype=object)
+    df['decimals'] = pd.to_numeric(decimals.where(decimals != 'INF'), errors='coerce').astype('Int16')
+    text = pd.Series(col_text, dtype=object)
+    is_numeric = df['unit'].notna().to_numpy()
+    df['value'] = pd.to_numeric(text.where(is_numeric), errors='coerce')
+    df['value_text'] = text.where(~is_numeric)
+    return df
+
+
+def parseXbrlPackage(path_dir: str, lang: str = 'ko') -> pd.DataFrame:
+    """
+    XBRL 재무제표 원본 디렉터리(인스턴스 문서 + 레이블/표시 링크베이스)를 tidy 형태의 fact DataFrame으로 변환
+    """
+    files = findXbrlPackageFiles(path_dir, lang)
+    if files['instance'] is None:
+        raise FileNotFoundError(f"xbrl instance document is missing in {path_dir}")
+    df = parseXbrlInstance(files['instance'])
+    labels = parseLabelLinkbase(files['label']) if files['label'] is not None else dict()
+    df['label'] = pd.Categorical(df['concept'].map(labels).astype(object))
+    if files['presentation'] is not None:
+        pres = parsePresentationLinkbase(files['presentation'])
+        df['pres_role'] = pd.Categorical(df['concept'].map({k: v[0] for k, v in pres.items()}).astype(object))
+        df['pres_order'] = df['concept'].map({k: v[1] for k, v in pres.items()}).astype('float32')
+    return df
+
+
+def loadXbrlPackageFacts(path_dir: str, lang: str = 'ko', reload: bool = False) -> Union[pd.DataFrame, None]:
+    """
+    XBRL 패키지 fact DataFrame 로드 (디렉터리 내 facts.pkl 캐시가 인스턴스 문서보다 최신이면 재사용)
+    """
+    if not os.path.isdir(path_dir):
+        return None
+    path_pkl = os.path.join(path_dir, facts_pickle_name if lang == 'ko' else f'facts_{lang}.pkl')
+    files = findXbrlPackageFiles(path_dir, lang)
+    if not reload and os.path.isfile(path_pkl) and files['instance'] is not None:
+        if os.path.getmtime(path_pkl) >= os.path.getmtime(files['instance']):
+            try:
+                return pd.read_pickle(path_pkl)
+            except Exception:
+                pass
+    df = parseXbrlPackage(path_dir, lang)
+    df.to_pickle(path_pkl)
+    return df